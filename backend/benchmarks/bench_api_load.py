@@ -0,0 +1,198 @@
+"""Concurrent ``/api/news`` load, in-process over ASGI or against multi-worker gunicorn.
+
+Sources point at a local synthetic feed server, so the first request per process runs
+the real refresh path; the cache is then warm and the measured requests exercise the
+read path. Prints JSON with p50/p99 latency, throughput, CPU seconds and memory.
+
+    cd backend && python -m benchmarks.bench_api_load --mode asgi --requests 2000
+    cd backend && python -m benchmarks.bench_api_load --mode gunicorn --workers 2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import httpx
+
+from .metrics import latency_summary, process_tree, self_usage, tree_usage
+from .synthetic_feeds import SyntheticFeedServer
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def app_environment(catalog: Path, log_level: str) -> Dict[str, str]:
+    return {
+        "SOURCES_FILE": str(catalog),
+        "SOURCES_RELOAD_SECONDS": "0",
+        "SCHEDULER_ENABLED": "false",
+        "REFRESH_INTERVAL_MINUTES": "60",
+        "CACHE_BACKEND": "memory",
+        "LOG_LEVEL": log_level,
+    }
+
+
+async def drive(client: httpx.AsyncClient, path: str, requests: int, concurrency: int) -> Tuple[List[float], int, float]:
+    """Issue ``requests`` GETs from ``concurrency`` workers; returns latencies, errors, wall time"""
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def _report(latencies: List[float], errors: int, wall: float) -> dict:
+    return {
+        "latency": latency_summary(latencies),
+        "errors": errors,
+        "wall_seconds": wall,
+        "requests_per_second": len(latencies) / wall if wall else None,
+    }
+
+
+def run_asgi(catalog: Path, path: str, requests: int, concurrency: int, log_level: str) -> dict:
+    os.environ.update(app_environment(catalog, log_level))
+    from src.main import app  # settings are read at import, after the environment is set
+
+    async def main() -> dict:
+        lifespan = app.router.lifespan_context(app)
+        await lifespan.__aenter__()
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                warm_started = time.perf_counter()
+                (await client.get(path)).raise_for_status()
+                warmup = time.perf_counter() - warm_started
+
+                before = self_usage()
+                latencies, errors, wall = await drive(client, path, requests, concurrency)
+                after = self_usage()
+        finally:
+            await lifespan.__aexit__(None, None, None)
+        return {
+            "mode": "asgi",
+            "first_request_seconds": warmup,
+            **_report(latencies, errors, wall),
+            # In-process: includes the load generator's own work
+            "cpu_seconds": after["cpu_seconds"] - before["cpu_seconds"],
+            "peak_rss_mb": after["peak_rss_mb"],
+        }
+
+    return asyncio.run(main())
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_gunicorn(
+    catalog: Path, path: str, requests: int, concurrency: int, workers: int, log_level: str
+) -> dict:
+    port = _free_port()
+    env = {**os.environ, **app_environment(catalog, log_level)}
+    command = [
+        sys.executable, "-m", "gunicorn", "src.main:app",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "--workers", str(workers),
+        "--bind", f"127.0.0.1:{port}",
+        "--log-level", "warning",
+    ]
+    server = subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+
+    async def main() -> dict:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+            booted = time.perf_counter()
+            while True:
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if server.poll() is not None or time.perf_counter() - booted > 60:
+                    raise RuntimeError("gunicorn did not become ready")
+                await asyncio.sleep(0.1)
+            ready = time.perf_counter() - booted
+
+            # Every worker keeps its own in-memory cache; warm them all before measuring
+            await drive(client, path, workers * 4, workers * 2)
+
+            pids = process_tree(server.pid)
+            before = tree_usage(pids)
+            latencies, errors, wall = await drive(client, path, requests, concurrency)
+            after = tree_usage(pids)
+        cpu = None
+        if before["cpu_seconds"] is not None:
+            cpu = after["cpu_seconds"] - before["cpu_seconds"]
+        return {
+            "mode": "gunicorn",
+            "workers": workers,
+            "ready_seconds": ready,
+            **_report(latencies, errors, wall),
+            "server_cpu_seconds": cpu,
+            "server_rss_mb": after["rss_mb"],
+        }
+
+    try:
+        return asyncio.run(main())
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("asgi", "gunicorn"), default="asgi")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--feeds", type=int, default=100)
+    parser.add_argument("--entries", type=int, default=20)
+    parser.add_argument("--size", type=int, default=0, help="approximate feed body bytes")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--path", default="/api/news")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    with SyntheticFeedServer(
+        entries=args.entries, size=args.size, latency=args.latency, error_rate=args.error_rate
+    ) as server, tempfile.TemporaryDirectory() as tmp:
+        catalog = server.write_catalog(Path(tmp) / "sources.yaml", args.feeds)
+        if args.mode == "asgi":
+            result = run_asgi(catalog, args.path, args.requests, args.concurrency, args.log_level)
+        else:
+            result = run_gunicorn(
+                catalog, args.path, args.requests, args.concurrency, args.workers, args.log_level
+            )
+
+    print(json.dumps({"benchmark": "api_load", "feeds": args.feeds, **result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Decode cost of the Redis cache payload: full validation vs the trusted load path.
+
+Builds a payload the way RedisNewsCache stores it and times turning it back into
+models, once with ``NewsSource.model_validate`` (the old read path) and once with
+``load_sources`` (``NewsSource.from_trusted``). Prints JSON results.
+
+    cd backend && python -m benchmarks.bench_cache_decode --headlines 10000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict
+
+from src.cache.redis_cache import dump_sources, load_sources
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+
+from .synthetic_feeds import headline_title
+
+PER_SOURCE = 50
+
+
+def build_sources(total_headlines: int) -> Dict[str, NewsSource]:
+    now = datetime.now(timezone.utc)
+    sources = {}
+    for feed_id in range((total_headlines + PER_SOURCE - 1) // PER_SOURCE):
+        name = f"Feed {feed_id}"
+        count = min(PER_SOURCE, total_headlines - feed_id * PER_SOURCE)
+        headlines = [
+            NewsHeadline(
+                title=headline_title(feed_id, i),
+                link=f"https://feeds.example.com/{feed_id}/{i}",
+                published_at=now - timedelta(minutes=i),
+                source=name,
+                cluster_id=f"{feed_id * PER_SOURCE + i:016x}",
+            )
+            for i in range(count)
+        ]
+        sources[name] = NewsSource(
+            name=name,
+            rss_url=f"https://feeds.example.com/{feed_id}.xml",
+            fallback_url="https://feeds.example.com",
+            last_updated=now,
+            headlines=headlines,
+        )
+    return sources
+
+
+def _validated(payload: str) -> Dict[str, NewsSource]:
+    return {name: NewsSource.model_validate(model) for name, model in json.loads(payload).items()}
+
+
+def _time(decode: Callable[[str], Dict[str, NewsSource]], payload: str, repeat: int) -> dict:
+    decode(payload)  # warm up
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(payload)
+        samples.append(time.perf_counter() - started)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "min_ms": round(min(samples) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--headlines", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    payload = dump_sources(build_sources(args.headlines))
+    results = {
+        "headlines": args.headlines,
+        "payload_bytes": len(payload.encode()),
+        "json_loads": _time(json.loads, payload, args.repeat),
+        "model_validate": _time(_validated, payload, args.repeat),
+        "trusted": _time(load_sources, payload, args.repeat),
+    }
+    results["speedup"] = round(
+        results["model_validate"]["median_ms"] / results["trusted"]["median_ms"], 2
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
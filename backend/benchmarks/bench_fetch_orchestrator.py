@@ -0,0 +1,100 @@
+"""Refresh-cycle benchmark over many locally served synthetic feeds.
+
+Runs the real NewsService refresh path (RSSService download + feedparser + validation
++ cache writes) against a local feed server at several concurrency levels and prints
+JSON results: total cycle time, the time until half of the sources were in the cache,
+CPU seconds spent by this process and its peak RSS.
+
+    cd backend && python -m benchmarks.bench_fetch_orchestrator --feeds 1000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from src.cache import InMemoryNewsCache
+from src.services.fetch_orchestrator import FetchOrchestrator
+from src.services.news_service import NewsService
+from src.services.rss_service import RSSService
+from src.services.source_registry import SourceRegistry
+
+from .metrics import self_usage
+from .synthetic_feeds import SyntheticFeedServer
+
+
+class _TimedCache(InMemoryNewsCache):
+    """Records when each source lands in the cache."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.arrivals = []
+
+    def update_source(self, source):
+        super().update_source(source)
+        self.arrivals.append(time.perf_counter())
+
+
+def run_cycle(catalog: Path, concurrency: int, per_host_limit: int) -> dict:
+    cache = _TimedCache()
+    service = NewsService(
+        cache=cache,
+        rss_service=RSSService(pool_maxsize=max(concurrency, 10)),
+        source_registry=SourceRegistry(catalog),
+        orchestrator=FetchOrchestrator(max_concurrency=concurrency, per_host_limit=per_host_limit),
+    )
+    before = self_usage()
+    started = time.perf_counter()
+    service._refresh_all_sources()
+    elapsed = time.perf_counter() - started
+    after = self_usage()
+
+    arrivals = sorted(t - started for t in cache.arrivals)
+    half = arrivals[len(arrivals) // 2] if arrivals else None
+    return {
+        "concurrency": concurrency,
+        "per_host_limit": per_host_limit,
+        "sources": cache.total_sources_count,
+        "active_sources": cache.active_sources_count,
+        "cycle_seconds": round(elapsed, 3),
+        "half_cached_seconds": round(half, 3) if half is not None else None,
+        "cpu_seconds": round(after["cpu_seconds"] - before["cpu_seconds"], 3),
+        "peak_rss_mb": after["peak_rss_mb"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feeds", type=int, default=1000)
+    parser.add_argument("--entries", type=int, default=20)
+    parser.add_argument("--size", type=int, default=0, help="approximate feed body bytes")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--slow-fraction", type=float, default=0.01)
+    parser.add_argument("--slow-latency", type=float, default=2.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 64])
+    parser.add_argument("--per-host-limit", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    with SyntheticFeedServer(
+        entries=args.entries,
+        size=args.size,
+        latency=args.latency,
+        slow_fraction=args.slow_fraction,
+        slow_latency=args.slow_latency,
+        error_rate=args.error_rate,
+    ) as server, tempfile.TemporaryDirectory() as tmp:
+        catalog = server.write_catalog(Path(tmp) / "sources.yaml", args.feeds)
+
+        results = [run_cycle(catalog, c, args.per_host_limit) for c in args.concurrency]
+
+    print(json.dumps({"benchmark": "fetch_orchestrator", "feeds": args.feeds, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
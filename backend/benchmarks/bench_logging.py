@@ -0,0 +1,126 @@
+"""Per-request logging cost on the request path, before and after the queued logger.
+
+``legacy`` reproduces the old middleware: two f-string INFO lines, one of them with
+``str(request.url)``, written synchronously through a basicConfig-style stream
+handler. The other scenarios use ``src.core.log_config``: one structured access record
+put on a queue, with the formatting and writing left to the listener thread, at
+several sampling rates. Output goes to a real temporary file so write costs count.
+
+Reports wall and calling-thread CPU microseconds per request. ``drain_ms`` is how long
+the listener then needed to write everything; that work moved off the request path
+rather than disappearing.
+
+    cd backend && python -m benchmarks.bench_logging --requests 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from typing import Callable, Dict
+
+from starlette.requests import Request
+
+from src.core.log_config import RequestLogSampler, configure_logging, log_request, shutdown_logging
+
+SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "scheme": "http",
+    "server": ("news.example.com", 80),
+    "path": "/api/news",
+    "raw_path": b"/api/news",
+    "query_string": b"fields=title,link&limit_per_source=5",
+    "headers": [(b"host", b"news.example.com")],
+}
+
+
+def _reset_root() -> logging.Logger:
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(logging.INFO)
+    return root
+
+
+def legacy_request(logger: logging.Logger) -> Callable[[], None]:
+    def handle() -> None:
+        request = Request(SCOPE)
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url}")
+        process_time = time.time() - start_time
+        logger.info(f"Response: {200} - {process_time:.4f}s")
+
+    return handle
+
+
+def queued_request(logger: logging.Logger, sampler: RequestLogSampler) -> Callable[[], None]:
+    def handle() -> None:
+        request = Request(SCOPE)
+        started = time.perf_counter()
+        path = request.scope["path"]
+        if logger.isEnabledFor(logging.INFO) and sampler.should_log(path, 200):
+            log_request(logger, request.method, path, 200, started)
+
+    return handle
+
+
+def measure(handle: Callable[[], None], requests: int) -> Dict[str, float]:
+    """Wall time and the calling thread's own CPU time per request, in microseconds.
+
+    On a machine with few cores the listener competes with the caller for the GIL and
+    shows up in wall time; thread CPU time isolates what the request thread itself paid.
+    """
+    wall, cpu = time.perf_counter(), time.thread_time()
+    for _ in range(requests):
+        handle()
+    return {
+        "per_request_us": (time.perf_counter() - wall) / requests * 1e6,
+        "request_thread_cpu_us": (time.thread_time() - cpu) / requests * 1e6,
+    }
+
+
+def run(requests: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    logger = logging.getLogger("src.access")
+
+    with tempfile.TemporaryFile("w") as sink:
+        # Baseline: only building the request object, no logging
+        results["no_logging"] = measure(lambda: Request(SCOPE).url, requests)
+
+        root = _reset_root()
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+        root.addHandler(handler)
+        results["legacy"] = {**measure(legacy_request(logger), requests), "drain_ms": 0.0}
+        root.removeHandler(handler)
+
+        for label, fmt, rate in (
+            ("queued_json", "json", 1.0),
+            ("queued_text", logging.BASIC_FORMAT, 1.0),
+            ("queued_json_sampled_10pct", "json", 0.1),
+            ("queued_json_sampled_off", "json", 0.0),
+        ):
+            _reset_root()
+            configure_logging("INFO", fmt, stream=sink)
+            sampler = RequestLogSampler({"*": rate})
+            timing = measure(queued_request(logger, sampler), requests)
+            drain_started = time.perf_counter()
+            shutdown_logging()
+            results[label] = {**timing, "drain_ms": (time.perf_counter() - drain_started) * 1000}
+
+    _reset_root()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps({"benchmark": "logging", "requests": args.requests, "results": run(args.requests)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""Per-stage micro-benchmarks of feed parsing over the fixture corpus in ``corpus/``.
+
+The corpus has one feed in each publisher format we ingest (Google News search RSS,
+Dow Jones/MarketWatch, FT, SCMP with a +0800 offset) and a listing page for the
+scraping fallback. Publication dates are shifted at load time so the newest entry is
+"now" and the 30-day validators accept them. ``--scale N`` repeats every item N times
+with distinct titles and links to stand in for larger feeds.
+
+Each feed is timed stage by stage, matching ``RSSService.parse_feed`` and the read path:
+
+    parse      feedparser over the raw bytes
+    dates      RSSService._parse_published_date per entry
+    validate   NewsHeadline construction per entry
+    sort_trim  freshness sort and max_stories cut
+    tag        EntityService ticker/entity tagging per title
+    serialize  NewsService._format_response and the Redis cache codec
+    total      RSSService.parse_feed end to end
+
+The page is timed as ``soup`` (BeautifulSoup parse), ``select`` (the
+ScrapingService selector loop) and ``total`` (``ScrapingService.parse_page``). A
+separate pass under tracemalloc records peak and retained allocations per stage.
+
+    cd backend && python -m benchmarks.bench_parsers
+    cd backend && python -m benchmarks.bench_parsers --scale 10 --top 5
+    cd backend && python -m benchmarks.bench_parsers --extra-entities 50000
+
+``--extra-entities N`` pads the shipped entity dictionary with N synthetic names; the
+``tag`` stage should not slow down as the dictionary grows.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import re
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.cache import InMemoryNewsCache
+from src.cache.redis_cache import dump_sources
+from src.core.bootstrap import DEFAULT_ENTITIES_FILE
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+from src.services.entity_service import EntityService
+from src.services.news_service import NewsService
+from src.services.rss_service import RSSService
+from src.services.scraping_service import ScrapingService
+from src.services.source_registry import SourceRegistry
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+
+# Fixture file -> source it was recorded from
+FEEDS = {
+    "google_news.xml": "Reuters",
+    "dow_jones.xml": "MarketWatch",
+    "financial_times.xml": "Financial Times",
+    "scmp.xml": "South China Morning Post",
+}
+PAGES = {"listing_page.html": "DealStreetAsia"}
+
+_PUB_DATE = re.compile(rb"<pubDate>([^<]+)</pubDate>")
+_ITEM = re.compile(rb"<item>.*?</item>", re.S)
+
+
+def rebase_dates(content: bytes, now: datetime) -> bytes:
+    """Shift every ``pubDate`` by the same amount so the newest one is ``now``"""
+    dates = [parsedate_to_datetime(m.decode()) for m in _PUB_DATE.findall(content)]
+    if not dates:
+        return content
+    shift = now - max(dates)
+
+    def replace(match: re.Match) -> bytes:
+        raw = match.group(1).decode()
+        shifted = parsedate_to_datetime(raw) + shift
+        text = format_datetime(shifted, usegmt=raw.endswith("GMT"))
+        return f"<pubDate>{text}</pubDate>".encode()
+
+    return _PUB_DATE.sub(replace, content)
+
+
+def scale_items(content: bytes, factor: int) -> bytes:
+    """Repeat every ``<item>`` ``factor`` times, suffixing titles and links"""
+    if factor <= 1:
+        return content
+    items = _ITEM.findall(content)
+    if not items:
+        return content
+    copies = []
+    for copy in range(1, factor):
+        for item in items:
+            item = item.replace(b"</title>", f" ({copy})</title>".encode(), 1)
+            item = item.replace(b"</link>", f"#{copy}</link>".encode(), 1)
+            copies.append(item)
+    end = content.rindex(items[-1]) + len(items[-1])
+    return content[:end] + b"".join(copies) + content[end:]
+
+
+def load_corpus(scale: int = 1) -> Dict[str, bytes]:
+    now = datetime.now(timezone.utc)
+    corpus = {}
+    for name in FEEDS:
+        corpus[name] = scale_items(rebase_dates((CORPUS_DIR / name).read_bytes(), now), scale)
+    for name in PAGES:
+        corpus[name] = (CORPUS_DIR / name).read_bytes()
+    return corpus
+
+
+def _source(name: str, url: str, max_stories: int) -> NewsSource:
+    return NewsSource(name=name, rss_url=url, fallback_url=url, max_stories=max_stories)
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return {"best_us": min(samples) * 1e6, "median_us": statistics.median(samples) * 1e6}
+
+
+def trace_call(fn: Callable[[], Any], top: int) -> Dict[str, Any]:
+    """Peak and retained bytes allocated by one call, plus its top allocation sites"""
+    tracemalloc.start(1 if not top else 5)
+    try:
+        before = tracemalloc.take_snapshot() if top else None
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+        report: Dict[str, Any] = {"peak_kb": (peak - base) / 1024, "retained_kb": (current - base) / 1024}
+        if top:
+            own = tracemalloc.Filter(False, tracemalloc.__file__)
+            after = tracemalloc.take_snapshot().filter_traces([own])
+            diff = after.compare_to(before.filter_traces([own]), "lineno")
+            report["top_sites"] = [
+                {"site": str(stat.traceback[0]), "kb": stat.size_diff / 1024, "blocks": stat.count_diff}
+                for stat in diff[:top]
+            ]
+        del result
+    finally:
+        tracemalloc.stop()
+    return report
+
+
+Stages = Dict[str, Tuple[Callable[[], Any], int]]
+
+
+def build_entity_service(extra: int) -> EntityService:
+    """The shipped dictionary plus ``extra`` synthetic two-word company names"""
+    import yaml
+
+    data = yaml.safe_load(DEFAULT_ENTITIES_FILE.read_bytes()) or {}
+    tickers = dict(data.get("tickers") or {})
+    for i in range(extra):
+        tickers[f"X{i:05d}"] = [f"Company{i} Holdings"]
+    return EntityService(tickers, data.get("entities"))
+
+
+def feed_stages(
+    content: bytes, source: NewsSource, rss: RSSService, entity_service: EntityService
+) -> Stages:
+    """Stage callables for one feed, each fed the previous stage's precomputed output,
+    with the number of items the stage handles"""
+    import feedparser
+
+    feed = feedparser.parse(content)
+    entries = feed.entries
+    dates = [rss._parse_published_date(entry) for entry in entries]
+
+    def validate() -> List[NewsHeadline]:
+        return [
+            NewsHeadline(
+                title=entry.get("title", "No title"),
+                link=entry.get("link", ""),
+                published_at=published_at,
+                source=source.name,
+            )
+            for entry, published_at in zip(entries, dates)
+        ]
+
+    headlines = validate()
+
+    def sort_trim() -> List[NewsHeadline]:
+        ordered = sorted(headlines, key=lambda x: x.published_at, reverse=True)
+        return ordered[: source.max_stories]
+
+    cached = source.model_copy(update={"headlines": sort_trim(), "last_updated": datetime.now(timezone.utc)})
+    cache = InMemoryNewsCache()
+    cache.update_source(cached)
+    service = NewsService(cache=cache, source_registry=SourceRegistry(None))
+
+    def serialize() -> Tuple[Dict[str, Any], str]:
+        return service._format_response(), dump_sources({source.name: cached})
+
+    n = len(entries)
+    return {
+        "parse": (lambda: feedparser.parse(content), n),
+        "dates": (lambda: [rss._parse_published_date(entry) for entry in entries], n),
+        "validate": (validate, n),
+        "sort_trim": (sort_trim, n),
+        "tag": (lambda: [entity_service.tag_title(headline.title) for headline in headlines], n),
+        "serialize": (serialize, len(cached.headlines)),
+        "total": (lambda: rss.parse_feed(content, source), n),
+    }
+
+
+def page_stages(content: bytes, source: NewsSource, scraper: ScrapingService) -> Stages:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "html.parser")
+    n = len(scraper._extract_headlines(soup, source))
+    return {
+        "soup": (lambda: BeautifulSoup(content, "html.parser"), n),
+        "select": (lambda: scraper._extract_headlines(soup, source), n),
+        "total": (lambda: scraper.parse_page(content, source), n),
+    }
+
+
+def run(scale: int, repeat: int, max_stories: int, top: int, extra_entities: int = 0) -> Dict[str, Any]:
+    corpus = load_corpus(scale)
+    rss, scraper = RSSService(), ScrapingService()
+    entity_service = build_entity_service(extra_entities)
+    results: Dict[str, Any] = {}
+    for name, content in corpus.items():
+        url = f"https://example.com/{name}"
+        if name in FEEDS:
+            stages = feed_stages(content, _source(FEEDS[name], url, max_stories), rss, entity_service)
+        else:
+            stages = page_stages(content, _source(PAGES[name], url, max_stories), scraper)
+        report: Dict[str, Any] = {"bytes": len(content), "entries": stages["total"][1], "stages": {}}
+        for stage, (fn, count) in stages.items():
+            timing = time_call(fn, repeat)
+            timing["per_entry_us"] = timing["best_us"] / count if count else None
+            report["stages"][stage] = {**timing, **trace_call(fn, top)}
+        results[name.rsplit(".", 1)[0]] = report
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="repeat each feed's items N times")
+    parser.add_argument("--repeat", type=int, default=50, help="timed runs per stage")
+    parser.add_argument("--max-stories", type=int, default=10)
+    parser.add_argument("--top", type=int, default=0, help="allocation sites to list per stage")
+    parser.add_argument("--extra-entities", type=int, default=0, help="synthetic names added to the entity dictionary")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    results = run(args.scale, args.repeat, args.max_stories, args.top, args.extra_entities)
+    print(json.dumps({"benchmark": "parsers", "scale": args.scale, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Refresh-cycle benchmark over recorded upstream responses.
+
+Record the real feeds once on a machine with network access, then replay them
+anywhere: every cycle runs the real NewsService refresh path (RSSService download,
+feedparser, validation, scraping fallback, cache writes) with the responses served
+from the cassette directory. ``--latency-scale 1`` replays the recorded download
+times, and the fault rates inject timeouts, 5xx and truncated bodies. Prints JSON
+results per cycle: cycle time, CPU seconds, peak RSS and what ended up in the cache.
+
+    cd backend && python -m benchmarks.bench_replay --record data/cassettes
+    cd backend && python -m benchmarks.bench_replay data/cassettes --cycles 5 --error-rate 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+
+from src.cache import InMemoryNewsCache
+from src.core.bootstrap import DEFAULT_SOURCES_FILE
+from src.services.http_transport import HttpTransport
+from src.services.news_service import NewsService
+from src.services.rss_service import RSSService
+from src.services.scraping_service import ScrapingService
+from src.services.source_registry import SourceRegistry
+
+from .metrics import self_usage
+
+
+def run_cycle(transport: HttpTransport, catalog: str) -> dict:
+    cache = InMemoryNewsCache()
+    service = NewsService(
+        cache=cache,
+        rss_service=RSSService(transport=transport),
+        scraping_service=ScrapingService(transport=transport),
+        source_registry=SourceRegistry(catalog),
+    )
+    before = self_usage()
+    started = time.perf_counter()
+    service._refresh_all_sources()
+    elapsed = time.perf_counter() - started
+    after = self_usage()
+    return {
+        "sources": cache.total_sources_count,
+        "active_sources": cache.active_sources_count,
+        "headlines": sum(len(source.headlines) for source in cache.get_all_sources().values()),
+        "cycle_seconds": round(elapsed, 3),
+        "cpu_seconds": round(after["cpu_seconds"] - before["cpu_seconds"], 3),
+        "peak_rss_mb": after["peak_rss_mb"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassettes", help="cassette directory")
+    parser.add_argument("--record", action="store_true", help="fetch live once and record into the directory")
+    parser.add_argument("--catalog", default=str(DEFAULT_SOURCES_FILE))
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--latency-scale", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    faults = args.timeout_rate or args.error_rate or args.truncate_rate
+    mode = "record" if args.record else "fault" if faults else "replay"
+    transport = HttpTransport(
+        mode,
+        args.cassettes,
+        latency_scale=args.latency_scale,
+        timeout_rate=args.timeout_rate,
+        error_rate=args.error_rate,
+        truncate_rate=args.truncate_rate,
+        seed=args.seed,
+    )
+    # Fresh services per cycle, so fault draws and sessions start over each time
+    results = [run_cycle(transport, args.catalog) for _ in range(1 if args.record else args.cycles)]
+
+    print(json.dumps({"benchmark": "replay", "mode": mode, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
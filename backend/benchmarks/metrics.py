@@ -0,0 +1,93 @@
+"""Latency percentiles and process CPU/memory sampling for benchmark reports.
+
+Per-process numbers come from ``/proc`` and are only available on Linux; elsewhere they
+are reported as ``None``.
+"""
+from __future__ import annotations
+
+import math
+import os
+import resource
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+_PROC = Path("/proc")
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def percentile(samples: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of ``samples``"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(seconds: Sequence[float]) -> Dict[str, Optional[float]]:
+    return {
+        "count": len(seconds),
+        "p50_ms": _ms(percentile(seconds, 50)),
+        "p90_ms": _ms(percentile(seconds, 90)),
+        "p99_ms": _ms(percentile(seconds, 99)),
+        "max_ms": _ms(max(seconds) if seconds else None),
+    }
+
+
+def self_usage() -> Dict[str, float]:
+    """CPU seconds and peak RSS of this process so far"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {
+        "cpu_seconds": usage.ru_utime + usage.ru_stime,
+        "peak_rss_mb": usage.ru_maxrss / 1024,  # KiB on Linux
+    }
+
+
+def process_tree(root_pid: int) -> List[int]:
+    """``root_pid`` and all of its descendants"""
+    if not _PROC.exists():
+        return [root_pid]
+    children: Dict[int, List[int]] = {}
+    for entry in _PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            ppid = int(_stat_fields(int(entry.name))[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry.name))
+    tree, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        tree.append(pid)
+        stack.extend(children.get(pid, []))
+    return tree
+
+
+def tree_usage(pids: Iterable[int]) -> Dict[str, Optional[float]]:
+    """Summed CPU seconds and current RSS of ``pids``"""
+    if not _PROC.exists():
+        return {"cpu_seconds": None, "rss_mb": None}
+    cpu = 0.0
+    rss_kb = 0
+    for pid in pids:
+        try:
+            fields = _stat_fields(pid)
+            # utime and stime are fields 14 and 15 of /proc/<pid>/stat
+            cpu += (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+            for line in (_PROC / str(pid) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    rss_kb += int(line.split()[1])
+        except (OSError, IndexError, ValueError):
+            continue  # process exited between listing and reading
+    return {"cpu_seconds": cpu, "rss_mb": rss_kb / 1024}
+
+
+def _stat_fields(pid: int) -> List[str]:
+    # The command name may contain spaces; everything after its closing paren is fixed
+    stat = (_PROC / str(pid) / "stat").read_text()
+    return stat[stat.rindex(")") + 2:].split()
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
@@ -0,0 +1,145 @@
+"""Run the parser, refresh and API load benchmarks and write one machine-readable report.
+
+Each scenario runs in a fresh interpreter so CPU and peak memory are not shared between
+them. The report is JSON with sorted keys, so two runs diff cleanly; ``--baseline``
+prints the relative change of every numeric metric against an earlier report.
+
+    cd backend && python -m benchmarks.run_suite --output bench.json
+    cd backend && python -m benchmarks.run_suite --profile quick --baseline bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+PROFILES: Dict[str, Dict[str, int]] = {
+    "quick": {"feeds": 50, "requests": 300, "concurrency": 16, "repeat": 10},
+    "standard": {"feeds": 200, "requests": 2000, "concurrency": 32, "repeat": 50},
+}
+
+SCENARIOS = ("parsers", "refresh", "asgi", "gunicorn")
+
+
+def scenario_commands(args: argparse.Namespace) -> Dict[str, List[str]]:
+    profile = PROFILES[args.profile]
+    server = ["--size", str(args.size), "--error-rate", str(args.error_rate)]
+    load = [
+        "--feeds", str(profile["feeds"]),
+        "--requests", str(profile["requests"]),
+        "--concurrency", str(profile["concurrency"]),
+        *server,
+    ]
+    return {
+        "parsers": ["benchmarks.bench_parsers", "--repeat", str(profile["repeat"])],
+        "refresh": [
+            "benchmarks.bench_fetch_orchestrator",
+            "--feeds", str(profile["feeds"]),
+            "--concurrency", str(profile["concurrency"]),
+            *server,
+        ],
+        "asgi": ["benchmarks.bench_api_load", "--mode", "asgi", *load],
+        "gunicorn": [
+            "benchmarks.bench_api_load", "--mode", "gunicorn", "--workers", str(args.workers), *load,
+        ],
+    }
+
+
+def run_scenario(module_args: List[str]) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-m", *module_args],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1:] or ["failed"]}
+    return json.loads(result.stdout)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(value, prefix: str = "") -> Dict[str, float]:
+    """Numeric leaves of a report keyed by dotted path"""
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return {prefix: value}
+        return {}
+    flat: Dict[str, float] = {}
+    for key, item in items:
+        flat.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+
+
+def compare(baseline: dict, current: dict) -> List[str]:
+    before = flatten(baseline.get("results", {}))
+    after = flatten(current.get("results", {}))
+    lines = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+        lines.append(f"{key:<55} {old:>12.3f} {new:>12.3f} {change:>9}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="standard")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--size", type=int, default=0, help="approximate feed body bytes")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, help="write the report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="earlier report to compare against")
+    args = parser.parse_args()
+
+    commands = scenario_commands(args)
+    report = {
+        "meta": {
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "profile": args.profile,
+            "parameters": {**PROFILES[args.profile], "workers": args.workers, "size": args.size,
+                           "error_rate": args.error_rate},
+        },
+        "results": {name: run_scenario(commands[name]) for name in args.scenarios},
+    }
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        print("\n".join(compare(json.loads(args.baseline.read_text()), report)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""Local asyncio HTTP server that serves synthetic RSS feeds and HTML pages for benchmarks.
+
+``/feeds/<n>.xml`` returns an RSS feed with ``entries`` items and ``/pages/<n>.html`` a
+page the scraping fallback can parse. Responses are padded to roughly ``size`` bytes,
+delayed by ``latency`` seconds (``slow_latency`` for a deterministic ``slow_fraction`` of
+feeds), fail with a 500 at ``error_rate`` and, with ``not_modified`` on, answer
+conditional requests carrying the current ETag with a 304.
+
+The server runs in its own process so its work never competes with the process being
+measured for the GIL.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import yaml
+
+_SUBJECTS = "Fed ECB Treasury Nvidia Apple Oil Gold Yen Bitcoin Tesla Alibaba HSBC Copper Nikkei".split()
+_VERBS = "jumps slides rallies tumbles steadies surges dips rebounds stalls climbs".split()
+_CONTEXTS = [
+    "after earnings beat", "as inflation cools", "on rate cut bets", "amid trade tensions",
+    "ahead of jobs data", "as investors rotate", "on supply worries", "after guidance cut",
+    "as volumes thin", "on buyback plan", "after regulator probe", "on China demand",
+]
+
+_REASONS = {200: "OK", 304: "Not Modified", 404: "Not Found", 500: "Internal Server Error"}
+
+
+def headline_title(feed_id: int, index: int) -> str:
+    """Deterministic, varied headline text so duplicate detection sees realistic input"""
+    n = feed_id * 7919 + index * 104729
+    return (
+        f"{_SUBJECTS[n % len(_SUBJECTS)]} {_VERBS[(n // 7) % len(_VERBS)]} "
+        f"{n % 9 + 1}% {_CONTEXTS[(n // 13) % len(_CONTEXTS)]} (report {feed_id}-{index})"
+    )
+
+
+def _padding(size: int, used: int) -> str:
+    return "x" * max(0, size - used)
+
+
+def build_rss(feed_id: int, entries: int, size: int = 0) -> bytes:
+    now = datetime.now(timezone.utc)
+    items = []
+    for i in range(entries):
+        published = format_datetime(now - timedelta(minutes=7 * i + feed_id % 60))
+        items.append(
+            "<item>"
+            f"<title>{headline_title(feed_id, i)}</title>"
+            f"<link>https://feeds.example.com/{feed_id}/articles/{i}</link>"
+            f"<pubDate>{published}</pubDate>"
+            "</item>"
+        )
+    body = (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Synthetic feed {feed_id}</title><link>https://feeds.example.com/{feed_id}</link>"
+        + "".join(items)
+    )
+    # Bulk comparable to real feeds' descriptions and namespaces
+    tail = "</channel></rss>"
+    description = f"<description>{_padding(size, len(body) + len(tail) + 27)}</description>"
+    return (body + (description if size else "") + tail).encode()
+
+
+def build_html(feed_id: int, entries: int, size: int = 0) -> bytes:
+    links = "".join(
+        f'<h3><a href="https://feeds.example.com/{feed_id}/articles/{i}">'
+        f"{headline_title(feed_id, i)}</a></h3>"
+        for i in range(entries)
+    )
+    body = f"<html><head><title>Synthetic page {feed_id}</title></head><body>{links}"
+    tail = "</body></html>"
+    return (body + f"<!-- {_padding(size, len(body) + len(tail) + 9)} -->" + tail).encode()
+
+
+@dataclass
+class FeedServerConfig:
+    entries: int = 20
+    size: int = 0
+    latency: float = 0.02
+    slow_fraction: float = 0.0
+    slow_latency: float = 1.0
+    error_rate: float = 0.0
+    not_modified: bool = True
+    seed: int = 1
+
+
+class _FeedHandler:
+    def __init__(self, config: FeedServerConfig) -> None:
+        self.config = config
+        self._bodies: Dict[Tuple[str, int], bytes] = {}
+        self._random = random.Random(config.seed)
+
+    def latency_for(self, feed_id: int) -> float:
+        return latency_for(self.config, feed_id)
+
+    async def respond(self, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        kind, _, name = path.lstrip("/").partition("/")
+        try:
+            feed_id = int(name.split(".", 1)[0])
+        except ValueError:
+            return 404, {}, b""
+        if kind not in ("feeds", "pages"):
+            return 404, {}, b""
+
+        await asyncio.sleep(self.latency_for(feed_id))
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            return 500, {}, b"upstream error"
+
+        body = self._bodies.get((kind, feed_id))
+        if body is None:
+            build = build_rss if kind == "feeds" else build_html
+            body = build(feed_id, self.config.entries, self.config.size)
+            self._bodies[(kind, feed_id)] = body
+        etag = f'"{kind}-{feed_id}-{len(body)}"'
+        if self.config.not_modified and headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, b""
+        content_type = "application/rss+xml" if kind == "feeds" else "text/html; charset=utf-8"
+        return 200, {"Content-Type": content_type, "ETag": etag}, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                path = parts[1] if len(parts) > 1 else "/"
+                status, extra, body = await self.respond(path, headers)
+                head = [f"HTTP/1.1 {status} {_REASONS[status]}", f"Content-Length: {len(body)}"]
+                head += [f"{key}: {value}" for key, value in extra.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def latency_for(config: FeedServerConfig, feed_id: int) -> float:
+    slow_every = int(1 / config.slow_fraction) if config.slow_fraction else 0
+    return config.slow_latency if slow_every and feed_id % slow_every == 0 else config.latency
+
+
+def _serve(config: dict, host: str, port: int, ready) -> None:
+    async def main() -> None:
+        handler = _FeedHandler(FeedServerConfig(**config))
+        server = await asyncio.start_server(handler.handle, host, port, backlog=4096)
+        ready.send(server.sockets[0].getsockname()[1])
+        ready.close()
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class SyntheticFeedServer:
+    """Context manager running the feed server in a child process."""
+
+    def __init__(
+        self,
+        entries: int = 20,
+        latency: float = 0.02,
+        slow_fraction: float = 0.0,
+        slow_latency: float = 1.0,
+        size: int = 0,
+        error_rate: float = 0.0,
+        not_modified: bool = True,
+        seed: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.config = FeedServerConfig(
+            entries=entries,
+            size=size,
+            latency=latency,
+            slow_fraction=slow_fraction,
+            slow_latency=slow_latency,
+            error_rate=error_rate,
+            not_modified=not_modified,
+            seed=seed,
+        )
+        self.host = host
+        self.port = port
+        self._process: Optional[multiprocessing.Process] = None
+
+    def latency_for(self, feed_id: int) -> float:
+        return latency_for(self.config, feed_id)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def feed_url(self, feed_id: int) -> str:
+        return f"{self.base_url}/feeds/{feed_id}.xml"
+
+    def page_url(self, feed_id: int) -> str:
+        return f"{self.base_url}/pages/{feed_id}.html"
+
+    def __enter__(self) -> "SyntheticFeedServer":
+        ctx = multiprocessing.get_context("spawn")
+        receiver, sender = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(
+            target=_serve,
+            args=(asdict(self.config), self.host, self.port, sender),
+            daemon=True,
+        )
+        self._process.start()
+        sender.close()
+        try:
+            if not receiver.poll(30):
+                raise EOFError
+            self.port = receiver.recv()
+        except EOFError:
+            self._process.terminate()
+            raise RuntimeError("synthetic feed server did not start") from None
+        finally:
+            receiver.close()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=5)
+
+    def write_catalog(self, path: Path, feeds: int, max_stories: int = 10) -> Path:
+        """Write a source catalog pointing ``feeds`` sources at this server"""
+        path.write_text(yaml.safe_dump({"sources": [
+            {
+                "name": f"Synthetic {i}",
+                "rss_url": self.feed_url(i),
+                "fallback_url": self.page_url(i),
+                "max_stories": max_stories,
+            }
+            for i in range(feeds)
+        ]}))
+        return path
@@ -0,0 +1,40 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Dict, Optional
+from ..archive.base import HeadlineArchive
+from .dependencies import get_archive
+
+router = APIRouter()
+
+
+@router.get("/archive/headlines")
+def get_archived_headlines(
+    source: Optional[str] = Query(None, description="Restrict to a single source"),
+    since: Optional[datetime] = Query(None, description="Only headlines published at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only headlines published at or before this time"),
+    limit: int = Query(100, ge=1, le=1000),
+    archive: HeadlineArchive = Depends(get_archive),
+) -> Dict[str, Any]:
+    """Get archived headlines in a time range, newest first"""
+    try:
+        headlines = archive.query(source=source, since=since, until=until, limit=limit)
+        return {"headlines": headlines, "count": len(headlines)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/archive/search")
+def search_archived_headlines(
+    q: str = Query(..., min_length=1, description="Keywords to match in headline titles"),
+    source: Optional[str] = Query(None, description="Restrict to a single source"),
+    since: Optional[datetime] = Query(None, description="Only headlines published at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only headlines published at or before this time"),
+    limit: int = Query(100, ge=1, le=1000),
+    archive: HeadlineArchive = Depends(get_archive),
+) -> Dict[str, Any]:
+    """Full-text search over archived headline titles"""
+    try:
+        headlines = archive.search(q, source=source, since=since, until=until, limit=limit)
+        return {"headlines": headlines, "count": len(headlines)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
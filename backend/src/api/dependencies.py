@@ -0,0 +1,85 @@
+import ipaddress
+import math
+
+from fastapi import HTTPException, Request
+
+from ..archive.base import HeadlineArchive
+from ..services.news_service import NewsService
+
+
+def get_news_service(request: Request) -> NewsService:
+    """Return the application-wide NewsService built during startup"""
+    return request.app.state.news_service
+
+
+def get_archive(request: Request) -> HeadlineArchive:
+    """Return the headline archive, or 503 when archiving is disabled"""
+    archive = getattr(request.app.state, "archive", None)
+    if archive is None:
+        raise HTTPException(status_code=503, detail="Headline archive is not enabled")
+    return archive
+
+
+def _trusted(address: str, networks) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_address(request: Request) -> str:
+    """The caller's IP, read from proxy headers only when the peer is a trusted proxy.
+
+    ``X-Forwarded-For`` is walked from the right, skipping trusted proxies, so an
+    address a client wrote into the header itself is never believed.
+    """
+    peer = request.client.host if request.client else "unknown"
+    networks = getattr(request.app.state, "trusted_proxies", ())
+    if not _trusted(peer, networks):
+        return peer
+    forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    for hop in reversed(forwarded):
+        if not _trusted(hop, networks):
+            return hop
+    return request.headers.get("x-real-ip", "").strip() or (forwarded[0] if forwarded else peer)
+
+
+def _too_many(retry_after: float, detail: str = "Too many refresh requests") -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def enforce_refresh_rate_limit(request: Request) -> None:
+    """Apply the per-client and global refresh token buckets, raising 429 when exhausted.
+
+    A request the global bucket rejects gets its client token back, so callers are
+    not charged for refreshes that never ran.
+    """
+    client_limiter = getattr(request.app.state, "refresh_client_limiter", None)
+    global_limiter = getattr(request.app.state, "refresh_global_limiter", None)
+    client_key = f"client:{client_address(request)}"
+
+    if client_limiter is not None:
+        retry_after = client_limiter.acquire(client_key)
+        if retry_after > 0:
+            raise _too_many(retry_after)
+    if global_limiter is not None:
+        retry_after = global_limiter.acquire("global")
+        if retry_after > 0:
+            if client_limiter is not None:
+                client_limiter.refund(client_key)
+            raise _too_many(retry_after)
+
+
+def enforce_watchlist_write_rate_limit(request: Request) -> None:
+    """Apply the per-client token bucket for creating, replacing and deleting watchlists"""
+    limiter = getattr(request.app.state, "watchlist_write_limiter", None)
+    if limiter is None:
+        return
+    retry_after = limiter.acquire(f"watchlist:{client_address(request)}")
+    if retry_after > 0:
+        raise _too_many(retry_after, "Too many watchlist changes")
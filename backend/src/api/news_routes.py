@@ -1,29 +1,114 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import List, Dict, Any, Optional
+from ..services.export_service import ExportService
 from ..services.news_service import NewsService
+from ..tracing import get_tracer
+from . import response_formats
+from .dependencies import get_news_service
 
 router = APIRouter()
-news_service = NewsService()
+export_service = ExportService()
 
 
 @router.get("/news")
-def get_news():
+def get_news(
+    request: Request,
+    collapse: bool = Query(False, description="Show one headline per near-duplicate cluster"),
+    fields: Optional[str] = Query(None, description="Comma-separated headline fields, e.g. title,link"),
+    limit_per_source: Optional[int] = Query(None, ge=1, description="Maximum headlines per source"),
+    format: Optional[str] = Query(None, pattern="^(json|columnar|msgpack)$", description="Overrides the Accept header"),
+    ticker: Optional[str] = Query(None, description="Comma-separated ticker symbols, e.g. AAPL,MSFT"),
+    entity: Optional[str] = Query(None, description="Comma-separated entities, e.g. Fed"),
+    news_service: NewsService = Depends(get_news_service),
+):
     """Get all news headlines from all sources"""
+    field_list = _parse_fields(fields)
+    tickers = _split_list(ticker)
+    entities = _split_list(entity)
+    fmt = response_formats.negotiate_format(request.headers.get("accept"), format)
+    if field_list is None and fmt != "json":
+        # Columnar layouts already group by source, so the per-headline source is redundant
+        field_list = [field for field in NewsService.HEADLINE_FIELDS if field != "source"]
+
     try:
-        response = news_service.fetch_all_news()
+        news = news_service.fetch_all_news(
+            collapse=collapse,
+            fields=field_list,
+            limit_per_source=limit_per_source,
+            tickers=tickers,
+            entities=entities,
+        )
         
         # Determine response status based on active sources
-        total_sources = response["total_sources"]
-        active_sources = response["active_sources"]
+        total_sources = news["total_sources"]
+        active_sources = news["active_sources"]
         
         if active_sources == 0:
             raise HTTPException(status_code=500, detail="No sources available")
-        elif active_sources < total_sources:
-            # Partial success - some sources failed
-            return response
-        else:
-            # Full success
-            return response
+
+        # Partial success (some sources failed) is still served with 200
+        with get_tracer().span("serialize", format=fmt):
+            if fmt != "json":
+                encoded = response_formats.render(news, fmt, field_list)
+            else:
+                # Already JSON-ready; rendering here keeps encoding inside the span
+                encoded = JSONResponse(news)
+        encoded.headers["Vary"] = "Accept"
+        return encoded
             
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _split_list(value: Optional[str]) -> Optional[List[str]]:
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()] or None
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    field_list = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in field_list if field not in NewsService.HEADLINE_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields {unknown}; choose from {list(NewsService.HEADLINE_FIELDS)}",
+        )
+    return field_list or None
+
+
+@router.get("/news/timeline")
+def get_timeline(
+    limit: int = Query(50, ge=1, le=500, description="Maximum headlines in this page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    sources: Optional[str] = Query(None, description="Comma-separated source names"),
+    since: Optional[datetime] = Query(None, description="Only headlines published at or after this time"),
+    news_service: NewsService = Depends(get_news_service),
+):
+    """Headlines from all sources merged newest first, paged by cursor"""
+    try:
+        return news_service.timeline(limit=limit, cursor=cursor, sources=_split_list(sources), since=since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/news/export")
+def export_news(
+    format: str = Query("csv", pattern="^(csv|ndjson|json)$", description="Export format"),
+    sources: Optional[str] = Query(None, description="Comma-separated source names"),
+    since: Optional[datetime] = Query(None, description="Only headlines published at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only headlines published at or before this time"),
+    news_service: NewsService = Depends(get_news_service),
+):
+    """Stream cached headlines as CSV, NDJSON or JSON"""
+    source_names = _split_list(sources)
+    headlines = news_service.iter_headlines(sources=source_names, since=since, until=until)
+    return StreamingResponse(
+        export_service.stream(headlines, format),
+        media_type=export_service.media_type(format),
+        headers={"Content-Disposition": f'attachment; filename="{export_service.filename(format)}"'},
+    )
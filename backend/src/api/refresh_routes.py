@@ -1,13 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any
 from ..services.news_service import NewsService
+from .dependencies import enforce_refresh_rate_limit, get_news_service
 
 router = APIRouter()
-news_service = NewsService()
 
 
-@router.post("/refresh")
-async def refresh_news():
+@router.post("/refresh", dependencies=[Depends(enforce_refresh_rate_limit)])
+def refresh_news(news_service: NewsService = Depends(get_news_service)):
     """Manually trigger news refresh"""
     try:
         response = news_service.refresh_news()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - msgpack optional
+    msgpack = None  # type: ignore
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.news.columnar+json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+FORMATS = ("json", "columnar", "msgpack")
+
+_MEDIA_TYPE_FORMATS = {
+    "application/json": "json",
+    COLUMNAR_MEDIA_TYPE: "columnar",
+    MSGPACK_MEDIA_TYPE: "msgpack",
+    "application/x-msgpack": "msgpack",
+}
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Split an Accept header into (media type, q) pairs, highest preference first"""
+    entries = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [piece.strip() for piece in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        entries.append((quality, -position, media_type.lower()))
+    entries.sort(reverse=True)
+    return [(media_type, quality) for quality, _, media_type in entries if quality > 0]
+
+
+def negotiate_format(accept: Optional[str], requested: Optional[str] = None) -> str:
+    """Pick json, columnar or msgpack from an explicit ``format`` or the Accept header"""
+    fmt = requested
+    if fmt is None and accept:
+        for media_type, _ in _parse_accept(accept):
+            if media_type in _MEDIA_TYPE_FORMATS:
+                fmt = _MEDIA_TYPE_FORMATS[media_type]
+                break
+    fmt = fmt or "json"
+    if fmt == "msgpack" and msgpack is None:
+        raise HTTPException(status_code=406, detail="MessagePack responses require the msgpack package")
+    return fmt
+
+
+def to_columnar(payload: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Turn each source's list of headline rows into one array per field"""
+    sources = []
+    for source in payload["sources"]:
+        columnar_source = {key: value for key, value in source.items() if key != "headlines"}
+        columnar_source["headlines"] = {
+            field: [headline[field] for headline in source["headlines"]] for field in fields
+        }
+        sources.append(columnar_source)
+    return {**payload, "fields": list(fields), "sources": sources}
+
+
+def render(payload: Dict[str, Any], fmt: str, fields: Sequence[str]) -> Response:
+    """Encode a columnar or MessagePack response body"""
+    body = to_columnar(payload, fields)
+    if fmt == "msgpack":
+        return Response(content=msgpack.packb(body), media_type=MSGPACK_MEDIA_TYPE)
+    return Response(
+        content=json.dumps(body, separators=(",", ":")),
+        media_type=COLUMNAR_MEDIA_TYPE,
+    )
@@ -1,13 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Any
 from ..services.news_service import NewsService
+from .dependencies import get_news_service
 
 router = APIRouter()
-news_service = NewsService()
 
 
 @router.get("/sources")
-def get_sources():
+def get_sources(news_service: NewsService = Depends(get_news_service)):
     """Get all configured news sources"""
     try:
         sources = news_service.get_sources_config()
@@ -0,0 +1,37 @@
+import re
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Dict, Optional
+from ..services.news_service import NewsService
+from .dependencies import get_news_service
+from .news_routes import _split_list
+
+router = APIRouter()
+
+_DURATION = re.compile(r"^(\d+)([smhd]?)$")
+_UNIT_SECONDS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _parse_duration(value: Optional[str], name: str) -> Optional[int]:
+    """'300', '5m', '1h' or '2d' in seconds"""
+    if value is None:
+        return None
+    match = _DURATION.match(value.strip().lower())
+    if not match or int(match.group(1)) == 0:
+        raise HTTPException(status_code=422, detail=f"{name} must be a duration such as 300, 5m, 1h or 2d")
+    return int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+
+
+@router.get("/stats")
+def get_stats(
+    bucket: Optional[str] = Query(None, description="Bucket size, e.g. 5m or 1h (default 1h)"),
+    time_range: Optional[str] = Query(None, alias="range", description="Time covered, e.g. 6h or 2d (default 24h)"),
+    sources: Optional[str] = Query(None, description="Comma-separated source names"),
+    news_service: NewsService = Depends(get_news_service),
+) -> Dict[str, Any]:
+    """Headlines per source, publisher latency and fetch success rates over time"""
+    bucket_seconds = _parse_duration(bucket, "bucket")
+    range_seconds = _parse_duration(time_range, "range")
+    try:
+        return news_service.stats(bucket_seconds, range_seconds, _split_list(sources))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
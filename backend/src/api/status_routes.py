@@ -1,22 +1,31 @@
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path
 from typing import Dict, Any
 from ..services.news_service import NewsService
+from .dependencies import get_news_service
 
 router = APIRouter()
-news_service = NewsService()
 
 
 @router.get("/sources/{source_name}/status")
-async def get_source_status(source_name: str = Path(..., description="Name of the news source")):
+async def get_source_status(
+    source_name: str = Path(..., description="Name of the news source"),
+    news_service: NewsService = Depends(get_news_service),
+):
     """Get status of a specific news source"""
     try:
         # Decode URL-encoded source name
         import urllib.parse
         decoded_source_name = urllib.parse.unquote(source_name)
         
-        status = news_service.get_source_status(decoded_source_name)
+        status = await news_service.get_source_status_async(decoded_source_name)
         return status
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache/memory")
+async def get_cache_memory(news_service: NewsService = Depends(get_news_service)):
+    """Estimated cache memory per source against the configured budget"""
+    return await news_service.memory_usage_async()
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Dict, List, Optional
+from ..models.watchlist import Watchlist, WatchlistSpec
+from ..services.news_service import NewsService
+from .dependencies import enforce_watchlist_write_rate_limit, get_news_service
+
+router = APIRouter()
+
+
+@router.get("/watchlists")
+def list_watchlists(news_service: NewsService = Depends(get_news_service)) -> List[Dict[str, Any]]:
+    """Get all saved watchlists"""
+    return [watchlist.model_dump() for watchlist in news_service.list_watchlists()]
+
+
+@router.post("/watchlists", status_code=201, dependencies=[Depends(enforce_watchlist_write_rate_limit)])
+def create_watchlist(spec: WatchlistSpec, news_service: NewsService = Depends(get_news_service)) -> Dict[str, Any]:
+    """Save a watchlist; it is matched against new headlines as they are ingested"""
+    try:
+        return news_service.save_watchlist(Watchlist(**spec.model_dump())).model_dump()
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.put("/watchlists/{watchlist_id}", dependencies=[Depends(enforce_watchlist_write_rate_limit)])
+def update_watchlist(
+    watchlist_id: str,
+    spec: WatchlistSpec,
+    news_service: NewsService = Depends(get_news_service),
+) -> Dict[str, Any]:
+    """Replace a watchlist's filters; its results are rebuilt from the cached headlines"""
+    if news_service.get_watchlist(watchlist_id) is None:
+        raise HTTPException(status_code=404, detail=f"Watchlist '{watchlist_id}' not found")
+    return news_service.save_watchlist(Watchlist(id=watchlist_id, **spec.model_dump())).model_dump()
+
+
+@router.delete(
+    "/watchlists/{watchlist_id}", status_code=204, dependencies=[Depends(enforce_watchlist_write_rate_limit)]
+)
+def delete_watchlist(watchlist_id: str, news_service: NewsService = Depends(get_news_service)) -> None:
+    if not news_service.delete_watchlist(watchlist_id):
+        raise HTTPException(status_code=404, detail=f"Watchlist '{watchlist_id}' not found")
+
+
+@router.get("/watchlists/{watchlist_id}")
+def get_watchlist(
+    watchlist_id: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum headlines to return"),
+    news_service: NewsService = Depends(get_news_service),
+) -> Dict[str, Any]:
+    """A watchlist's matching headlines, newest first, as materialized at ingest"""
+    try:
+        return news_service.watchlist_results(watchlist_id, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,4 @@
+from .base import HeadlineArchive
+from .sqlite_archive import SQLiteHeadlineArchive
+
+__all__ = ["HeadlineArchive", "SQLiteHeadlineArchive"]
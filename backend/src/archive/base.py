@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Protocol
+
+from ..models.news_headline import NewsHeadline
+
+
+class HeadlineArchive(Protocol):
+    """Protocol for append-only stores that keep headlines after they leave the cache."""
+
+    def append(self, headlines: Iterable[NewsHeadline]) -> int: ...
+
+    def query(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]: ...
+
+    def search(
+        self,
+        text: str,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]: ...
+
+    def count(self) -> int: ...
+
+    def close(self) -> None: ...
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..models.news_headline import NewsHeadline
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS headlines (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    published_at REAL NOT NULL,
+    fetched_at REAL NOT NULL,
+    UNIQUE (source, link)
+);
+CREATE INDEX IF NOT EXISTS idx_headlines_source_published ON headlines (source, published_at);
+CREATE INDEX IF NOT EXISTS idx_headlines_published ON headlines (published_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS headlines_fts USING fts5(
+    title, content='headlines', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS headlines_ai AFTER INSERT ON headlines BEGIN
+    INSERT INTO headlines_fts (rowid, title) VALUES (new.id, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS headlines_ad AFTER DELETE ON headlines BEGIN
+    INSERT INTO headlines_fts (headlines_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+"""
+
+_COLUMNS = "h.source, h.title, h.link, h.published_at, h.fetched_at"
+
+
+def _to_epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _to_iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _fts_query(text: str) -> str:
+    # Quote every term so user input can never be parsed as FTS5 syntax
+    terms = [term.replace('"', '""') for term in text.split()]
+    return " ".join(f'"{term}"' for term in terms if term)
+
+
+class SQLiteHeadlineArchive:
+    """Append-only SQLite (WAL) archive with an FTS5 index over headline titles."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    # Connections -----------------------------------------------------------
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection; WAL lets readers run alongside the writer."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    # Writes ----------------------------------------------------------------
+    def append(self, headlines: Iterable[NewsHeadline]) -> int:
+        """Insert headlines in a single transaction, ignoring ones already archived"""
+        rows = [
+            (h.source, h.title, h.link, _to_epoch(h.published_at), _to_epoch(h.fetched_at))
+            for h in headlines
+        ]
+        if not rows:
+            return 0
+
+        conn = self._connection()
+        with self._write_lock:
+            with conn:
+                cursor = conn.executemany(
+                    "INSERT OR IGNORE INTO headlines (source, title, link, published_at, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            # Summed over the batch; counts only this statement's inserts, not the FTS
+            # trigger's or rows other processes appended meanwhile
+            inserted = cursor.rowcount
+
+        logger.debug("Archived %s new headlines (%s offered)", inserted, len(rows))
+        return inserted
+
+    # Reads -----------------------------------------------------------------
+    def query(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Headlines in a time range, newest first"""
+        where, params = self._filters(source, since, until)
+        sql = f"SELECT {_COLUMNS} FROM headlines h"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY h.published_at DESC LIMIT ?"
+        return self._fetch(sql, params + [limit])
+
+    def search(
+        self,
+        text: str,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over titles, newest first"""
+        match = _fts_query(text)
+        if not match:
+            return []
+        where, params = self._filters(source, since, until)
+        sql = (
+            f"SELECT {_COLUMNS} FROM headlines_fts f JOIN headlines h ON h.id = f.rowid "
+            "WHERE headlines_fts MATCH ?"
+        )
+        if where:
+            sql += " AND " + " AND ".join(where)
+        sql += " ORDER BY h.published_at DESC LIMIT ?"
+        return self._fetch(sql, [match] + params + [limit])
+
+    def count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM headlines").fetchone()[0]
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    # Helpers ---------------------------------------------------------------
+    @staticmethod
+    def _filters(
+        source: Optional[str], since: Optional[datetime], until: Optional[datetime]
+    ) -> Tuple[List[str], List[Any]]:
+        where: List[str] = []
+        params: List[Any] = []
+        if source:
+            where.append("h.source = ?")
+            params.append(source)
+        if since:
+            where.append("h.published_at >= ?")
+            params.append(_to_epoch(since))
+        if until:
+            where.append("h.published_at <= ?")
+            params.append(_to_epoch(until))
+        return where, params
+
+    def _fetch(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(sql, params).fetchall()
+        return [
+            {
+                "source": source,
+                "title": title,
+                "link": link,
+                "published_at": _to_iso(published_at),
+                "fetched_at": _to_iso(fetched_at),
+            }
+            for source, title, link, published_at, fetched_at in rows
+        ]
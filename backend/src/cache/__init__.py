@@ -1,11 +1,26 @@
-from .base import NewsCacheBackend
+from .async_adapter import AsyncCacheAdapter
+from .base import AsyncNewsCacheBackend, CacheSnapshot, NewsCacheBackend
 from .in_memory import InMemoryNewsCache
 
-__all__ = ["NewsCacheBackend", "InMemoryNewsCache"]
+__all__ = [
+    "AsyncCacheAdapter",
+    "AsyncNewsCacheBackend",
+    "AsyncRedisNewsCache",
+    "CacheSnapshot",
+    "NewsCacheBackend",
+    "InMemoryNewsCache",
+    "RedisNewsCache",
+]
 
-try:  # optional redis support
-    from .redis_cache import RedisNewsCache
 
-    __all__.append("RedisNewsCache")
-except RuntimeError:  # redis library missing
-    pass
+def __getattr__(name):
+    # Imported on first use so the redis client library only loads when it is configured
+    if name == "RedisNewsCache":
+        from .redis_cache import RedisNewsCache
+
+        return RedisNewsCache
+    if name == "AsyncRedisNewsCache":
+        from .async_redis_cache import AsyncRedisNewsCache
+
+        return AsyncRedisNewsCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
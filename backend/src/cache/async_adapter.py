@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import anyio
+
+from ..models.news_source import NewsSource
+from .base import CacheSnapshot, NewsCacheBackend
+
+
+class AsyncCacheAdapter:
+    """``AsyncNewsCacheBackend`` over a synchronous cache.
+
+    In-memory caches answer from a snapshot reference without blocking, so calls run
+    inline. With ``offload`` (a synchronous network client), each call runs on a
+    worker thread instead, keeping the event loop free while it waits.
+    """
+
+    def __init__(self, cache: NewsCacheBackend, offload: bool = False) -> None:
+        self.cache = cache
+        self.offload = offload
+
+    @property
+    def refresh_interval_minutes(self) -> int:
+        return self.cache.refresh_interval_minutes
+
+    @property
+    def memory_budget(self):
+        return self.cache.memory_budget
+
+    async def _call(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self.offload:
+            return await anyio.to_thread.run_sync(function, *args)
+        return function(*args)
+
+    async def snapshot(self) -> CacheSnapshot:
+        return await self._call(self.cache.snapshot)
+
+    async def snapshot_at(self, generation: int) -> Optional[CacheSnapshot]:
+        return await self._call(self.cache.snapshot_at, generation)
+
+    async def get_source(self, name: str) -> Optional[NewsSource]:
+        return await self._call(self.cache.get_source, name)
+
+    async def get_last_refresh(self) -> datetime:
+        return await self._call(lambda: self.cache.last_refresh)
+
+    async def update_source(self, source: NewsSource) -> None:
+        await self._call(self.cache.update_source, source)
+
+    async def remove_source(self, name: str) -> None:
+        await self._call(self.cache.remove_source, name)
+
+    async def refresh(self) -> None:
+        await self._call(self.cache.refresh)
+
+    async def clear(self) -> None:
+        await self._call(self.cache.clear)
+
+    async def close(self) -> None:
+        """The wrapped cache belongs to the caller"""
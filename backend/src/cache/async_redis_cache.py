@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import anyio
+
+try:
+    import redis.asyncio as aioredis  # type: ignore
+    from redis.exceptions import WatchError  # type: ignore
+except ImportError:  # pragma: no cover - redis optional
+    aioredis = None  # type: ignore
+    WatchError = Exception  # type: ignore
+
+from ..models.news_source import NewsSource
+from .base import CacheSnapshot
+from .memory_budget import MemoryBudget
+from .redis_cache import WRITE_RETRIES, RedisKeys, dump_sources, load_sources, removal_change, upsert_change
+
+logger = logging.getLogger(__name__)
+
+# Payloads larger than this are decoded on a worker thread rather than the event loop
+_INLINE_DECODE_BYTES = 64 * 1024
+
+
+class AsyncRedisNewsCache(RedisKeys):
+    """asyncio Redis cache sharing the key layout and write transactions of ``RedisNewsCache``.
+
+    Used by the async routes (``/health``, ``/metrics``, source status and cache
+    memory) so they never block the event loop on Redis. Refreshes run on worker
+    threads and write through ``RedisNewsCache``; both apply the same changes in the
+    same WATCH/MULTI transaction, so writers on either client never lose each other's
+    sources.
+
+    All handlers in a process share one connection pool of ``max_connections``; when
+    it is exhausted, callers wait up to ``pool_timeout`` for a connection instead of
+    opening more. The decoded snapshot is kept per generation, so a read costs one
+    pipelined round trip for the generation and refresh time, and the sources payload
+    is fetched and decoded again only after a write.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        namespace: str = "news_cache",
+        refresh_interval_minutes: int = 15,
+        memory_budget: Optional[MemoryBudget] = None,
+        max_connections: int = 16,
+        pool_timeout: float = 2.0,
+        client=None,
+    ) -> None:
+        if client is None:
+            if aioredis is None:
+                raise RuntimeError("redis package is required for AsyncRedisNewsCache")
+            pool = aioredis.BlockingConnectionPool.from_url(
+                url,
+                max_connections=max(1, max_connections),
+                timeout=pool_timeout,
+                decode_responses=True,
+            )
+            client = aioredis.Redis(connection_pool=pool)
+        self.client = client
+        self.namespace = namespace.rstrip(":")
+        self.refresh_interval_minutes = refresh_interval_minutes
+        self.memory_budget = memory_budget or MemoryBudget(0)
+        self._snapshot: Optional[CacheSnapshot] = None
+
+    def _parse_last_refresh(self, value: Optional[str]) -> datetime:
+        if value:
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                logger.warning("Invalid last_refresh timestamp in redis: %s", value)
+        return datetime.now(timezone.utc) - timedelta(minutes=self.refresh_interval_minutes + 1)
+
+    @staticmethod
+    async def _decode(payload: Optional[str]) -> Dict[str, NewsSource]:
+        if not payload:
+            return {}
+        if len(payload) <= _INLINE_DECODE_BYTES:
+            return load_sources(payload)
+        return await anyio.to_thread.run_sync(load_sources, payload)
+
+    async def snapshot(self) -> CacheSnapshot:
+        """The current generation, decoded again only if it changed since the last read"""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.get(self._generation_key)
+        pipe.get(self._timestamp_key)
+        generation, last_refresh = await pipe.execute()
+        cached = self._snapshot
+        if cached is not None and cached.generation == int(generation or 0):
+            return cached
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.get(self._sources_key)
+        pipe.get(self._timestamp_key)
+        pipe.get(self._generation_key)
+        payload, last_refresh, generation = await pipe.execute()
+        snapshot = CacheSnapshot.build(
+            int(generation or 0),
+            await self._decode(payload),
+            self._parse_last_refresh(last_refresh),
+        )
+        # Concurrent readers may both decode; keep whichever is newer
+        if self._snapshot is None or self._snapshot.generation < snapshot.generation:
+            self._snapshot = snapshot
+        return snapshot
+
+    async def snapshot_at(self, generation: int) -> Optional[CacheSnapshot]:
+        """Only the current generation is stored in Redis"""
+        snapshot = await self.snapshot()
+        return snapshot if snapshot.generation == generation else None
+
+    async def get_source(self, name: str) -> Optional[NewsSource]:
+        return (await self.snapshot()).sources.get(name)
+
+    async def get_last_refresh(self) -> datetime:
+        return self._parse_last_refresh(await self.client.get(self._timestamp_key))
+
+    async def _write(self, change, last_refresh: Optional[datetime]) -> None:
+        """Apply ``change`` to the stored sources in a WATCH/MULTI transaction"""
+        for _ in range(WRITE_RETRIES):
+            async with self.client.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(self._sources_key)
+                    sources = await self._decode(await pipe.get(self._sources_key))
+                    sources = change(sources)
+                    if sources is None:
+                        return
+                    pipe.multi()
+                    pipe.set(self._sources_key, dump_sources(sources))
+                    if last_refresh is not None:
+                        pipe.set(self._timestamp_key, last_refresh.isoformat())
+                    pipe.incr(self._generation_key)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+        raise RuntimeError(f"Could not write {self._sources_key}: too many concurrent writers")
+
+    async def update_source(self, source: NewsSource) -> None:
+        await self._write(upsert_change(source, self.memory_budget), datetime.now(timezone.utc))
+
+    async def remove_source(self, name: str) -> None:
+        await self._write(removal_change(name), None)
+
+    async def refresh(self) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._timestamp_key, datetime.now(timezone.utc).isoformat())
+        pipe.incr(self._generation_key)
+        await pipe.execute()
+
+    async def clear(self) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(self._sources_key, self._timestamp_key)
+        pipe.incr(self._generation_key)
+        await pipe.execute()
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        pool = getattr(self.client, "connection_pool", None)
+        if pool is not None:
+            await pool.disconnect()
@@ -1,15 +1,68 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, Optional, Protocol
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Protocol
 
 from ..models.news_source import NewsSource
+from .memory_budget import MemoryBudget, estimate_source_bytes
+
+
+@dataclass(frozen=True)
+class CacheSnapshot:
+    """Immutable, generation-numbered view of every cached source.
+
+    A snapshot is never modified once published; writers build the next one and
+    install it with a single reference swap, so a reader holding a snapshot sees one
+    consistent set of sources, counts and refresh time for as long as it keeps it.
+    The sources inside are shared and must be treated as read-only.
+    """
+
+    generation: int
+    sources: Mapping[str, NewsSource]
+    last_refresh: datetime
+    active_sources: int
+    # Sizes already known to the writer; anything else is estimated on first use
+    measured_bytes: Optional[Mapping[str, int]] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def build(
+        cls,
+        generation: int,
+        sources: Dict[str, NewsSource],
+        last_refresh: datetime,
+        source_bytes: Optional[Dict[str, int]] = None,
+    ) -> "CacheSnapshot":
+        return cls(
+            generation=generation,
+            sources=MappingProxyType(sources),
+            last_refresh=last_refresh,
+            active_sources=sum(1 for source in sources.values() if source.status == "active"),
+            measured_bytes=MappingProxyType(source_bytes) if source_bytes is not None else None,
+        )
+
+    @cached_property
+    def source_bytes(self) -> Mapping[str, int]:
+        """Approximate resident bytes of each cached source"""
+        if self.measured_bytes is not None:
+            return self.measured_bytes
+        return MappingProxyType({name: estimate_source_bytes(source) for name, source in self.sources.items()})
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(self.source_bytes.values())
 
 
 class NewsCacheBackend(Protocol):
     """Protocol that all news cache backends must implement."""
 
     last_refresh: datetime
+    memory_budget: MemoryBudget
+
+    @property
+    def refresh_interval_minutes(self) -> int: ...
 
     @property
     def is_fresh(self) -> bool: ...
@@ -17,11 +70,17 @@ class NewsCacheBackend(Protocol):
     @property
     def cache_status(self) -> str: ...
 
+    def snapshot(self) -> CacheSnapshot: ...
+
+    def snapshot_at(self, generation: int) -> Optional[CacheSnapshot]: ...
+
     def update_source(self, source: NewsSource) -> None: ...
 
     def get_source(self, name: str) -> Optional[NewsSource]: ...
 
-    def get_all_sources(self) -> Dict[str, NewsSource]: ...
+    def remove_source(self, name: str) -> None: ...
+
+    def get_all_sources(self) -> Mapping[str, NewsSource]: ...
 
     def refresh(self) -> None: ...
 
@@ -33,3 +92,35 @@ class NewsCacheBackend(Protocol):
     @property
     def total_sources_count(self) -> int: ...
 
+
+class AsyncNewsCacheBackend(Protocol):
+    """Awaitable view of a cache for code running on the event loop.
+
+    Reads return whole snapshots, so a handler makes one call (for Redis, one pooled
+    round trip or pipeline) instead of one per property.
+    """
+
+    refresh_interval_minutes: int
+    memory_budget: MemoryBudget
+
+    async def snapshot(self) -> CacheSnapshot: ...
+
+    async def snapshot_at(self, generation: int) -> Optional[CacheSnapshot]: ...
+
+    async def get_source(self, name: str) -> Optional[NewsSource]: ...
+
+    async def get_last_refresh(self) -> datetime: ...
+
+    async def update_source(self, source: NewsSource) -> None: ...
+
+    async def remove_source(self, name: str) -> None: ...
+
+    async def refresh(self) -> None: ...
+
+    async def clear(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+def is_fresh(last_refresh: datetime, refresh_interval_minutes: int) -> bool:
+    return datetime.now(timezone.utc) - last_refresh < timedelta(minutes=refresh_interval_minutes)
@@ -1,23 +1,112 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Mapping, Optional
 
 from ..models.news_source import NewsSource
+from .base import CacheSnapshot
+from .memory_budget import MemoryBudget
 
 
 class InMemoryNewsCache:
-    """In-memory cache for news data."""
+    """In-memory cache for news data.
 
-    def __init__(self, refresh_interval_minutes: int = 15):
-        self.sources: Dict[str, NewsSource] = {}
-        self.last_refresh: datetime = datetime.now(timezone.utc) - timedelta(minutes=refresh_interval_minutes + 1)
+    State lives in one immutable ``CacheSnapshot``. Writers copy the current source map,
+    apply their change and swap in the next generation under a lock; readers just take
+    the current reference, so they never lock, never copy and never see a partial write.
+    The last ``retained_generations`` snapshots stay reachable by number, which keeps
+    paginated reads (the timeline) on the generation they started from.
+
+    With a ``memory_budget``, every write evicts old headlines until the estimated
+    size of the current generation fits it. Retained generations still hold the
+    source versions they were built from, and every fetch replaces a source with new
+    objects, so those count too: ``reachable_bytes`` covers every distinct source
+    reachable from any retained generation, and the oldest generations are dropped
+    early whenever it exceeds the budget. Cursors on a dropped generation resume by time.
+    """
+
+    def __init__(
+        self,
+        refresh_interval_minutes: int = 15,
+        retained_generations: int = 32,
+        memory_budget: Optional[MemoryBudget] = None,
+    ):
         self._refresh_interval: int = refresh_interval_minutes
+        # Without a budget this only measures sources
+        self.memory_budget = memory_budget or MemoryBudget(0)
+        self._write_lock = threading.Lock()
+        self._retained_generations = max(1, retained_generations)
+        self._retained: "OrderedDict[int, CacheSnapshot]" = OrderedDict()
+        # id(source) -> [retained generations holding it, its bytes]; an id stays
+        # unique while listed because a retained snapshot keeps the object alive
+        self._references: Dict[int, List[int]] = {}
+        self.reachable_bytes = 0
+        self._snapshot = CacheSnapshot.build(0, {}, self._stale_time())
+        self._retain(self._snapshot)
+
+    def _stale_time(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(minutes=self._refresh_interval + 1)
+
+    def _publish(self, sources: Dict[str, NewsSource], last_refresh: datetime) -> None:
+        """Install the next generation; callers hold the write lock"""
+        current = self._snapshot
+        known = {name: (source, current.source_bytes[name]) for name, source in current.sources.items()}
+        sources, source_bytes = self.memory_budget.enforce(sources, known)
+        snapshot = CacheSnapshot.build(current.generation + 1, sources, last_refresh, source_bytes)
+        self._retain(snapshot)
+        max_bytes = self.memory_budget.max_bytes
+        while len(self._retained) > self._retained_generations or (
+            max_bytes and self.reachable_bytes > max_bytes and len(self._retained) > 1
+        ):
+            self._release(self._retained.popitem(last=False)[1])
+        self._snapshot = snapshot
+
+    def _retain(self, snapshot: CacheSnapshot) -> None:
+        self._retained[snapshot.generation] = snapshot
+        for name, source in snapshot.sources.items():
+            entry = self._references.get(id(source))
+            if entry is not None:
+                entry[0] += 1
+                continue
+            size = snapshot.source_bytes[name]
+            self._references[id(source)] = [1, size]
+            self.reachable_bytes += size
+
+    def _release(self, snapshot: CacheSnapshot) -> None:
+        for source in snapshot.sources.values():
+            entry = self._references[id(source)]
+            entry[0] -= 1
+            if not entry[0]:
+                del self._references[id(source)]
+                self.reachable_bytes -= entry[1]
+
+    @property
+    def retained_generations(self) -> int:
+        """Generations currently reachable through ``snapshot_at``"""
+        return len(self._retained)
+
+    def snapshot(self) -> CacheSnapshot:
+        """The current generation; unaffected by later writes"""
+        return self._snapshot
+
+    def snapshot_at(self, generation: int) -> Optional[CacheSnapshot]:
+        """A recent generation by number, or None once it has been dropped"""
+        return self._retained.get(generation)
+
+    @property
+    def refresh_interval_minutes(self) -> int:
+        return self._refresh_interval
+
+    @property
+    def last_refresh(self) -> datetime:
+        return self._snapshot.last_refresh
 
     @property
     def is_fresh(self) -> bool:
         """Check if cache data is fresh"""
-        time_diff = datetime.now(timezone.utc) - self.last_refresh
+        time_diff = datetime.now(timezone.utc) - self._snapshot.last_refresh
         return time_diff.total_seconds() < (self._refresh_interval * 60)
 
     @property
@@ -26,33 +115,45 @@ class InMemoryNewsCache:
         return "fresh" if self.is_fresh else "stale"
 
     def update_source(self, source: NewsSource):
-        """Update a source in the cache"""
-        self.sources[source.name] = source
-        self.last_refresh = datetime.now(timezone.utc)
+        """Update a source in the cache; ``source`` must not be modified afterwards"""
+        with self._write_lock:
+            sources = dict(self._snapshot.sources)
+            sources[source.name] = source
+            self._publish(sources, datetime.now(timezone.utc))
 
     def get_source(self, name: str) -> Optional[NewsSource]:
         """Get a source from cache"""
-        return self.sources.get(name)
+        return self._snapshot.sources.get(name)
+
+    def remove_source(self, name: str):
+        """Drop a source that is no longer configured"""
+        with self._write_lock:
+            if name not in self._snapshot.sources:
+                return
+            sources = dict(self._snapshot.sources)
+            del sources[name]
+            self._publish(sources, self._snapshot.last_refresh)
 
-    def get_all_sources(self) -> Dict[str, NewsSource]:
-        """Get all sources from cache"""
-        return self.sources.copy()
+    def get_all_sources(self) -> Mapping[str, NewsSource]:
+        """Read-only view of all cached sources at the current generation"""
+        return self._snapshot.sources
 
     def refresh(self):
         """Mark cache as refreshed"""
-        self.last_refresh = datetime.now(timezone.utc)
+        with self._write_lock:
+            self._publish(dict(self._snapshot.sources), datetime.now(timezone.utc))
 
     def clear(self):
         """Clear all cached data"""
-        self.sources.clear()
-        self.last_refresh = datetime.now(timezone.utc) - timedelta(minutes=16)  # Mark as stale
+        with self._write_lock:
+            self._publish({}, self._stale_time())
 
     @property
     def active_sources_count(self) -> int:
         """Count of active sources"""
-        return sum(1 for source in self.sources.values() if source.status == "active")
+        return self._snapshot.active_sources
 
     @property
     def total_sources_count(self) -> int:
         """Total number of sources"""
-        return len(self.sources)
+        return len(self._snapshot.sources)
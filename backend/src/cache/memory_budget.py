@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import heapq
+import logging
+import sys
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from ..models.news_headline import NewsHeadline
+from ..models.news_source import NewsSource
+
+logger = logging.getLogger(__name__)
+
+OLDEST = "oldest"
+FAIR = "fair"
+EVICTION_POLICIES = (OLDEST, FAIR)
+
+# Measured with tracemalloc: the model instance, its __dict__ and field set, two
+# datetimes and two empty tag lists. Strings are added per headline.
+HEADLINE_OVERHEAD_BYTES = 640
+SOURCE_OVERHEAD_BYTES = 1024
+
+
+def estimate_headline_bytes(headline: NewsHeadline) -> int:
+    """Approximate resident size of one cached headline"""
+    size = HEADLINE_OVERHEAD_BYTES + sys.getsizeof(headline.title) + sys.getsizeof(headline.link)
+    if headline.cluster_id is not None:
+        size += sys.getsizeof(headline.cluster_id)
+    for tag in headline.tickers:
+        size += sys.getsizeof(tag) + 8
+    for tag in headline.entities:
+        size += sys.getsizeof(tag) + 8
+    return size
+
+
+def estimate_source_bytes(source: NewsSource) -> int:
+    """Approximate resident size of a cached source and its headlines"""
+    return SOURCE_OVERHEAD_BYTES + sum(estimate_headline_bytes(headline) for headline in source.headlines)
+
+
+class MemoryBudget:
+    """Caps the estimated size of the cached headlines by evicting the oldest ones.
+
+    ``oldest`` evicts the globally oldest headlines first, so a quiet source can lose
+    everything to busy ones. ``fair`` gives every source an equal share, handing
+    what small sources leave unused to the larger ones, and trims each source to its
+    share. Either way a source keeps its newest headlines, so lists stay newest first.
+    Sizes are estimates (see ``estimate_headline_bytes``), not measurements.
+    """
+
+    def __init__(self, max_bytes: int, policy: str = OLDEST) -> None:
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy {policy!r}; choose from {list(EVICTION_POLICIES)}")
+        self.max_bytes = max(0, max_bytes)
+        self.policy = policy
+        self.evicted_headlines = 0
+
+    def enforce(
+        self,
+        sources: Dict[str, NewsSource],
+        known_bytes: Optional[Mapping[str, Tuple[NewsSource, int]]] = None,
+    ) -> Tuple[Dict[str, NewsSource], Dict[str, int]]:
+        """Sources trimmed to the budget and their estimated sizes.
+
+        ``known_bytes`` maps names to a ``(source, bytes)`` pair from an earlier call;
+        a source that is the very same object is not measured again. Trimmed sources
+        are copies; the ones passed in are left untouched.
+        """
+        known_bytes = known_bytes or {}
+        sizes: Dict[str, int] = {}
+        for name, source in sources.items():
+            known = known_bytes.get(name)
+            sizes[name] = known[1] if known is not None and known[0] is source else estimate_source_bytes(source)
+
+        if not self.max_bytes or sum(sizes.values()) <= self.max_bytes:
+            return sources, sizes
+
+        keep = self._keep_oldest_first(sources, sizes) if self.policy == OLDEST else self._keep_fair(sources, sizes)
+        trimmed = dict(sources)
+        evicted = 0
+        for name, count in keep.items():
+            source = sources[name]
+            if count < len(source.headlines):
+                evicted += len(source.headlines) - count
+                trimmed[name] = source.model_copy(update={"headlines": source.headlines[:count]})
+                sizes[name] = estimate_source_bytes(trimmed[name])
+        if evicted:
+            self.evicted_headlines += evicted
+            logger.info("Evicted %s headlines to stay within %s bytes (%s policy)", evicted, self.max_bytes, self.policy)
+        return trimmed, sizes
+
+    def _keep_oldest_first(self, sources: Dict[str, NewsSource], sizes: Dict[str, int]) -> Dict[str, int]:
+        """Drop the oldest remaining headline across all sources until under budget"""
+        keep = {name: len(source.headlines) for name, source in sources.items()}
+        excess = sum(sizes.values()) - self.max_bytes
+        # Each source's oldest kept headline is its last one
+        heap: List[Tuple[float, str]] = [
+            (source.headlines[-1].published_at.timestamp(), name) for name, source in sources.items() if source.headlines
+        ]
+        heapq.heapify(heap)
+        while heap and excess > 0:
+            _, name = heapq.heappop(heap)
+            keep[name] -= 1
+            headlines = sources[name].headlines
+            excess -= estimate_headline_bytes(headlines[keep[name]])
+            if keep[name]:
+                heapq.heappush(heap, (headlines[keep[name] - 1].published_at.timestamp(), name))
+        return keep
+
+    def _keep_fair(self, sources: Dict[str, NewsSource], sizes: Dict[str, int]) -> Dict[str, int]:
+        """Equal shares, with the unused part of small sources' shares passed on"""
+        keep: Dict[str, int] = {}
+        remaining = self.max_bytes
+        ordered = sorted(sources, key=sizes.__getitem__)
+        for position, name in enumerate(ordered):
+            allowance = remaining // (len(ordered) - position)
+            used = SOURCE_OVERHEAD_BYTES
+            count = 0
+            for headline in sources[name].headlines:
+                size = estimate_headline_bytes(headline)
+                if used + size > allowance:
+                    break
+                used += size
+                count += 1
+            keep[name] = count
+            remaining -= min(used, allowance)
+        return keep
@@ -3,35 +3,60 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 try:
     import redis  # type: ignore
+    from redis.exceptions import WatchError  # type: ignore
 except ImportError as exc:  # pragma: no cover - redis optional
     redis = None  # type: ignore
+    WatchError = Exception  # type: ignore
 
 from ..models.news_source import NewsSource
+from .base import CacheSnapshot
+from .memory_budget import MemoryBudget
 
 logger = logging.getLogger(__name__)
 
+WRITE_RETRIES = 5
 
-class RedisNewsCache:
-    """Redis-backed cache for news data."""
 
-    def __init__(
-        self,
-        url: str,
-        namespace: str = "news_cache",
-        refresh_interval_minutes: int = 15,
-    ) -> None:
-        if redis is None:
-            raise RuntimeError("redis package is required for RedisNewsCache")
+def dump_sources(sources: Dict[str, NewsSource]) -> str:
+    return json.dumps({name: source.model_dump(mode="json") for name, source in sources.items()})
 
-        self.client = redis.Redis.from_url(url, decode_responses=True)
-        self.namespace = namespace.rstrip(":")
-        self._refresh_interval = refresh_interval_minutes
 
-    # Keys -----------------------------------------------------------------
+def load_sources(payload: str) -> Dict[str, NewsSource]:
+    """Decode a payload written by ``dump_sources``; it was validated before it was stored"""
+    data = json.loads(payload)
+    return dict(zip(data, NewsSource.from_trusted(list(data.values()))))
+
+
+def upsert_change(source: NewsSource, memory_budget: MemoryBudget):
+    """Change for ``write``: add or replace ``source`` and trim to the budget"""
+
+    def change(sources: Dict[str, NewsSource]) -> Dict[str, NewsSource]:
+        sources[source.name] = source
+        if memory_budget.max_bytes:
+            sources, _ = memory_budget.enforce(sources)
+        return sources
+
+    return change
+
+
+def removal_change(name: str):
+    """Change for ``write``: drop source ``name``, or nothing if it is not cached"""
+
+    def change(sources: Dict[str, NewsSource]) -> Optional[Dict[str, NewsSource]]:
+        return sources if sources.pop(name, None) is not None else None
+
+    return change
+
+
+class RedisKeys:
+    """Key layout shared by the synchronous and asyncio Redis caches"""
+
+    namespace: str
+
     @property
     def _sources_key(self) -> str:
         return f"{self.namespace}:sources"
@@ -40,20 +65,72 @@ class RedisNewsCache:
     def _timestamp_key(self) -> str:
         return f"{self.namespace}:last_refresh"
 
+    @property
+    def _generation_key(self) -> str:
+        return f"{self.namespace}:generation"
+
+
+class RedisNewsCache(RedisKeys):
+    """Redis-backed cache for news data.
+
+    A ``memory_budget`` is enforced on every write, which bounds both the Redis value
+    and what each worker holds after loading it. Writes are optimistic transactions on
+    the sources key (WATCH, then MULTI/EXEC) and are retried when another process wrote
+    in between, so fetch workers finishing together never drop each other's sources.
+    Like ``AsyncRedisNewsCache``, the decoded snapshot is kept per generation, so a
+    snapshot read between writes costs one round trip and no decoding.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        namespace: str = "news_cache",
+        refresh_interval_minutes: int = 15,
+        memory_budget: Optional[MemoryBudget] = None,
+        client=None,
+    ) -> None:
+        if client is None:
+            if redis is None:
+                raise RuntimeError("redis package is required for RedisNewsCache")
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self.client = client
+        self.namespace = namespace.rstrip(":")
+        self._refresh_interval = refresh_interval_minutes
+        self.memory_budget = memory_budget or MemoryBudget(0)
+        self._snapshot: Optional[CacheSnapshot] = None
+
     # Helpers ---------------------------------------------------------------
     def _load_sources(self) -> Dict[str, NewsSource]:
         payload = self.client.get(self._sources_key)
         if not payload:
             return {}
-        data = json.loads(payload)
-        return {name: NewsSource.model_validate(model) for name, model in data.items()}
-
-    def _store_sources(self, sources: Dict[str, NewsSource]) -> None:
-        payload = {name: source.model_dump() for name, source in sources.items()}
-        self.client.set(self._sources_key, json.dumps(payload))
+        return load_sources(payload)
+
+    def _write(self, change, last_refresh: Optional[datetime]) -> None:
+        """Apply ``change`` to the stored sources in a WATCH/MULTI transaction"""
+        for _ in range(WRITE_RETRIES):
+            with self.client.pipeline(transaction=True) as pipe:
+                try:
+                    pipe.watch(self._sources_key)
+                    payload = pipe.get(self._sources_key)
+                    sources = change(load_sources(payload) if payload else {})
+                    if sources is None:
+                        return
+                    pipe.multi()
+                    pipe.set(self._sources_key, dump_sources(sources))
+                    if last_refresh is not None:
+                        pipe.set(self._timestamp_key, last_refresh.isoformat())
+                    pipe.incr(self._generation_key)
+                    pipe.execute()
+                    return
+                except WatchError:
+                    continue
+        raise RuntimeError(f"Could not write {self._sources_key}: too many concurrent writers")
 
     def _get_last_refresh(self) -> datetime:
-        value = self.client.get(self._timestamp_key)
+        return self._parse_last_refresh(self.client.get(self._timestamp_key))
+
+    def _parse_last_refresh(self, value: Optional[str]) -> datetime:
         if value:
             try:
                 return datetime.fromisoformat(value)
@@ -62,9 +139,16 @@ class RedisNewsCache:
         return datetime.now(timezone.utc) - timedelta(minutes=self._refresh_interval + 1)
 
     def _set_last_refresh(self, ts: datetime) -> None:
-        self.client.set(self._timestamp_key, ts.isoformat())
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._timestamp_key, ts.isoformat())
+        pipe.incr(self._generation_key)
+        pipe.execute()
 
     # Protocol implementation ----------------------------------------------
+    @property
+    def refresh_interval_minutes(self) -> int:
+        return self._refresh_interval
+
     @property
     def last_refresh(self) -> datetime:
         return self._get_last_refresh()
@@ -77,25 +161,56 @@ class RedisNewsCache:
     def cache_status(self) -> str:
         return "fresh" if self.is_fresh else "stale"
 
+    def snapshot(self) -> CacheSnapshot:
+        """The current generation, decoded again only if it changed since the last read.
+
+        Sources, refresh time and generation are read together in one MULTI/EXEC.
+        """
+        cached = self._snapshot
+        if cached is not None and cached.generation == int(self.client.get(self._generation_key) or 0):
+            return cached
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.get(self._sources_key)
+        pipe.get(self._timestamp_key)
+        pipe.get(self._generation_key)
+        payload, last_refresh, generation = pipe.execute()
+        snapshot = CacheSnapshot.build(
+            int(generation or 0),
+            load_sources(payload) if payload else {},
+            self._parse_last_refresh(last_refresh),
+        )
+        # Concurrent readers may both decode; keep whichever is newer
+        if self._snapshot is None or self._snapshot.generation < snapshot.generation:
+            self._snapshot = snapshot
+        return snapshot
+
+    def snapshot_at(self, generation: int) -> Optional[CacheSnapshot]:
+        """Only the current generation is stored in Redis"""
+        snapshot = self.snapshot()
+        return snapshot if snapshot.generation == generation else None
+
     def update_source(self, source: NewsSource) -> None:
-        sources = self._load_sources()
-        sources[source.name] = source
-        self._store_sources(sources)
-        self._set_last_refresh(datetime.now(timezone.utc))
+        self._write(upsert_change(source, self.memory_budget), datetime.now(timezone.utc))
 
     def get_source(self, name: str) -> Optional[NewsSource]:
         sources = self._load_sources()
         return sources.get(name)
 
-    def get_all_sources(self) -> Dict[str, NewsSource]:
+    def remove_source(self, name: str) -> None:
+        self._write(removal_change(name), None)
+
+    def get_all_sources(self) -> Mapping[str, NewsSource]:
         return self._load_sources()
 
     def refresh(self) -> None:
         self._set_last_refresh(datetime.now(timezone.utc))
 
     def clear(self) -> None:
-        self.client.delete(self._sources_key)
-        self.client.delete(self._timestamp_key)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(self._sources_key, self._timestamp_key)
+        pipe.incr(self._generation_key)
+        pipe.execute()
 
     @property
     def active_sources_count(self) -> int:
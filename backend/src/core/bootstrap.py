@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from .settings import Settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCES_FILE = Path(__file__).resolve().parents[3] / "config/app/sources.yaml"
+DEFAULT_ENTITIES_FILE = Path(__file__).resolve().parents[3] / "config/app/entities.yaml"
+
+
+def _use_redis(settings: Settings) -> bool:
+    return settings.cache_backend.lower() == "redis" and bool(settings.redis_url)
+
+
+def build_memory_budget(settings: Settings):
+    from ..cache.memory_budget import MemoryBudget
+
+    return MemoryBudget(int(settings.cache_memory_budget_mb * 1024 * 1024), settings.cache_eviction_policy)
+
+
+def build_cache(settings: Settings):
+    from ..cache import InMemoryNewsCache
+
+    memory_budget = build_memory_budget(settings)
+
+    if _use_redis(settings):
+        try:
+            from ..cache.redis_cache import RedisNewsCache
+
+            logger.info("Using RedisNewsCache backend")
+            return RedisNewsCache(
+                url=settings.redis_url,
+                refresh_interval_minutes=settings.refresh_interval_minutes,
+                memory_budget=memory_budget,
+            )
+        except Exception as exc:
+            logger.warning("redis backend unavailable (%s); falling back to in-memory", exc)
+
+    return InMemoryNewsCache(
+        refresh_interval_minutes=settings.refresh_interval_minutes,
+        retained_generations=settings.cache_retained_generations,
+        memory_budget=memory_budget,
+    )
+
+
+def build_async_cache(settings: Settings, cache):
+    """Event-loop access to ``cache``: asyncio Redis with a shared pool, or the cache itself"""
+    from ..cache import AsyncCacheAdapter, InMemoryNewsCache
+
+    if _use_redis(settings) and not isinstance(cache, InMemoryNewsCache):
+        try:
+            from ..cache.async_redis_cache import AsyncRedisNewsCache
+
+            return AsyncRedisNewsCache(
+                url=settings.redis_url,
+                refresh_interval_minutes=settings.refresh_interval_minutes,
+                memory_budget=cache.memory_budget,
+                max_connections=settings.redis_max_connections,
+                pool_timeout=settings.redis_pool_timeout_seconds,
+            )
+        except Exception as exc:
+            logger.warning("asyncio redis client unavailable (%s); offloading cache calls to threads", exc)
+            return AsyncCacheAdapter(cache, offload=True)
+    return AsyncCacheAdapter(cache)
+
+
+def build_rate_limiter(settings: Settings, rate_per_minute: float, burst: int, namespace: str):
+    if rate_per_minute <= 0:
+        return None
+    from ..ratelimit import InMemoryRateLimiter
+
+    if _use_redis(settings):
+        try:
+            from ..ratelimit.redis_limiter import RedisRateLimiter
+
+            return RedisRateLimiter(
+                url=settings.redis_url,
+                rate_per_minute=rate_per_minute,
+                burst=burst,
+                namespace=namespace,
+            )
+        except Exception as exc:
+            logger.warning("redis rate limiter unavailable (%s); falling back to in-memory", exc)
+
+    return InMemoryRateLimiter(rate_per_minute=rate_per_minute, burst=burst)
+
+
+def build_trusted_proxies(settings: Settings):
+    """Networks whose X-Forwarded-For / X-Real-IP headers are believed"""
+    import ipaddress
+
+    networks = []
+    for entry in settings.trusted_proxies.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            networks.append(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            logger.warning("Ignoring invalid TRUSTED_PROXIES entry %r", entry)
+    return tuple(networks)
+
+
+def build_archive(settings: Settings):
+    if not settings.archive_enabled:
+        return None
+    from ..archive import SQLiteHeadlineArchive
+
+    logger.info("Archiving headlines to %s", settings.archive_path)
+    return SQLiteHeadlineArchive(settings.archive_path)
+
+
+def build_job_queue(settings: Settings, shared: bool = False):
+    """Fetch job queue in Redis when configured, else in process memory.
+
+    ``shared`` callers (API processes handing work to separate workers) get None
+    instead of a process-local queue nobody else could consume.
+    """
+    from ..jobs import InMemoryJobQueue
+
+    if _use_redis(settings):
+        try:
+            from ..jobs.redis_queue import RedisJobQueue
+
+            logger.info("Using RedisJobQueue for fetch jobs")
+            return RedisJobQueue(
+                url=settings.redis_url,
+                visibility_timeout_seconds=settings.job_visibility_timeout_seconds,
+            )
+        except Exception as exc:
+            logger.warning("redis job queue unavailable (%s)", exc)
+
+    if shared:
+        return None
+    return InMemoryJobQueue(visibility_timeout_seconds=settings.job_visibility_timeout_seconds)
+
+
+def build_tracer(settings: Settings):
+    """Span tracer exporting sampled traces to the log or an OTLP collector, if configured"""
+    from ..tracing import LoggingSpanExporter, OTLPHttpExporter, Tracer
+
+    exporter_name = settings.tracing_exporter.lower()
+    exporter = None
+    if exporter_name == "log":
+        exporter = LoggingSpanExporter(min_duration_ms=settings.tracing_log_min_ms)
+    elif exporter_name == "otlp":
+        logger.info("Exporting traces to %s", settings.otlp_endpoint)
+        exporter = OTLPHttpExporter(endpoint=settings.otlp_endpoint)
+    elif exporter_name != "none":
+        logger.warning("Unknown TRACING_EXPORTER %r; tracing disabled", settings.tracing_exporter)
+    return Tracer(sample_rate=settings.tracing_sample_rate, exporter=exporter)
+
+
+def build_http_transport(settings: Settings):
+    """Record/replay/fault transport for the fetch services, or None to fetch live"""
+    mode = settings.http_transport.lower()
+    if mode == "live":
+        return None
+    from ..services.http_transport import HttpTransport
+
+    logger.warning("HTTP transport in %s mode using cassettes in %s", mode, settings.http_cassette_dir)
+    return HttpTransport(
+        mode,
+        settings.http_cassette_dir,
+        latency_scale=settings.http_replay_latency_scale,
+        timeout_rate=settings.http_fault_timeout_rate,
+        error_rate=settings.http_fault_error_rate,
+        truncate_rate=settings.http_fault_truncate_rate,
+        seed=settings.http_fault_seed,
+    )
+
+
+def build_link_resolver(settings: Settings, transport=None):
+    """Redirect-link resolver with its persistent cache, or None when disabled"""
+    if not settings.link_resolution_enabled:
+        return None
+    from ..services.link_resolver import LinkCache, LinkResolver
+
+    try:
+        cache = LinkCache(
+            settings.link_cache_path or None,
+            max_entries=settings.link_cache_size,
+            negative_ttl_seconds=settings.link_negative_ttl_seconds,
+        )
+    except Exception as exc:
+        logger.warning("link cache at %s unavailable (%s); caching in memory only", settings.link_cache_path, exc)
+        cache = LinkCache(None, settings.link_cache_size, settings.link_negative_ttl_seconds)
+    return LinkResolver(
+        cache,
+        max_concurrency=settings.link_resolve_concurrency,
+        budget_seconds=settings.link_resolve_budget_seconds,
+        transport=transport,
+    )
+
+
+def build_news_service(settings: Settings, cache, archive=None, job_queue=None, async_cache=None):
+    from ..services.fetch_orchestrator import FetchOrchestrator
+    from ..services.entity_service import EntityService
+    from ..services.news_service import NewsService
+    from ..services.rss_service import RSSService
+    from ..services.scraping_service import ScrapingService
+    from ..services.source_registry import SourceRegistry
+    from ..services.stats_service import StatsService
+    from ..services.watchlist_service import WatchlistService
+
+    source_registry = SourceRegistry(settings.sources_file or DEFAULT_SOURCES_FILE)
+    transport = build_http_transport(settings)
+    return NewsService(
+        cache=cache,
+        rss_service=RSSService(transport=transport),
+        scraping_service=ScrapingService(transport=transport),
+        async_cache=async_cache,
+        archive=archive,
+        refresh_min_interval_seconds=settings.refresh_min_interval_seconds,
+        source_registry=source_registry,
+        orchestrator=FetchOrchestrator(
+            max_concurrency=settings.fetch_max_concurrency,
+            per_host_limit=settings.fetch_per_host_limit,
+        ),
+        job_queue=job_queue,
+        entity_service=EntityService.from_file(settings.entities_file or DEFAULT_ENTITIES_FILE),
+        link_resolver=build_link_resolver(settings, transport),
+        watchlist_service=WatchlistService(
+            settings.watchlists_path or None, max_watchlists=settings.watchlists_max
+        ),
+        stats_service=StatsService(settings.stats_bucket_seconds, settings.stats_retention_hours * 3600),
+    )
@@ -0,0 +1,253 @@
+"""Serving the built frontend directly from the backend, without nginx in front.
+
+``index.html`` is read once and served from memory with an ETag, so SPA navigations
+revalidate with a 304 instead of re-reading the file. Content-hashed build assets
+(``main.1a2b3c4d.js``) never change under the same name and are marked immutable;
+compressible assets are served from pre-compressed ``.br``/``.gz`` siblings, which
+are written at image build time (``python -m src.core.frontend_assets static``) or,
+when missing, at startup.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import stat
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - brotli optional
+    brotli = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+COMPRESSIBLE_SUFFIXES = frozenset({".js", ".css", ".html", ".svg", ".json", ".map", ".txt", ".xml", ".ico"})
+MIN_COMPRESS_BYTES = 1024
+
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.")
+# Preferred first
+_ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+
+def is_hashed_asset(path: str) -> bool:
+    """Build output whose file name carries a content hash, e.g. ``main.1a2b3c4d.js``"""
+    return bool(_HASHED_NAME.search(os.path.basename(path)))
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> frozenset:
+    """Content codings the client accepts, ignoring any with ``q=0``"""
+    accepted = set()
+    for part in (accept_encoding or "").split(","):
+        coding, *params = [piece.strip() for piece in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.lower())
+    return frozenset(accepted)
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _available_encodings() -> List[Tuple[str, str]]:
+    return [(encoding, suffix) for encoding, suffix in _ENCODINGS if encoding != "br" or brotli is not None]
+
+
+def precompress_directory(directory: str | Path) -> int:
+    """Write ``.br``/``.gz`` siblings for compressible files that lack an up-to-date one.
+
+    Files are replaced atomically, so several workers starting at once are safe. A
+    variant that would not save at least 10% is not written. Returns the number written.
+    """
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_SUFFIXES:
+                continue
+            source_stat = os.stat(path)
+            if source_stat.st_size < MIN_COMPRESS_BYTES:
+                continue
+            data = None
+            for encoding, suffix in _available_encodings():
+                target = path + suffix
+                try:
+                    if os.stat(target).st_mtime_ns >= source_stat.st_mtime_ns:
+                        continue
+                except FileNotFoundError:
+                    pass
+                if data is None:
+                    with open(path, "rb") as handle:
+                        data = handle.read()
+                compressed = _compress(data, encoding)
+                if len(compressed) > len(data) * 0.9:
+                    continue
+                fd, temporary = tempfile.mkstemp(dir=root, prefix=f".{name}.")
+                try:
+                    with os.fdopen(fd, "wb") as handle:
+                        handle.write(compressed)
+                    os.replace(temporary, target)
+                except BaseException:
+                    os.unlink(temporary)
+                    raise
+                written += 1
+    return written
+
+
+class FrontendShell:
+    """``index.html`` held in memory with an ETag and pre-compressed copies.
+
+    Browsers revalidate it on every navigation (it names the current hashed bundles),
+    which a matching ``If-None-Match`` answers with an empty 304.
+    """
+
+    def __init__(self, content: bytes) -> None:
+        digest = hashlib.sha256(content).hexdigest()[:20]
+        self._variants: Dict[Optional[str], Tuple[bytes, str]] = {None: (content, f'"{digest}"')}
+        for encoding, _ in _available_encodings():
+            compressed = _compress(content, encoding)
+            if len(compressed) < len(content):
+                self._variants[encoding] = (compressed, f'"{digest}-{encoding}"')
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["FrontendShell"]:
+        try:
+            return cls(path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def response(self, request: Request) -> Response:
+        accepted = accepted_encodings(request.headers.get("accept-encoding"))
+        encoding = next((encoding for encoding, _ in _ENCODINGS if encoding in accepted and encoding in self._variants), None)
+        body, etag = self._variants[encoding]
+        headers = {"ETag": etag, "Cache-Control": REVALIDATE, "Vary": "Accept-Encoding"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="text/html", headers=headers)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves ``.br``/``.gz`` siblings and long-lived cache headers.
+
+    Available variants are indexed once at startup, so choosing one costs no extra
+    filesystem calls per request. Hashed assets are ``immutable``; anything else must
+    be revalidated (the ETag still makes that a 304).
+    """
+
+    def __init__(self, *args, precompress: bool = False, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._variants: Dict[str, Dict[str, Tuple[str, os.stat_result]]] = {}
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        if precompress:
+            try:
+                written = precompress_directory(self.directory)
+                if written:
+                    logger.info("Pre-compressed %s static assets in %s", written, self.directory)
+            except OSError as exc:
+                logger.warning("Could not pre-compress static assets in %s: %s", self.directory, exc)
+        self._index_variants()
+
+    def _index_variants(self) -> None:
+        # Keyed like lookup_path's results, which are resolved paths
+        for root, _, files in os.walk(os.path.realpath(self.directory)):
+            for name in files:
+                for encoding, suffix in _ENCODINGS:
+                    if not name.endswith(suffix):
+                        continue
+                    original = os.path.join(root, name[: -len(suffix)])
+                    variant = os.path.join(root, name)
+                    try:
+                        original_stat, variant_stat = os.stat(original), os.stat(variant)
+                    except FileNotFoundError:
+                        continue
+                    # A variant older than its original is stale; serve the original
+                    if variant_stat.st_mtime_ns >= original_stat.st_mtime_ns:
+                        self._variants.setdefault(original, {})[encoding] = (variant, variant_stat)
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        variants = self._variants.get(full_path)
+        response = None
+        if variants:
+            accepted = accepted_encodings(request_headers.get("accept-encoding"))
+            for encoding, _ in _ENCODINGS:
+                if encoding in accepted and encoding in variants:
+                    variant_path, variant_stat = variants[encoding]
+                    response = FileResponse(
+                        variant_path,
+                        status_code=status_code,
+                        stat_result=variant_stat,
+                        method=scope["method"],
+                        # Typed as the original; the encoding is carried separately
+                        media_type=mimetypes.guess_type(full_path)[0] or "text/plain",
+                    )
+                    response.headers["Content-Encoding"] = encoding
+                    break
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, method=scope["method"])
+        if variants:
+            response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = IMMUTABLE if is_hashed_asset(full_path) else REVALIDATE
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        full_path, stat_result = super().lookup_path(path)
+        # Compressed siblings are an implementation detail, not addressable files
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode) and full_path.endswith((".br", ".gz")):
+            if full_path[:-3] in self._variants:
+                return "", None
+        return full_path, stat_result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write .br/.gz siblings for the built frontend")
+    parser.add_argument("directory", nargs="?", default="static")
+    args = parser.parse_args(argv)
+    if brotli is None:
+        logger.warning("brotli is not installed; writing .gz variants only")
+    written = precompress_directory(args.directory)
+    print(f"Pre-compressed {written} files in {args.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
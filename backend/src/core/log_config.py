@@ -0,0 +1,161 @@
+"""Process-wide logging: records are queued on the calling thread and formatted and
+written by a background listener, so request handlers and fetch threads never block on
+the log stream.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+# Arguments that render the same later and on another thread
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with time, level, logger, message and any ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread.
+
+    The stock handler merges ``msg % args`` before enqueueing, on the caller's thread.
+    Records whose arguments are all immutable scalars are queued as they are. Any
+    other argument (a list, a request, a lazily rendered object from a library
+    logger) could change before the listener gets to it, so those records are
+    merged here as the stock handler does. Tracebacks are always rendered eagerly,
+    while their frames are still meaningful.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args and not (
+            isinstance(record.args, tuple) and all(type(arg) in _SCALAR_TYPES for arg in record.args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: str = "INFO", fmt: str = "json", stream=None) -> QueueListener:
+    """Route all logging through a queue to one stream handler; safe to call again.
+
+    ``fmt`` is ``json`` for one JSON object per line, or a ``logging.Formatter``
+    format string for plain text lines.
+    """
+    global _listener
+    shutdown_logging()
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if fmt.strip().lower() == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(fmt if "%(" in fmt else logging.BASIC_FORMAT))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger()
+    # Replace a basicConfig handler or our own from an earlier call; leave any others
+    for existing in list(root.handlers):
+        if type(existing) is logging.StreamHandler or isinstance(existing, DeferredQueueHandler):
+            root.removeHandler(existing)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(level.upper())
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Drain queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+class RequestLogSampler:
+    """Decides which requests get an access-log line, by longest matching path prefix.
+
+    ``rates`` maps path prefixes to the fraction of requests logged; ``*`` sets the
+    default. Server errors are always logged.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None) -> None:
+        rates = dict(rates or {})
+        self.default_rate = rates.pop("*", 1.0)
+        self._prefixes: List[Tuple[str, float]] = sorted(rates.items(), key=lambda item: -len(item[0]))
+
+    @classmethod
+    def parse(cls, spec: str) -> "RequestLogSampler":
+        """Build from ``"/health=0,/api/news=0.1,*=1"``"""
+        rates: Dict[str, float] = {}
+        for part in spec.split(","):
+            prefix, sep, rate = part.strip().partition("=")
+            if not sep:
+                continue
+            try:
+                rates[prefix.strip()] = min(max(float(rate), 0.0), 1.0)
+            except ValueError:
+                logging.getLogger(__name__).warning("Ignoring invalid log sample rate %r", part)
+        return cls(rates)
+
+    def rate_for(self, path: str) -> float:
+        for prefix, rate in self._prefixes:
+            if path.startswith(prefix):
+                return rate
+        return self.default_rate
+
+    def should_log(self, path: str, status_code: int) -> bool:
+        if status_code >= 500:
+            return True
+        rate = self.rate_for(path)
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+def log_request(
+    logger: logging.Logger, method: str, path: str, status_code: int, started: float
+) -> None:
+    """One access-log record with the request fields as structured extras"""
+    duration_ms = (time.perf_counter() - started) * 1000
+    logger.info(
+        "%s %s %s %.1fms",
+        method,
+        path,
+        status_code,
+        duration_ms,
+        extra={"method": method, "path": path, "status": status_code, "duration_ms": round(duration_ms, 2)},
+    )
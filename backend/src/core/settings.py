@@ -23,15 +23,68 @@ class Settings(BaseSettings):
     """Application configuration loaded from environment."""
 
     environment: str = Field(default="local", alias="ENVIRONMENT")
+    log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    log_format: str = Field(default="json", alias="LOG_FORMAT")
+    log_request_sample_rates: str = Field(default="/health=0,*=1", alias="LOG_REQUEST_SAMPLE_RATES")
     cors_origins: Union[str, List[str]] = Field(
         default_factory=lambda: ["http://localhost:3000"], alias="CORS_ORIGINS"
     )
     refresh_interval_minutes: int = Field(default=15, alias="REFRESH_INTERVAL_MINUTES")
     cache_ttl_minutes: int = Field(default=15, alias="CACHE_TTL_MINUTES")
     cache_backend: str = Field(default="memory", alias="CACHE_BACKEND")
+    cache_retained_generations: int = Field(default=32, alias="CACHE_RETAINED_GENERATIONS")
+    cache_memory_budget_mb: float = Field(default=0, alias="CACHE_MEMORY_BUDGET_MB")
+    cache_eviction_policy: str = Field(default="oldest", alias="CACHE_EVICTION_POLICY")
     redis_url: str | None = Field(default=None, alias="REDIS_URL")
+    redis_max_connections: int = Field(default=16, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout_seconds: float = Field(default=2.0, alias="REDIS_POOL_TIMEOUT_SECONDS")
     scheduler_enabled: bool = Field(default=True, alias="SCHEDULER_ENABLED")
     scheduler_initial_delay_seconds: int = Field(default=5, alias="SCHEDULER_INITIAL_DELAY_SECONDS")
+    scheduler_jitter_seconds: float = Field(default=30, alias="SCHEDULER_JITTER_SECONDS")
+    scheduler_missed_tick_policy: str = Field(default="skip", alias="SCHEDULER_MISSED_TICK_POLICY")
+    refresh_min_interval_seconds: int = Field(default=60, alias="REFRESH_MIN_INTERVAL_SECONDS")
+    refresh_client_rate_per_minute: float = Field(default=2, alias="REFRESH_CLIENT_RATE_PER_MINUTE")
+    refresh_client_burst: int = Field(default=3, alias="REFRESH_CLIENT_BURST")
+    refresh_global_rate_per_minute: float = Field(default=10, alias="REFRESH_GLOBAL_RATE_PER_MINUTE")
+    refresh_global_burst: int = Field(default=10, alias="REFRESH_GLOBAL_BURST")
+    trusted_proxies: str = Field(default="127.0.0.1,::1", alias="TRUSTED_PROXIES")
+    fetch_max_concurrency: int = Field(default=8, alias="FETCH_MAX_CONCURRENCY")
+    fetch_per_host_limit: int = Field(default=4, alias="FETCH_PER_HOST_LIMIT")
+    sources_file: str | None = Field(default=None, alias="SOURCES_FILE")
+    sources_reload_seconds: int = Field(default=30, alias="SOURCES_RELOAD_SECONDS")
+    entities_file: str | None = Field(default=None, alias="ENTITIES_FILE")
+    link_resolution_enabled: bool = Field(default=True, alias="LINK_RESOLUTION_ENABLED")
+    link_cache_path: str = Field(default="data/links.sqlite3", alias="LINK_CACHE_PATH")
+    link_cache_size: int = Field(default=10000, alias="LINK_CACHE_SIZE")
+    link_negative_ttl_seconds: float = Field(default=3600, alias="LINK_NEGATIVE_TTL_SECONDS")
+    link_resolve_concurrency: int = Field(default=4, alias="LINK_RESOLVE_CONCURRENCY")
+    link_resolve_budget_seconds: float = Field(default=5, alias="LINK_RESOLVE_BUDGET_SECONDS")
+    archive_enabled: bool = Field(default=False, alias="ARCHIVE_ENABLED")
+    archive_path: str = Field(default="data/headlines.sqlite3", alias="ARCHIVE_PATH")
+    watchlists_path: str = Field(default="data/watchlists.json", alias="WATCHLISTS_PATH")
+    watchlists_max: int = Field(default=100, alias="WATCHLISTS_MAX")
+    watchlist_write_rate_per_minute: float = Field(default=10, alias="WATCHLIST_WRITE_RATE_PER_MINUTE")
+    watchlist_write_burst: int = Field(default=10, alias="WATCHLIST_WRITE_BURST")
+    stats_bucket_seconds: int = Field(default=300, alias="STATS_BUCKET_SECONDS")
+    stats_retention_hours: int = Field(default=48, alias="STATS_RETENTION_HOURS")
+    http_transport: str = Field(default="live", alias="HTTP_TRANSPORT")
+    http_cassette_dir: str = Field(default="data/cassettes", alias="HTTP_CASSETTE_DIR")
+    http_replay_latency_scale: float = Field(default=0, alias="HTTP_REPLAY_LATENCY_SCALE")
+    http_fault_timeout_rate: float = Field(default=0, alias="HTTP_FAULT_TIMEOUT_RATE")
+    http_fault_error_rate: float = Field(default=0, alias="HTTP_FAULT_ERROR_RATE")
+    http_fault_truncate_rate: float = Field(default=0, alias="HTTP_FAULT_TRUNCATE_RATE")
+    http_fault_seed: int = Field(default=0, alias="HTTP_FAULT_SEED")
+    fetch_mode: str = Field(default="inline", alias="FETCH_MODE")
+    worker_concurrency: int = Field(default=4, alias="WORKER_CONCURRENCY")
+    job_max_attempts: int = Field(default=3, alias="JOB_MAX_ATTEMPTS")
+    job_retry_backoff_seconds: float = Field(default=10, alias="JOB_RETRY_BACKOFF_SECONDS")
+    job_visibility_timeout_seconds: float = Field(default=120, alias="JOB_VISIBILITY_TIMEOUT_SECONDS")
+    tracing_exporter: str = Field(default="none", alias="TRACING_EXPORTER")
+    tracing_sample_rate: float = Field(default=0.05, alias="TRACING_SAMPLE_RATE")
+    tracing_log_min_ms: float = Field(default=0, alias="TRACING_LOG_MIN_MS")
+    otlp_endpoint: str = Field(default="http://localhost:4318", alias="OTLP_ENDPOINT")
+    server_timing_enabled: bool = Field(default=False, alias="SERVER_TIMING_ENABLED")
+    frontend_precompress: bool = Field(default=True, alias="FRONTEND_PRECOMPRESS")
 
     model_config = SettingsConfigDict(env_file=None, case_sensitive=False)
 
@@ -0,0 +1,147 @@
+"""Cold-start report: ``python -m src.main --profile-startup``.
+
+Boots the app in a fresh interpreter with ``-X importtime``, runs the lifespan startup
+and serves one request through the ASGI interface, then prints JSON with the time spent
+importing ``src.main``, in startup and on the first request, plus the slowest modules.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Runs in the child interpreter; only stdlib is imported before src.main is timed
+_CHILD = r"""
+import asyncio, json, sys, time
+
+t0 = time.perf_counter()
+from src.main import app
+t1 = time.perf_counter()
+
+
+async def first_request(path):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"startup")], "client": ("127.0.0.1", 0),
+        "server": ("startup", 80),
+    }
+    status = {}
+    requested = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body"):
+            done.set()
+
+    await app(scope, receive, send)
+    return status.get("code")
+
+
+async def main(path):
+    lifespan = app.router.lifespan_context(app)
+    started = time.perf_counter()
+    await lifespan.__aenter__()
+    ready = time.perf_counter()
+    status = await first_request(path)
+    served = time.perf_counter()
+    await lifespan.__aexit__(None, None, None)
+    return started, ready, served, status
+
+
+started, ready, served, status = asyncio.run(main(sys.argv[1]))
+print(json.dumps({
+    "import_seconds": t1 - t0,
+    "lifespan_startup_seconds": ready - started,
+    "first_request_seconds": served - ready,
+    "first_request_status": status,
+}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Rows of ``-X importtime`` output as dicts with self/cumulative seconds"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_seconds": int(self_us) / 1e6,
+                "cumulative_seconds": int(cumulative_us) / 1e6,
+            }
+        )
+    return modules
+
+
+def profile_startup(path: str = "/health", top: int = 15) -> Dict[str, Any]:
+    env = dict(os.environ)
+    env.setdefault("SCHEDULER_ENABLED", "false")
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, path],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"startup failed:\n{result.stderr[-2000:]}")
+
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = parse_importtime(result.stderr)
+    first_party = [m for m in modules if m["module"] == "src" or m["module"].startswith("src.")]
+
+    report = {
+        "process_wall_seconds": wall,
+        "time_to_first_response_seconds": timings["import_seconds"]
+        + timings["lifespan_startup_seconds"]
+        + timings["first_request_seconds"],
+        **timings,
+        "modules_imported": len(modules),
+        "slowest_modules_self": sorted(modules, key=itemgetter("self_seconds"), reverse=True)[:top],
+        "slowest_first_party_cumulative": sorted(
+            first_party, key=itemgetter("cumulative_seconds"), reverse=True
+        )[:top],
+    }
+    return _rounded(report)
+
+
+def _rounded(value: Any) -> Any:
+    if isinstance(value, float):
+        return round(value, 4)
+    if isinstance(value, dict):
+        return {key: _rounded(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rounded(item) for item in value]
+    return value
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.main --profile-startup")
+    parser.add_argument("--path", default="/health", help="path of the first request")
+    parser.add_argument("--top", type=int, default=15, help="modules to list")
+    args = parser.parse_args(argv)
+    print(json.dumps(profile_startup(args.path, args.top), indent=2))
+    return 0
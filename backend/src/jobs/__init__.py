@@ -0,0 +1,13 @@
+from .base import FetchJob, JobQueue
+from .in_memory import InMemoryJobQueue
+
+__all__ = ["FetchJob", "JobQueue", "InMemoryJobQueue", "RedisJobQueue"]
+
+
+def __getattr__(name):
+    # Imported on first use so the redis client library only loads when it is configured
+    if name == "RedisJobQueue":
+        from .redis_queue import RedisJobQueue
+
+        return RedisJobQueue
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
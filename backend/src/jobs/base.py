@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Protocol
+
+
+@dataclass
+class FetchJob:
+    """A request to fetch one source; ``receipt`` identifies the delivery to acknowledge."""
+
+    source: str
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+    receipt: str = ""
+
+
+class JobQueue(Protocol):
+    """Protocol for fetch job queues shared by API processes and workers."""
+
+    def enqueue(self, source: str) -> bool:
+        """Queue a fetch of ``source`` unless one is already pending; return whether queued."""
+        ...
+
+    def reserve(self, consumer: str, timeout: float) -> Optional[FetchJob]:
+        """Lease the next job, waiting up to ``timeout`` seconds.
+
+        A leased job that is not acked or retried within the visibility timeout is
+        delivered again, so a crashed worker never loses work.
+        """
+        ...
+
+    def ack(self, job: FetchJob) -> None:
+        """Mark a job done and allow the source to be queued again."""
+        ...
+
+    def retry(self, job: FetchJob, delay: float) -> None:
+        """Release a failed job to run again after ``delay`` seconds."""
+        ...
+
+    def claim_cycle(self, interval_seconds: float) -> bool:
+        """Return True for at most one caller per interval; used to schedule refresh cycles."""
+        ...
+
+    def pending(self) -> int:
+        """Jobs queued, delayed or leased."""
+        ...
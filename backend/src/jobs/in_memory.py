@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import replace
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from .base import FetchJob
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryJobQueue:
+    """Process-local job queue for a single worker process and for tests."""
+
+    def __init__(self, visibility_timeout_seconds: float = 120.0) -> None:
+        self.visibility_timeout = visibility_timeout_seconds
+        self._ready: Deque[FetchJob] = deque()
+        self._delayed: List[Tuple[float, int, FetchJob]] = []
+        self._leased: Dict[str, Tuple[float, FetchJob]] = {}
+        self._queued: Set[str] = set()
+        self._receipts = itertools.count(1)
+        self._next_cycle = 0.0
+        self._cond = threading.Condition()
+
+    def enqueue(self, source: str) -> bool:
+        with self._cond:
+            if source in self._queued:
+                return False
+            self._queued.add(source)
+            self._ready.append(FetchJob(source))
+            self._cond.notify()
+            return True
+
+    def reserve(self, consumer: str, timeout: float) -> Optional[FetchJob]:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._promote(now)
+                if self._ready:
+                    job = self._ready.popleft()
+                    job.receipt = str(next(self._receipts))
+                    self._leased[job.receipt] = (now + self.visibility_timeout, job)
+                    return job
+                if now >= deadline:
+                    return None
+                self._cond.wait(min(deadline, self._next_wakeup()) - now)
+
+    def ack(self, job: FetchJob) -> None:
+        with self._cond:
+            if self._leased.pop(job.receipt, None) is not None:
+                self._queued.discard(job.source)
+
+    def retry(self, job: FetchJob, delay: float) -> None:
+        with self._cond:
+            if self._leased.pop(job.receipt, None) is None:
+                return  # lease expired and the job was already redelivered
+            retried = replace(job, attempts=job.attempts + 1, receipt="")
+            heapq.heappush(
+                self._delayed, (time.monotonic() + delay, next(self._receipts), retried)
+            )
+            self._cond.notify()
+
+    def claim_cycle(self, interval_seconds: float) -> bool:
+        with self._cond:
+            now = time.monotonic()
+            if now < self._next_cycle:
+                return False
+            self._next_cycle = now + interval_seconds
+            return True
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._ready) + len(self._delayed) + len(self._leased)
+
+    # Helpers ---------------------------------------------------------------
+    def _promote(self, now: float) -> None:
+        """Move due retries and expired leases back onto the ready queue"""
+        while self._delayed and self._delayed[0][0] <= now:
+            self._ready.append(heapq.heappop(self._delayed)[2])
+        for receipt, (expires, job) in list(self._leased.items()):
+            if expires <= now:
+                del self._leased[receipt]
+                logger.warning("Lease on %s job expired; redelivering", job.source)
+                self._ready.append(replace(job, attempts=job.attempts + 1, receipt=""))
+
+    def _next_wakeup(self) -> float:
+        times = [expires for expires, _ in self._leased.values()]
+        if self._delayed:
+            times.append(self._delayed[0][0])
+        return min(times, default=float("inf"))
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import redis  # type: ignore
+except ImportError:  # pragma: no cover - redis optional
+    redis = None  # type: ignore
+
+from .base import FetchJob
+
+logger = logging.getLogger(__name__)
+
+# Queue a job only if the source has no pending job; marker and entry are written together
+_ENQUEUE_SCRIPT = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[2]) then
+  redis.call('XADD', KEYS[2], '*', 'source', ARGV[1], 'attempts', 0, 'enqueued_at', ARGV[3])
+  return 1
+end
+return 0
+"""
+
+# Move retries whose delay has elapsed from the sorted set onto the stream
+_PROMOTE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 100)
+for _, payload in ipairs(due) do
+  local job = cjson.decode(payload)
+  redis.call('ZREM', KEYS[1], payload)
+  redis.call('XADD', KEYS[2], '*', 'source', job.source, 'attempts', job.attempts,
+             'enqueued_at', job.enqueued_at)
+end
+return #due
+"""
+
+
+class RedisJobQueue:
+    """Job queue on a Redis stream with a consumer group shared by every worker.
+
+    Each entry is delivered to one consumer and stays in the group's pending list until
+    acked; entries idle longer than the visibility timeout are claimed by the next worker
+    that asks. Retries wait in a sorted set until their delay has elapsed.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        namespace: str = "news_jobs",
+        visibility_timeout_seconds: float = 120.0,
+        dedupe_ttl_seconds: int = 3600,
+    ) -> None:
+        if redis is None:
+            raise RuntimeError("redis package is required for RedisJobQueue")
+
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.namespace = namespace.rstrip(":")
+        self.visibility_timeout = visibility_timeout_seconds
+        self.dedupe_ttl = dedupe_ttl_seconds
+        self.group = "fetchers"
+        self._enqueue = self.client.register_script(_ENQUEUE_SCRIPT)
+        self._promote = self.client.register_script(_PROMOTE_SCRIPT)
+        self._ensure_group()
+
+    # Keys -----------------------------------------------------------------
+    @property
+    def _stream_key(self) -> str:
+        return f"{self.namespace}:stream"
+
+    @property
+    def _delayed_key(self) -> str:
+        return f"{self.namespace}:delayed"
+
+    @property
+    def _cycle_key(self) -> str:
+        return f"{self.namespace}:cycle"
+
+    def _queued_key(self, source: str) -> str:
+        return f"{self.namespace}:queued:{source}"
+
+    def _ensure_group(self) -> None:
+        try:
+            self.client.xgroup_create(self._stream_key, self.group, id="0", mkstream=True)
+        except redis.ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    # Protocol implementation ----------------------------------------------
+    def enqueue(self, source: str) -> bool:
+        queued = self._enqueue(
+            keys=[self._queued_key(source), self._stream_key],
+            args=[source, self.dedupe_ttl, time.time()],
+        )
+        return bool(queued)
+
+    def reserve(self, consumer: str, timeout: float) -> Optional[FetchJob]:
+        self._promote(keys=[self._delayed_key, self._stream_key], args=[time.time()])
+
+        job = self._claim_stale(consumer)
+        if job is not None:
+            return job
+
+        reply = self.client.xreadgroup(
+            self.group,
+            consumer,
+            {self._stream_key: ">"},
+            count=1,
+            block=max(1, int(timeout * 1000)),
+        )
+        for _, messages in reply or []:
+            for message_id, fields in messages:
+                return self._to_job(message_id, fields)
+        return None
+
+    def ack(self, job: FetchJob) -> None:
+        pipe = self.client.pipeline()
+        pipe.xack(self._stream_key, self.group, job.receipt)
+        pipe.xdel(self._stream_key, job.receipt)
+        pipe.delete(self._queued_key(job.source))
+        pipe.execute()
+
+    def retry(self, job: FetchJob, delay: float) -> None:
+        payload = json.dumps(
+            {"source": job.source, "attempts": job.attempts + 1, "enqueued_at": job.enqueued_at}
+        )
+        pipe = self.client.pipeline()
+        pipe.xack(self._stream_key, self.group, job.receipt)
+        pipe.xdel(self._stream_key, job.receipt)
+        pipe.zadd(self._delayed_key, {payload: time.time() + delay})
+        pipe.execute()
+
+    def claim_cycle(self, interval_seconds: float) -> bool:
+        return bool(
+            self.client.set(self._cycle_key, "1", nx=True, px=max(1, int(interval_seconds * 1000)))
+        )
+
+    def pending(self) -> int:
+        pipe = self.client.pipeline()
+        pipe.xlen(self._stream_key)
+        pipe.zcard(self._delayed_key)
+        return sum(pipe.execute())
+
+    # Helpers ---------------------------------------------------------------
+    def _claim_stale(self, consumer: str) -> Optional[FetchJob]:
+        """Take over one entry whose consumer stopped acking within the visibility timeout"""
+        reply = self.client.xautoclaim(
+            self._stream_key,
+            self.group,
+            consumer,
+            min_idle_time=int(self.visibility_timeout * 1000),
+            start_id="0-0",
+            count=1,
+        )
+        for message_id, fields in reply[1]:
+            if not fields:  # entry deleted while pending
+                continue
+            job = self._to_job(message_id, fields)
+            # Each redelivery of a stalled entry counts as a failed attempt
+            pending = self.client.xpending_range(
+                self._stream_key, self.group, min=message_id, max=message_id, count=1
+            )
+            if pending:
+                job.attempts += pending[0]["times_delivered"] - 1
+            logger.warning("Reclaimed stalled %s job (attempt %s)", job.source, job.attempts + 1)
+            return job
+        return None
+
+    @staticmethod
+    def _to_job(message_id: str, fields: Dict[str, Any]) -> FetchJob:
+        return FetchJob(
+            source=fields["source"],
+            attempts=int(fields.get("attempts", 0)),
+            enqueued_at=float(fields.get("enqueued_at", 0.0)),
+            receipt=message_id,
+        )
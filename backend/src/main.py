@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-import os
 import time
+from datetime import timezone
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -10,13 +10,32 @@ from dotenv import load_dotenv
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
 
-from .api import news_routes, refresh_routes, sources_routes, status_routes
-from .cache import InMemoryNewsCache
-from .core.settings import Settings, get_settings
+from .api import (
+    archive_routes,
+    news_routes,
+    refresh_routes,
+    sources_routes,
+    stats_routes,
+    status_routes,
+    watchlist_routes,
+)
+from .core.bootstrap import (
+    build_archive,
+    build_async_cache,
+    build_cache,
+    build_job_queue,
+    build_news_service,
+    build_rate_limiter,
+    build_tracer,
+    build_trusted_proxies,
+)
+from .core.frontend_assets import FrontendShell, PrecompressedStaticFiles
+from .core.log_config import RequestLogSampler, configure_logging, log_request
+from .core.settings import get_settings
 from .services.news_service import NewsService
 from .services.scheduler import RefreshScheduler
+from .tracing import Tracer, get_tracer, server_timing_header, set_tracer
 
 BASE_DIR = Path(__file__).resolve().parent
 REPO_ROOT = BASE_DIR.parent.parent
@@ -32,26 +51,11 @@ def load_environment() -> None:
 
 load_environment()
 
-logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+_settings = get_settings()
+configure_logging(_settings.log_level, _settings.log_format)
 logger = logging.getLogger(__name__)
-
-
-def _build_cache(settings: Settings) -> InMemoryNewsCache:
-    from .cache import InMemoryNewsCache
-
-    if settings.cache_backend.lower() == "redis" and settings.redis_url:
-        try:
-            from .cache.redis_cache import RedisNewsCache
-
-            logger.info("Using RedisNewsCache backend")
-            return RedisNewsCache(
-                url=settings.redis_url,
-                refresh_interval_minutes=settings.refresh_interval_minutes,
-            )
-        except Exception as exc:
-            logger.warning("redis backend unavailable (%s); falling back to in-memory", exc)
-
-    return InMemoryNewsCache(refresh_interval_minutes=settings.refresh_interval_minutes)
+access_logger = logging.getLogger("src.access")
+request_log_sampler = RequestLogSampler.parse(_settings.log_request_sample_rates)
 
 
 def _ensure_static_dir() -> None:
@@ -61,28 +65,79 @@ def _ensure_static_dir() -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     settings = get_settings()
-    cache = _build_cache(settings)
-    news_service = NewsService(cache=cache)
+    tracer = build_tracer(settings)
+    set_tracer(tracer)
+    cache = build_cache(settings)
+    archive = build_archive(settings)
+    job_queue = None
+    if settings.fetch_mode.lower() == "queue":
+        job_queue = build_job_queue(settings, shared=True)
+        if job_queue is None:
+            logger.warning("FETCH_MODE=queue needs a Redis job queue; fetching in-process")
+    news_service = build_news_service(
+        settings,
+        cache=cache,
+        archive=archive,
+        job_queue=job_queue,
+        async_cache=build_async_cache(settings, cache),
+    )
+    source_registry = news_service.source_registry
+    source_registry.subscribe(news_service.apply_source_changes)
+    source_registry.start_watching(settings.sources_reload_seconds)
 
     scheduler = None
     if settings.scheduler_enabled and settings.refresh_interval_minutes > 0:
         scheduler = RefreshScheduler(
-            refresh_fn=news_service.fetch_all_news,
+            refresh_fn=news_service.refresh_cycle,
             interval_seconds=settings.refresh_interval_minutes * 60,
             initial_delay_seconds=settings.scheduler_initial_delay_seconds,
+            jitter_seconds=settings.scheduler_jitter_seconds,
+            missed_tick_policy=settings.scheduler_missed_tick_policy,
+            cancel_fn=news_service.cancel_refreshes,
         )
         scheduler.start()
 
     app.state.settings = settings
     app.state.news_service = news_service
     app.state.cache = cache
+    app.state.archive = archive
+    app.state.source_registry = source_registry
+    app.state.job_queue = job_queue
+    app.state.refresh_client_limiter = build_rate_limiter(
+        settings,
+        settings.refresh_client_rate_per_minute,
+        settings.refresh_client_burst,
+        "news_ratelimit:refresh_client",
+    )
+    app.state.refresh_global_limiter = build_rate_limiter(
+        settings,
+        settings.refresh_global_rate_per_minute,
+        settings.refresh_global_burst,
+        "news_ratelimit:refresh_global",
+    )
+    app.state.watchlist_write_limiter = build_rate_limiter(
+        settings,
+        settings.watchlist_write_rate_per_minute,
+        settings.watchlist_write_burst,
+        "news_ratelimit:watchlist_write",
+    )
+    app.state.trusted_proxies = build_trusted_proxies(settings)
     app.state.scheduler = scheduler
+    app.state.server_timing = settings.server_timing_enabled
 
     try:
         yield
     finally:
         if scheduler:
-            scheduler.stop()
+            await scheduler.stop()
+        source_registry.stop_watching()
+        if archive:
+            archive.close()
+        if news_service.link_resolver:
+            news_service.link_resolver.close()
+        await news_service.async_cache.close()
+        tracer.shutdown()
+        set_tracer(Tracer())
 
 
 app = FastAPI(
@@ -97,15 +152,25 @@ app.include_router(news_routes.router, prefix="/api")
 app.include_router(sources_routes.router, prefix="/api")
 app.include_router(status_routes.router, prefix="/api")
 app.include_router(refresh_routes.router, prefix="/api")
+app.include_router(archive_routes.router, prefix="/api")
+app.include_router(watchlist_routes.router, prefix="/api")
+app.include_router(stats_routes.router, prefix="/api")
 
 _ensure_static_dir()
-if STATIC_ASSETS_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(STATIC_ASSETS_DIR)), name="frontend-static")
-else:
-    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="frontend-static")
+# The SPA shell is served from memory; hashed bundles with immutable caching and
+# pre-compressed variants (see core.frontend_assets)
+frontend_shell = FrontendShell.load(STATIC_DIR / "index.html")
+app.mount(
+    "/static",
+    PrecompressedStaticFiles(
+        directory=str(STATIC_ASSETS_DIR if STATIC_ASSETS_DIR.exists() else STATIC_DIR),
+        precompress=_settings.frontend_precompress,
+    ),
+    name="frontend-static",
+)
 
 # Add CORS middleware for frontend communication
-cors_origins = get_settings().cors_origin_list or ["https://news.jechua.com"]
+cors_origins = _settings.cors_origin_list or ["https://news.jechua.com"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
@@ -114,26 +179,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add request logging middleware
+# Time each request's phases; reported in Server-Timing and exported when sampled
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    server_timing = getattr(request.app.state, "server_timing", False)
+    span = get_tracer().start_trace(
+        f"{request.method} {request.url.path}",
+        force=server_timing,
+        **{"http.method": request.method, "http.target": request.url.path},
+    )
+    with span:
+        response = await call_next(request)
+        span.set_attribute("http.status_code", response.status_code)
+    if server_timing and span.recording:
+        response.headers["Server-Timing"] = server_timing_header(span)
+    return response
+
+# Access log: one sampled, structured record per request, written off the request path
 @app.middleware("http")
 async def log_requests(request, call_next):
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"Request: {request.method} {request.url}")
-    
+    started = time.perf_counter()
     response = await call_next(request)
-    
-    # Log response
-    process_time = time.time() - start_time
-    logger.info(f"Response: {response.status_code} - {process_time:.4f}s")
-    
+    path = request.scope["path"]
+    if access_logger.isEnabledFor(logging.INFO) and request_log_sampler.should_log(path, response.status_code):
+        log_request(access_logger, request.method, path, response.status_code, started)
     return response
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    logger.error(f"Unhandled exception: {exc}")
+    logger.error("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -145,10 +220,9 @@ async def global_exception_handler(request, exc):
     )
 
 @app.get("/", include_in_schema=False)
-async def serve_frontend_root():
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+async def serve_frontend_root(request: Request):
+    if frontend_shell is not None:
+        return frontend_shell.response(request)
     return {
         "message": "Financial News Aggregator API",
         "documentation": "/docs",
@@ -162,9 +236,16 @@ async def api_index():
         "version": "1.0.0",
         "endpoints": {
             "news": "/api/news",
+            "news_timeline": "/api/news/timeline",
+            "cache_memory": "/api/cache/memory",
+            "watchlists": "/api/watchlists",
+            "stats": "/api/stats",
+            "news_export": "/api/news/export",
             "sources": "/api/sources",
             "source_status": "/api/sources/{source_name}/status",
             "refresh": "/api/refresh",
+            "archive": "/api/archive/headlines",
+            "archive_search": "/api/archive/search",
             "health": "/health",
             "metrics": "/metrics",
         },
@@ -175,20 +256,24 @@ async def api_index():
 @app.get("/health")
 async def health_check(request: Request):
     """Detailed health check endpoint."""
-    cache = getattr(request.app.state, "cache", None)
     scheduler = getattr(request.app.state, "scheduler", None)
+    news_service = getattr(request.app.state, "news_service", None)
+    # One awaited cache read; Redis round trips never block the event loop
+    overview = await news_service.cache_overview() if news_service else None
 
     return {
         "status": "healthy",
         "timestamp": time.time(),
         "service": "news-aggregator-api",
         "cache": {
-            "status": getattr(cache, "cache_status", "unknown"),
-            "last_refresh": getattr(cache, "last_refresh", None).isoformat() if getattr(cache, "last_refresh", None) else None,
+            "status": overview["status"] if overview else "unknown",
+            "last_refresh": overview["last_refresh"].isoformat() if overview else None,
+            "memory": overview["memory"] if overview else {},
         },
         "scheduler": {
             "enabled": bool(scheduler),
             "interval_seconds": getattr(request.app.state.settings, "refresh_interval_minutes", 0) * 60,
+            **(scheduler.stats() if scheduler else {}),
         },
     }
 
@@ -197,12 +282,12 @@ async def health_check(request: Request):
 async def metrics(request: Request):
     """Expose lightweight service metrics."""
     news_service: NewsService = request.app.state.news_service
-    data = news_service.fetch_all_news()
+    overview = await news_service.cache_overview()
     return {
-        "total_sources": data["total_sources"],
-        "active_sources": data["active_sources"],
-        "cache_status": data["cache_status"],
-        "last_updated": data["last_updated"],
+        "total_sources": overview["total_sources"],
+        "active_sources": overview["active_sources"],
+        "cache_status": overview["status"],
+        "last_updated": overview["last_refresh"].astimezone(timezone.utc).isoformat().replace('+00:00', 'Z'),
     }
 
 
@@ -218,10 +303,19 @@ async def favicon():
 
 
 @app.get("/{full_path:path}", include_in_schema=False)
-async def frontend_catchall(full_path: str):
+async def frontend_catchall(full_path: str, request: Request):
     if full_path.startswith(("api", "health", "metrics")):
         raise HTTPException(status_code=404)
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    if frontend_shell is not None:
+        return frontend_shell.response(request)
     raise HTTPException(status_code=404)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--profile-startup" in sys.argv[1:]:
+        from .core.startup_profile import main as profile_startup
+
+        raise SystemExit(profile_startup([arg for arg in sys.argv[1:] if arg != "--profile-startup"]))
+    sys.exit("Serve with `uvicorn src.main:app`; `python -m src.main --profile-startup` reports cold-start timings")
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
+from .trusted import construct_trusted
 
 
 class NewsHeadline(BaseModel):
@@ -10,6 +11,9 @@ class NewsHeadline(BaseModel):
     published_at: datetime = Field(..., description="Publication timestamp")
     source: str = Field(..., description="Source name")
     fetched_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="When this headline was fetched (UTC)")
+    cluster_id: Optional[str] = Field(None, description="Identifier shared by near-duplicate headlines across sources")
+    tickers: List[str] = Field(default_factory=list, description="Ticker symbols mentioned in the title")
+    entities: List[str] = Field(default_factory=list, description="Institutions, indices and assets mentioned in the title")
 
     @field_validator('title')
     def validate_title(cls, v):
@@ -43,6 +47,20 @@ class NewsHeadline(BaseModel):
             raise ValueError("Source cannot be empty")
         return v.strip()
 
+    @classmethod
+    def from_trusted(cls, rows: List[Dict[str, Any]]) -> List["NewsHeadline"]:
+        """Rebuild headlines from our own ``model_dump(mode="json")`` output.
+
+        Validation already ran at ingest; re-running it would cost a ``datetime.now()``
+        per headline and reject cached headlines once they age past 30 days. Data from
+        the network must still go through the constructor or ``model_validate``.
+        """
+        parse = datetime.fromisoformat
+        for row in rows:
+            row["published_at"] = parse(row["published_at"])
+            row["fetched_at"] = parse(row["fetched_at"])
+        return construct_trusted(cls, rows)
+
 
 class NewsHeadlineResponse(BaseModel):
     """API response model for news headlines"""
@@ -50,3 +68,6 @@ class NewsHeadlineResponse(BaseModel):
     link: str
     published_at: str  # ISO 8601 format
     source: str
+    cluster_id: Optional[str] = None
+    tickers: List[str] = []
+    entities: List[str] = []
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from pydantic import BaseModel, Field, field_validator
 from .news_headline import NewsHeadline
+from .trusted import construct_trusted
 
 
 class NewsSource(BaseModel):
@@ -11,7 +12,10 @@ class NewsSource(BaseModel):
     fallback_url: str = Field(..., description="Fallback scraping URL")
     enabled: bool = Field(True, description="Whether the source is active")
     max_stories: int = Field(50, description="Maximum stories to fetch (5-50)")
+    priority: int = Field(0, description="Fetch priority; higher is dispatched first")
+    weight: float = Field(1.0, description="Relative share of fetch capacity within a priority")
     last_updated: Optional[datetime] = Field(None, description="Last successful fetch time")
+    last_fetched: Optional[datetime] = Field(None, description="Last fetch attempt time, successful or not")
     status: str = Field("active", description="Current status")
     headlines: List[NewsHeadline] = Field(default_factory=list, description="List of headlines from this source")
 
@@ -39,9 +43,25 @@ class NewsSource(BaseModel):
             raise ValueError("max_stories must be between 5 and 50")
         return v
 
+    @field_validator('weight')
+    def validate_weight(cls, v):
+        if v <= 0:
+            raise ValueError("weight must be positive")
+        return v
+
     @field_validator('status')
     def validate_status(cls, v):
         valid_statuses = ['active', 'error', 'disabled']
         if v not in valid_statuses:
             raise ValueError(f"Status must be one of {valid_statuses}")
-        return v
\ No newline at end of file
+        return v
+
+    @classmethod
+    def from_trusted(cls, rows: List[Dict[str, Any]]) -> List["NewsSource"]:
+        """Rebuild cached sources and their headlines without re-validating them"""
+        for row in rows:
+            for key in ("last_updated", "last_fetched"):
+                if row.get(key):
+                    row[key] = datetime.fromisoformat(row[key])
+            row["headlines"] = NewsHeadline.from_trusted(row.get("headlines", []))
+        return construct_trusted(cls, rows)
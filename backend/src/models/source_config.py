@@ -3,7 +3,7 @@ from .news_source import NewsSource
 
 
 class SourceConfig:
-    """Configuration for news sources"""
+    """Built-in news source defaults, used when no sources.yaml catalog is present"""
     
     SOURCES: List[Dict[str, Any]] = [
         {
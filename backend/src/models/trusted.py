@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Type, TypeVar
+
+from pydantic import BaseModel
+
+Model = TypeVar("Model", bound=BaseModel)
+
+_object_setattr = object.__setattr__
+
+
+def construct_trusted(cls: Type[Model], rows: List[Dict[str, Any]]) -> List[Model]:
+    """Build models from already-validated dicts without running any validators.
+
+    Leaner than ``model_construct``, which resolves aliases and defaults field by field:
+    each dict becomes an instance ``__dict__`` as is, so the caller must own them. Rows
+    are expected to share one shape (they come from a single dump), which is checked on
+    the first row; data missing fields, e.g. written before a field existed, goes
+    through ``model_construct`` to pick up defaults.
+    """
+    if not rows:
+        return []
+    if rows[0].keys() != cls.model_fields.keys():
+        return [cls.model_construct(**row) for row in rows]
+
+    fields_set = set(cls.model_fields)
+    new = cls.__new__
+    models = []
+    for row in rows:
+        instance = new(cls)
+        _object_setattr(instance, "__dict__", row)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set.copy())
+        _object_setattr(instance, "__pydantic_extra__", None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        models.append(instance)
+    return models
@@ -0,0 +1,38 @@
+from typing import List
+from uuid import uuid4
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+class WatchlistSpec(BaseModel):
+    """A saved filter: headlines from ``sources`` mentioning any keyword or ticker"""
+    name: str = Field(..., description="Display name")
+    keywords: List[str] = Field(default_factory=list, description="Words or phrases matched case-insensitively on whole words")
+    sources: List[str] = Field(default_factory=list, description="Source names to watch; empty means all sources")
+    tickers: List[str] = Field(default_factory=list, description="Ticker symbols, matched against headline tags and title")
+    max_results: int = Field(200, ge=1, le=1000, description="Matching headlines kept, newest first")
+
+    @field_validator('name')
+    def validate_name(cls, v):
+        if not v or not v.strip():
+            raise ValueError("Name cannot be empty")
+        return v.strip()
+
+    @field_validator('keywords', 'sources')
+    def strip_terms(cls, v):
+        return list(dict.fromkeys(term.strip() for term in v if term and term.strip()))
+
+    @field_validator('tickers')
+    def normalize_tickers(cls, v):
+        return list(dict.fromkeys(symbol.strip().lstrip("$").upper() for symbol in v if symbol and symbol.strip("$ ")))
+
+    @model_validator(mode='after')
+    def require_a_filter(self):
+        if not (self.keywords or self.sources or self.tickers):
+            raise ValueError("A watchlist needs at least one keyword, source or ticker")
+        return self
+
+
+class Watchlist(WatchlistSpec):
+    """A saved watchlist with its identifier"""
+    id: str = Field(default_factory=lambda: uuid4().hex[:12], description="Watchlist identifier")
@@ -0,0 +1,13 @@
+from .base import RateLimiter
+from .in_memory import InMemoryRateLimiter
+
+__all__ = ["RateLimiter", "InMemoryRateLimiter", "RedisRateLimiter"]
+
+
+def __getattr__(name):
+    # Imported on first use so the redis client library only loads when it is configured
+    if name == "RedisRateLimiter":
+        from .redis_limiter import RedisRateLimiter
+
+        return RedisRateLimiter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class RateLimiter(Protocol):
+    """Protocol for token-bucket rate limiters."""
+
+    rate_per_second: float
+    burst: int
+
+    def acquire(self, key: str) -> float:
+        """Take one token for ``key``; return 0 if allowed, else seconds until one is available."""
+        ...
+
+    def refund(self, key: str) -> None:
+        """Return a token taken by ``acquire`` for a request that was rejected elsewhere."""
+        ...
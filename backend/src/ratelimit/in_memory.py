@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+
+class InMemoryRateLimiter:
+    """Per-process token buckets keyed by client or scope."""
+
+    def __init__(self, rate_per_minute: float, burst: int, max_keys: int = 10000) -> None:
+        self.rate_per_second = rate_per_minute / 60.0
+        self.burst = max(burst, 1)
+        self._max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (float(self.burst), now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate_per_second)
+
+            retry_after = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            elif self.rate_per_second > 0:
+                retry_after = (1 - tokens) / self.rate_per_second
+            else:
+                retry_after = float("inf")
+
+            # Re-insert as most recently used and drop the oldest idle buckets
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def refund(self, key: str) -> None:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                tokens, updated = bucket
+                self._buckets[key] = (min(float(self.burst), tokens + 1), updated)
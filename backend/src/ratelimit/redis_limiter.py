@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+import time
+
+try:
+    import redis  # type: ignore
+except ImportError:  # pragma: no cover - redis optional
+    redis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Refill and take a token atomically; the reply is a string so Lua does not truncate it
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local retry_after = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(retry_after)
+"""
+
+_REFUND_SCRIPT = """
+local burst = tonumber(ARGV[1])
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+  redis.call('HSET', KEYS[1], 'tokens', math.min(burst, tokens + 1))
+end
+return 0
+"""
+
+
+class RedisRateLimiter:
+    """Token buckets shared by every worker through Redis."""
+
+    def __init__(
+        self,
+        url: str,
+        rate_per_minute: float,
+        burst: int,
+        namespace: str = "news_ratelimit",
+    ) -> None:
+        if redis is None:
+            raise RuntimeError("redis package is required for RedisRateLimiter")
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.namespace = namespace.rstrip(":")
+        self.rate_per_second = rate_per_minute / 60.0
+        self.burst = max(burst, 1)
+        self._script = self.client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._refund_script = self.client.register_script(_REFUND_SCRIPT)
+
+    def acquire(self, key: str) -> float:
+        try:
+            result = self._script(
+                keys=[f"{self.namespace}:{key}"],
+                args=[self.rate_per_second, self.burst, time.time()],
+            )
+            return float(result)
+        except redis.RedisError as exc:
+            # Fail open: an unavailable limiter should not take the refresh route down
+            logger.warning("Rate limiter unavailable (%s); allowing request", exc)
+            return 0.0
+
+    def refund(self, key: str) -> None:
+        try:
+            self._refund_script(keys=[f"{self.namespace}:{key}"], args=[self.burst])
+        except redis.RedisError as exc:
+            logger.warning("Rate limiter unavailable (%s); token not refunded", exc)
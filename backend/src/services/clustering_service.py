@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Sequence, Set, Tuple
+
+from ..models.news_headline import NewsHeadline
+
+_PUBLISHER_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,40}$")
+_NON_WORD = re.compile(r"[^a-z0-9 ]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or over the to "
+    "up was were will with after amid says said".split()
+)
+
+_BITS = 64
+
+
+def normalize_title(title: str) -> List[str]:
+    """Lowercase, drop a trailing ' - Publisher' suffix, punctuation and stopwords"""
+    title = _PUBLISHER_SUFFIX.sub("", title.strip())
+    words = _NON_WORD.sub(" ", title.lower().replace("'", "")).split()
+    return [word for word in words if word not in _STOPWORDS]
+
+
+_MASK = (1 << _BITS) - 1
+
+
+@lru_cache(maxsize=65536)
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(tokens: Sequence[str]) -> int:
+    """64-bit SimHash over the distinct words of a normalized title.
+
+    A bit is set when more than half of the word hashes have it set. Rather than looping
+    over 64 bit positions per word, the per-bit counts are kept bit-sliced: ``levels[k]``
+    holds bit k of every position's count, so each word is added with a few integer ops.
+    """
+    features = set(tokens)
+    levels: List[int] = []
+    for feature in features:
+        carry = _feature_hash(feature)
+        for k, level in enumerate(levels):
+            levels[k], carry = level ^ carry, level & carry
+            if not carry:
+                break
+        if carry:
+            levels.append(carry)
+
+    # Positions whose count exceeds half: compare every count against the threshold,
+    # most significant level first
+    threshold = len(features) // 2
+    if threshold >> len(levels):
+        # A threshold wider than the counters can never be exceeded
+        return 0
+    greater, equal = 0, _MASK
+    for k in range(len(levels) - 1, -1, -1):
+        if (threshold >> k) & 1:
+            equal &= levels[k]
+        else:
+            greater |= equal & levels[k]
+            equal &= ~levels[k] & _MASK
+    return greater
+
+
+class ClusteringService:
+    """Assigns a shared cluster_id to near-duplicate headlines across sources.
+
+    Signatures are split into ``max_distance + 1`` bands; by the pigeonhole principle
+    any two signatures within ``max_distance`` bits agree on at least one band, so only
+    headlines sharing a band bucket are compared. Each source's previous entries are
+    replaced when it refreshes, keeping the index proportional to the cache.
+    """
+
+    def __init__(self, max_distance: int = 6) -> None:
+        self.max_distance = max_distance
+        self._bands = max_distance + 1
+        self._band_width = _BITS // self._bands
+        self._mask = (1 << self._band_width) - 1
+        self._buckets: Dict[Tuple[int, int], Set[Tuple[str, int]]] = defaultdict(set)
+        self._clusters: Dict[Tuple[str, int], str] = {}
+        self._by_source: Dict[str, List[Tuple[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    def assign(self, source_name: str, headlines: List[NewsHeadline]) -> None:
+        """Replace a source's index entries and set cluster_id on its headlines"""
+        with self._lock:
+            self._remove_source(source_name)
+            entries: List[Tuple[str, int]] = []
+            for index, headline in enumerate(headlines):
+                tokens = normalize_title(headline.title) or headline.title.lower().split()
+                signature = simhash(tokens)
+                cluster_id = self._match(signature) or f"{signature:016x}"
+                headline.cluster_id = cluster_id
+
+                # Index key is unique per source position; signatures may repeat within a feed
+                key = (f"{source_name}\x00{index}", signature)
+                self._clusters[key] = cluster_id
+                for band in self._band_keys(signature):
+                    self._buckets[band].add(key)
+                entries.append(key)
+            self._by_source[source_name] = entries
+
+    def remove_source(self, source_name: str) -> None:
+        with self._lock:
+            self._remove_source(source_name)
+
+    def _band_keys(self, signature: int) -> List[Tuple[int, int]]:
+        return [
+            (band, (signature >> (band * self._band_width)) & self._mask)
+            for band in range(self._bands)
+        ]
+
+    def _match(self, signature: int) -> str | None:
+        # Take the first member within range: large buckets are almost always a single
+        # popular story, so scanning them for the closest member would go quadratic
+        for band in self._band_keys(signature):
+            for key in self._buckets.get(band, ()):
+                if bin(signature ^ key[1]).count("1") <= self.max_distance:
+                    return self._clusters[key]
+        return None
+
+    def _remove_source(self, source_name: str) -> None:
+        for key in self._by_source.pop(source_name, []):
+            self._clusters.pop(key, None)
+            for band in self._band_keys(key[1]):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[band]
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+import yaml
+
+from ..models.news_headline import NewsHeadline
+from ..models.news_source import NewsSource
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[\w&]+")
+
+TICKER = "ticker"
+ENTITY = "entity"
+
+
+def tokenize(text: str) -> List[str]:
+    """Split on anything but word characters and '&', so 'S&P' stays one token"""
+    return _TOKEN.findall(text)
+
+
+class AhoCorasick:
+    """Multi-pattern matcher over word tokens.
+
+    Patterns are token sequences with a value each. Every state keeps the outputs of
+    its failure chain, so one pass over the tokens reports all matches, and the work
+    per token is a dict lookup plus amortized failure steps: matching cost depends on
+    the text length and the number of matches, not on how many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[Sequence[str], int]]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for tokens, value in patterns:
+            state = 0
+            for token in tokens:
+                following = goto[state].get(token)
+                if following is None:
+                    following = len(goto)
+                    goto[state][token] = following
+                    goto.append({})
+                    outputs.append(())
+                state = following
+            outputs[state] += (value,)
+
+        fail = [0] * len(goto)
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for token, following in goto[state].items():
+                pending.append(following)
+                fallback = fail[state]
+                while fallback and token not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[following] = goto[fallback].get(token, 0)
+                # Breadth-first order means the fallback's outputs are already complete
+                outputs[following] += outputs[fail[following]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def iter_matches(self, tokens: Sequence[str]) -> Iterator[Tuple[int, int]]:
+        """Yield ``(end_position, value)`` for every pattern occurrence"""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for position, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for value in outputs[state]:
+                yield position, value
+
+
+class _Pattern:
+    __slots__ = ("kind", "name", "length", "exact")
+
+    def __init__(self, kind: str, name: str, tokens: List[str], case_sensitive: bool) -> None:
+        self.kind = kind
+        self.name = name
+        self.length = len(tokens)
+        # Original spelling to compare against when case matters
+        self.exact = tokens if case_sensitive else None
+
+
+class EntityService:
+    """Tags headlines with tickers and entities at ingest and indexes them for lookup.
+
+    Tags are stored on the headlines, so they travel through the cache. The inverted
+    index maps each tag to the positions of matching headlines per source and is
+    replaced source by source, like the clustering index; sources written to the cache
+    by another process (queue workers) are indexed from their stored tags on first lookup.
+    """
+
+    def __init__(
+        self,
+        tickers: Optional[Mapping[str, Sequence[str]]] = None,
+        entities: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> None:
+        self._patterns: List[_Pattern] = []
+        keyed: List[Tuple[List[str], int]] = []
+        for kind, dictionary in ((TICKER, tickers or {}), (ENTITY, entities or {})):
+            for name, spec in dictionary.items():
+                name = str(name)
+                # Either a list of aliases or {aliases: [...], case_sensitive: bool}
+                if isinstance(spec, Mapping):
+                    aliases, case_flag = spec.get("aliases"), spec.get("case_sensitive")
+                else:
+                    aliases, case_flag = spec, None
+                terms = [str(alias) for alias in aliases or ()]
+                if kind == ENTITY or len(name) > 1:
+                    terms.append(name)
+                for term in dict.fromkeys(terms):
+                    tokens = tokenize(term)
+                    if not tokens:
+                        continue
+                    if case_flag is None:
+                        case_sensitive = not any(char.islower() for char in term)
+                    else:
+                        case_sensitive = bool(case_flag)
+                    keyed.append(([token.lower() for token in tokens], len(self._patterns)))
+                    self._patterns.append(_Pattern(kind, name, tokens, case_sensitive))
+        self._matcher = AhoCorasick(keyed)
+
+        self._postings: Dict[Tuple[str, str], Dict[str, List[int]]] = {}
+        self._by_source: Dict[str, Tuple[Tuple[object, int], List[Tuple[str, str]]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: Optional[str | Path]) -> "EntityService":
+        """Load the dictionary from YAML; a missing file gives a service that tags nothing"""
+        path = Path(path) if path else None
+        if path is None or not path.exists():
+            logger.warning("No entity dictionary at %s; headlines will not be tagged", path)
+            return cls()
+        data = yaml.safe_load(path.read_bytes()) or {}
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: expected 'tickers' and 'entities' mappings")
+        service = cls(data.get("tickers"), data.get("entities"))
+        logger.info(
+            "Loaded %s entity patterns from %s (%s automaton states)",
+            len(service._patterns),
+            path,
+            len(service._matcher),
+        )
+        return service
+
+    @staticmethod
+    def _lookup_key(kind: str, name: str) -> str:
+        return name.upper() if kind == TICKER else name.lower()
+
+    # Tagging ---------------------------------------------------------------
+    def tag_title(self, title: str) -> Tuple[List[str], List[str]]:
+        """Tickers and entities mentioned in a title, in order of first mention"""
+        tokens = tokenize(title)
+        found: Dict[Tuple[str, str], None] = {}
+        for end, value in self._matcher.iter_matches([token.lower() for token in tokens]):
+            pattern = self._patterns[value]
+            if pattern.exact is not None and tokens[end - pattern.length + 1 : end + 1] != pattern.exact:
+                continue
+            found[(pattern.kind, pattern.name)] = None
+        tickers = [name for kind, name in found if kind == TICKER]
+        entities = [name for kind, name in found if kind == ENTITY]
+        return tickers, entities
+
+    def tag(self, headlines: Iterable[NewsHeadline]) -> None:
+        """Set ``tickers`` and ``entities`` on each headline"""
+        for headline in headlines:
+            headline.tickers, headline.entities = self.tag_title(headline.title)
+
+    # Index -----------------------------------------------------------------
+    @staticmethod
+    def _version(source: NewsSource) -> Tuple[object, int]:
+        return (source.last_updated, len(source.headlines))
+
+    def index_source(self, source: NewsSource) -> None:
+        """Replace a source's postings with those of its current headlines"""
+        with self._lock:
+            self._index_source(source)
+
+    def remove_source(self, source_name: str) -> None:
+        with self._lock:
+            self._remove_source(source_name)
+
+    def lookup(
+        self,
+        sources: Mapping[str, NewsSource],
+        tickers: Sequence[str] = (),
+        entities: Sequence[str] = (),
+    ) -> Dict[str, List[NewsHeadline]]:
+        """Headlines of ``sources`` mentioning any of ``tickers`` and any of ``entities``.
+
+        Cost is proportional to the number of sources plus the number of postings for
+        the requested tags; headlines are never rescanned.
+        """
+        with self._lock:
+            for name, source in sources.items():
+                indexed = self._by_source.get(name)
+                if indexed is None or indexed[0] != self._version(source):
+                    self._index_source(source)
+
+            selected: Optional[Dict[str, Set[int]]] = None
+            for kind, names in ((TICKER, tickers), (ENTITY, entities)):
+                if not names:
+                    continue
+                matched: Dict[str, Set[int]] = {}
+                for name in names:
+                    for source_name, positions in self._postings.get((kind, self._lookup_key(kind, name)), {}).items():
+                        matched.setdefault(source_name, set()).update(positions)
+                if selected is None:
+                    selected = matched
+                else:
+                    selected = {
+                        source_name: positions & matched[source_name]
+                        for source_name, positions in selected.items()
+                        if source_name in matched
+                    }
+
+        if selected is None:
+            return {name: list(source.headlines) for name, source in sources.items()}
+        return {
+            name: [sources[name].headlines[position] for position in sorted(positions)]
+            for name, positions in selected.items()
+            if name in sources and positions
+        }
+
+    def _index_source(self, source: NewsSource) -> None:
+        self._remove_source(source.name)
+        postings: Dict[Tuple[str, str], List[int]] = {}
+        for position, headline in enumerate(source.headlines):
+            for kind, names in ((TICKER, headline.tickers), (ENTITY, headline.entities)):
+                for name in names:
+                    postings.setdefault((kind, self._lookup_key(kind, name)), []).append(position)
+        for key, positions in postings.items():
+            self._postings.setdefault(key, {})[source.name] = positions
+        self._by_source[source.name] = (self._version(source), list(postings))
+
+    def _remove_source(self, source_name: str) -> None:
+        _, keys = self._by_source.pop(source_name, (None, []))
+        for key in keys:
+            by_source = self._postings.get(key)
+            if by_source is not None:
+                by_source.pop(source_name, None)
+                if not by_source:
+                    del self._postings[key]
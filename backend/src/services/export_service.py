@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator
+
+from ..models.news_headline import NewsHeadline
+
+
+def _isoformat(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+class ExportService:
+    """Serialize headlines into streamable export documents, one row at a time."""
+
+    FORMATS = ("csv", "ndjson", "json")
+    MEDIA_TYPES = {
+        "csv": "text/csv; charset=utf-8",
+        "ndjson": "application/x-ndjson",
+        "json": "application/json",
+    }
+    FIELDS = ["source", "title", "link", "published_at", "fetched_at"]
+
+    def media_type(self, fmt: str) -> str:
+        return self.MEDIA_TYPES[fmt]
+
+    def filename(self, fmt: str) -> str:
+        return f"financial-news-{datetime.now(timezone.utc).date().isoformat()}.{fmt}"
+
+    def stream(self, headlines: Iterable[NewsHeadline], fmt: str) -> Iterator[str]:
+        """Return a chunk iterator for the requested format"""
+        if fmt == "csv":
+            return self._iter_csv(headlines)
+        if fmt == "ndjson":
+            return self._iter_ndjson(headlines)
+        if fmt == "json":
+            return self._iter_json(headlines)
+        raise ValueError(f"Unsupported export format '{fmt}'")
+
+    def _row(self, headline: NewsHeadline) -> Dict[str, str]:
+        return {
+            "source": headline.source,
+            "title": headline.title,
+            "link": headline.link,
+            "published_at": _isoformat(headline.published_at),
+            "fetched_at": _isoformat(headline.fetched_at),
+        }
+
+    def _iter_csv(self, headlines: Iterable[NewsHeadline]) -> Iterator[str]:
+        # A single small buffer is reused for every row so memory stays flat
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.FIELDS)
+        writer.writeheader()
+        for headline in headlines:
+            writer.writerow(self._row(headline))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def _iter_ndjson(self, headlines: Iterable[NewsHeadline]) -> Iterator[str]:
+        for headline in headlines:
+            yield json.dumps(self._row(headline)) + "\n"
+
+    def _iter_json(self, headlines: Iterable[NewsHeadline]) -> Iterator[str]:
+        yield '{"exported_at": ' + json.dumps(_isoformat(datetime.now(timezone.utc))) + ', "headlines": ['
+        separator = ""
+        for headline in headlines:
+            yield separator + json.dumps(self._row(headline))
+            separator = ", "
+        yield "]}\n"
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from typing import List, Optional
+
+from ..jobs.base import FetchJob, JobQueue
+from .news_service import NewsService
+
+logger = logging.getLogger(__name__)
+
+
+class FetchWorker:
+    """Consumes per-source fetch jobs from a JobQueue and publishes results to the cache.
+
+    Any number of workers, on any number of hosts, may share one queue: each job is
+    leased to a single consumer and redelivered if it is not acked in time. Failed
+    fetches are retried with exponential backoff up to ``max_attempts``. Every worker
+    offers to schedule the next refresh cycle; the queue grants that to one per interval.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        news_service: NewsService,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 10.0,
+        cycle_interval_seconds: float = 900.0,
+        name: Optional[str] = None,
+        poll_seconds: float = 1.0,
+    ) -> None:
+        self.queue = queue
+        self.news_service = news_service
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.cycle_interval_seconds = cycle_interval_seconds
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.poll_seconds = poll_seconds
+
+    def enqueue_cycle(self) -> int:
+        """Queue a fetch of every enabled source; returns how many were newly queued"""
+        sources = self.news_service.source_registry.enabled_sources()
+        queued = sum(1 for source in sources if self.queue.enqueue(source.name))
+        logger.info("Worker %s queued %s of %s sources", self.name, queued, len(sources))
+        return queued
+
+    def handle(self, job: FetchJob) -> bool:
+        """Run one job, then ack it or schedule a retry; returns whether the fetch succeeded"""
+        source = self.news_service.source_registry.get(job.source)
+        if source is None or not source.enabled:
+            logger.info("Dropping job for unknown or disabled source %s", job.source)
+            self.queue.ack(job)
+            return False
+
+        try:
+            succeeded = self.news_service.refresh_source(source)
+        except Exception as e:
+            logger.error("Error fetching %s: %s", job.source, e)
+            succeeded = False
+
+        if succeeded:
+            self.queue.ack(job)
+        elif job.attempts + 1 >= self.max_attempts:
+            logger.error("Giving up on %s after %s attempts", job.source, job.attempts + 1)
+            self.queue.ack(job)
+        else:
+            delay = self.retry_backoff_seconds * (2 ** job.attempts)
+            logger.warning("Fetch of %s failed; retrying in %.0fs", job.source, delay)
+            self.queue.retry(job, delay)
+        return succeeded
+
+    def run(self, stop_event: threading.Event, once: bool = False) -> None:
+        """Consume jobs until ``stop_event`` is set, or with ``once`` until the queue drains"""
+        if once:
+            self.enqueue_cycle()
+
+        threads: List[threading.Thread] = []
+        for index in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._consume,
+                args=(stop_event, f"{self.name}-{index}"),
+                name=f"fetch-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+
+        while not stop_event.wait(self.poll_seconds):
+            try:
+                if once:
+                    if self.queue.pending() == 0:
+                        stop_event.set()
+                elif self.cycle_interval_seconds > 0 and self.queue.claim_cycle(
+                    self.cycle_interval_seconds
+                ):
+                    self.enqueue_cycle()
+            except Exception as e:
+                logger.error("Worker %s scheduling error: %s", self.name, e)
+
+        for thread in threads:
+            thread.join(timeout=30)
+
+    def _consume(self, stop_event: threading.Event, consumer: str) -> None:
+        while not stop_event.is_set():
+            try:
+                job = self.queue.reserve(consumer, timeout=self.poll_seconds)
+            except Exception as e:
+                logger.error("Worker %s could not reserve a job: %s", consumer, e)
+                stop_event.wait(self.poll_seconds)
+                continue
+            if job is None:
+                continue
+            try:
+                self.handle(job)
+            except Exception as e:
+                # The lease expires and the job is redelivered to another consumer
+                logger.error("Worker %s failed handling %s: %s", consumer, job.source, e)
@@ -0,0 +1,331 @@
+"""Record, replay and fault-injecting transports for the fetch services' sessions.
+
+Each is a requests transport adapter, so the services keep their real download,
+parse and validate path and only the bytes on the wire come from somewhere else.
+Only imported when ``HTTP_TRANSPORT`` is not ``live``, which keeps requests off the
+startup import path.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.response import HTTPResponse
+
+logger = logging.getLogger(__name__)
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+FAULT = "fault"
+TRANSPORT_MODES = (LIVE, RECORD, REPLAY, FAULT)
+
+# Describe the body as sent by the server; recorded bodies are stored already decoded
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+_FAULT_STATUSES = (500, 502, 503, 504)
+_REASONS = {200: "OK", 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """One recorded response"""
+
+    method: str
+    url: str
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: bytes
+    elapsed_seconds: float
+    recorded_at: str
+
+
+class Cassette:
+    """Directory of recorded responses, one gzip file per method and URL.
+
+    A file holds a JSON line of metadata followed by the raw body. Recording a URL
+    again replaces its previous response, so a directory is always one consistent
+    snapshot of each upstream.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()[:32]
+
+    def path(self, method: str, url: str) -> Path:
+        return self.directory / f"{self.key(method, url)}.gz"
+
+    def save(self, interaction: Interaction) -> None:
+        meta = {
+            "method": interaction.method.upper(),
+            "url": interaction.url,
+            "status": interaction.status,
+            "reason": interaction.reason,
+            "headers": interaction.headers,
+            "elapsed_seconds": interaction.elapsed_seconds,
+            "recorded_at": interaction.recorded_at,
+        }
+        path = self.path(interaction.method, interaction.url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so a replaying process never sees half a file
+        fd, temporary = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as handle:
+                handle.write(json.dumps(meta, separators=(",", ":")).encode() + b"\n")
+                handle.write(interaction.body)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def load(self, method: str, url: str) -> Optional[Interaction]:
+        try:
+            data = gzip.decompress(self.path(method, url).read_bytes())
+        except FileNotFoundError:
+            return None
+        header, _, body = data.partition(b"\n")
+        meta = json.loads(header)
+        return Interaction(body=body, **meta)
+
+    def record(
+        self,
+        url: str,
+        body: bytes,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        elapsed_seconds: float = 0.0,
+        method: str = "GET",
+    ) -> None:
+        """Store a response built by hand, e.g. from a fixture file"""
+        self.save(
+            Interaction(
+                method=method.upper(),
+                url=url,
+                status=status,
+                reason=_REASONS.get(status, ""),
+                headers=dict(headers or {}),
+                body=body,
+                elapsed_seconds=elapsed_seconds,
+                recorded_at=datetime.now(timezone.utc).isoformat(),
+            )
+        )
+
+
+def _read_timeout(timeout) -> Optional[float]:
+    if isinstance(timeout, tuple):
+        return timeout[1]
+    return timeout
+
+
+def _raw(status: int, headers, body: bytes) -> HTTPResponse:
+    """A urllib3 response over ``body``, so ``raw.read(amt, decode_content=...)`` and
+    ``raw.stream()`` behave as they do on a live response"""
+    headers = {name: value for name, value in headers.items() if name.lower() not in _DROPPED_HEADERS}
+    return HTTPResponse(
+        body=io.BytesIO(body), headers=headers, status=status, preload_content=False, decode_content=False
+    )
+
+
+def _build_response(request, status: int, reason: str, headers: Dict[str, str], body: bytes, elapsed: float):
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = _raw(status, headers, body)
+    response._content = body
+    response._content_consumed = True
+    response.url = request.url
+    response.request = request
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+class RecordingAdapter(BaseAdapter):
+    """Sends through ``inner`` and saves every response it gets to ``cassette``"""
+
+    def __init__(self, cassette: Cassette, inner: BaseAdapter) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.inner = inner
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        started = time.perf_counter()
+        response = self.inner.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        # Reading the body here makes the recorded time cover the whole download
+        body = response.content
+        elapsed = time.perf_counter() - started
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS}
+        self.cassette.save(
+            Interaction(
+                method=request.method,
+                url=request.url,
+                status=response.status_code,
+                reason=response.reason or "",
+                headers=headers,
+                body=body,
+                elapsed_seconds=round(elapsed, 6),
+                recorded_at=datetime.now(timezone.utc).isoformat(),
+            )
+        )
+        # The body was consumed above; readers of ``raw`` get it again as a replay would
+        response.raw = _raw(response.status_code, headers, body)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serves responses from ``cassette`` without touching the network.
+
+    A request with no recording fails with ``requests.ConnectionError``, as an
+    unreachable host would. ``latency_scale`` emulates the recorded download time
+    (``1.0``) or a multiple of it; ``0`` answers immediately. An emulated delay longer
+    than the request's read timeout ends in ``requests.ReadTimeout`` after the timeout.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 0.0) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.latency_scale = max(0.0, latency_scale)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        interaction = self.cassette.load(request.method, request.url)
+        if interaction is None:
+            raise requests.ConnectionError(f"No recorded response for {request.method} {request.url}", request=request)
+        delay = interaction.elapsed_seconds * self.latency_scale
+        read_timeout = _read_timeout(timeout)
+        if read_timeout is not None and delay > read_timeout:
+            time.sleep(read_timeout)
+            raise requests.ReadTimeout(f"Replayed response for {request.url} exceeded {read_timeout}s", request=request)
+        if delay:
+            time.sleep(delay)
+        return _build_response(
+            request, interaction.status, interaction.reason, interaction.headers, interaction.body, delay
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class FaultInjectingAdapter(BaseAdapter):
+    """Fails a share of the requests sent through ``inner``.
+
+    A request times out (``requests.ReadTimeout``) with probability ``timeout_rate``,
+    gets a 5xx with ``error_rate``, or has its body cut in half with
+    ``truncate_rate``. The draw hashes ``seed``, the URL and how many times that URL
+    was requested before, so a run sees the same faults whatever order concurrent
+    fetches happen in.
+    """
+
+    def __init__(
+        self,
+        inner: BaseAdapter,
+        timeout_rate: float = 0.0,
+        error_rate: float = 0.0,
+        truncate_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__()
+        if min(timeout_rate, error_rate, truncate_rate) < 0 or timeout_rate + error_rate + truncate_rate > 1:
+            raise ValueError("fault rates must be non-negative and add up to at most 1")
+        self.inner = inner
+        self.timeout_rate = timeout_rate
+        self.error_rate = error_rate
+        self.truncate_rate = truncate_rate
+        self.seed = seed
+        self.injected = {"timeout": 0, "error": 0, "truncated": 0}
+        self._attempts: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _draw(self, method: str, url: str) -> float:
+        with self._lock:
+            attempt = self._attempts.get((method, url), 0)
+            self._attempts[(method, url)] = attempt + 1
+        digest = hashlib.blake2b(f"{self.seed}:{attempt}:{method} {url}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") / 2**64
+
+    def _count(self, fault: str) -> None:
+        with self._lock:
+            self.injected[fault] += 1
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        draw = self._draw(request.method, request.url)
+        if draw < self.timeout_rate:
+            self._count("timeout")
+            raise requests.ReadTimeout(f"Injected timeout for {request.url}", request=request)
+        draw -= self.timeout_rate
+        if draw < self.error_rate:
+            self._count("error")
+            status = _FAULT_STATUSES[int(draw / self.error_rate * len(_FAULT_STATUSES))]
+            return _build_response(request, status, _REASONS[status], {"Content-Type": "text/plain"}, b"", 0.0)
+        draw -= self.error_rate
+        response = self.inner.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        if draw < self.truncate_rate:
+            self._count("truncated")
+            body = response.content[: len(response.content) // 2]
+            response._content = body
+            response.raw = _raw(response.status_code, response.headers, body)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class HttpTransport:
+    """Wraps the adapter a fetch service would mount according to ``mode``.
+
+    ``record`` records what the live adapter receives, ``replay`` serves recordings
+    instead of it, and ``fault`` injects failures into replayed responses.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        cassette_dir: str | Path,
+        latency_scale: float = 0.0,
+        timeout_rate: float = 0.0,
+        error_rate: float = 0.0,
+        truncate_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        if mode not in TRANSPORT_MODES:
+            raise ValueError(f"Unknown HTTP transport {mode!r}; choose from {list(TRANSPORT_MODES)}")
+        self.mode = mode
+        self.cassette = Cassette(cassette_dir)
+        self.latency_scale = latency_scale
+        self.fault_rates = {"timeout_rate": timeout_rate, "error_rate": error_rate, "truncate_rate": truncate_rate}
+        self.seed = seed
+        if mode == FAULT:
+            # Validate the rates now rather than on the first fetch
+            FaultInjectingAdapter(BaseAdapter(), seed=seed, **self.fault_rates)
+
+    def adapter(self, live: BaseAdapter) -> BaseAdapter:
+        if self.mode == RECORD:
+            return RecordingAdapter(self.cassette, live)
+        if self.mode == REPLAY:
+            return ReplayAdapter(self.cassette, self.latency_scale)
+        if self.mode == FAULT:
+            return FaultInjectingAdapter(
+                ReplayAdapter(self.cassette, self.latency_scale), seed=self.seed, **self.fault_rates
+            )
+        return live
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import base64
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..models.news_headline import NewsHeadline
+
+logger = logging.getLogger(__name__)
+
+REDIRECT_HOSTS = frozenset({"news.google.com"})
+
+_TRACKING_PARAMS = frozenset(
+    {
+        "gclid", "fbclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ocid", "cmpid", "taid",
+        "mod", "ref", "smid", "s_cid", "ncid", "guccounter", "guce_referrer", "guce_referrer_sig",
+        "yptr", "sr_share",
+    }
+)
+_EMBEDDED_URL = re.compile(rb"https?://[\x21-\x7e]+")
+_PUBLISHER_URL_ATTRIBUTES = (
+    re.compile(r'data-n-au="(https?://[^"]+)"'),
+    re.compile(r'<link[^>]+rel="canonical"[^>]+href="(https?://[^"]+)"'),
+)
+_MAX_PAGE_BYTES = 256 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resolved_links (
+    redirect TEXT PRIMARY KEY,
+    url TEXT,
+    resolved_at REAL NOT NULL,
+    expires_at REAL
+);
+"""
+
+
+def is_redirect(url: str) -> bool:
+    """Whether ``url`` is an aggregator redirect rather than a publisher link"""
+    parts = urlsplit(url)
+    return parts.netloc.lower() in REDIRECT_HOSTS and "/articles/" in parts.path
+
+
+def normalize_url(url: str) -> str:
+    """Drop tracking parameters, the fragment and default ports; lowercase scheme and host"""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rsplit(":", 1)[-1]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ]
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+def decode_google_news_url(url: str) -> Optional[str]:
+    """Publisher URL embedded in a Google News article id, if the id carries one.
+
+    Older ids are base64url-encoded protobuf with the URL stored inline; newer ones are
+    opaque tokens and need an HTTP round trip.
+    """
+    article_id = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+    try:
+        payload = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+    match = _EMBEDDED_URL.search(payload)
+    if match is None:
+        return None
+    embedded = match.group().decode("ascii")
+    return None if is_redirect(embedded) else embedded
+
+
+class LinkCache:
+    """Redirect URL -> publisher URL, in a memory LRU backed by an optional SQLite file.
+
+    Successful resolutions are kept forever. Failures are stored as ``None`` with an
+    expiry, so a dead link is retried after ``negative_ttl_seconds`` rather than on
+    every refresh.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str | Path] = None,
+        max_entries: int = 10000,
+        negative_ttl_seconds: float = 3600,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[Optional[str], Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def get(self, redirect: str) -> Tuple[bool, Optional[str]]:
+        """``(hit, url)``; a hit with ``url=None`` is a cached failure"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(redirect)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT url, expires_at FROM resolved_links WHERE redirect = ?", (redirect,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._remember(redirect, entry)
+            if entry is None:
+                return False, None
+            url, expires_at = entry
+            if expires_at is not None and expires_at <= now:
+                # Expired failure: forget it so the link is tried again
+                self._memory.pop(redirect, None)
+                return False, None
+            self._memory.move_to_end(redirect)
+            return True, url
+
+    def put(self, redirect: str, url: Optional[str]) -> None:
+        now = time.time()
+        expires_at = None if url else now + self.negative_ttl_seconds
+        with self._lock:
+            self._remember(redirect, (url, expires_at))
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO resolved_links (redirect, url, resolved_at, expires_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (redirect, url, now, expires_at),
+                    )
+
+    def _remember(self, redirect: str, entry: Tuple[Optional[str], Optional[float]]) -> None:
+        self._memory[redirect] = entry
+        self._memory.move_to_end(redirect)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class LinkResolver:
+    """Rewrites aggregator redirect links on headlines to canonical publisher URLs.
+
+    Each redirect is resolved at most once: results are cached (see ``LinkCache``), and
+    a link already being resolved is awaited rather than fetched again. Network lookups
+    run on at most ``max_concurrency`` threads. A refresh waits up to
+    ``budget_seconds`` for them; slower lookups finish in the background and their
+    headlines are held back until a later refresh finds them resolved, which the
+    caller can run as soon as they are done (``on_settled``). A headline is
+    therefore never published under its redirect link and later again under the
+    publisher URL, which would make it a new headline to the archive, watchlists and
+    stats. Links that cannot be resolved at all are published as they are.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[LinkCache] = None,
+        max_concurrency: int = 4,
+        budget_seconds: float = 5.0,
+        timeout: float = 5.0,
+        fetch: Optional[Callable[[str], Optional[str]]] = None,
+        transport=None,
+    ) -> None:
+        self.cache = cache if cache is not None else LinkCache()
+        self.max_concurrency = max(1, max_concurrency)
+        self.budget_seconds = budget_seconds
+        self.timeout = timeout
+        self._fetch = fetch or self._follow
+        self.transport = transport
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @cached_property
+    def session(self):
+        """Pooled session, built on first lookup so startup skips requests/urllib3"""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+        if self.transport is not None:
+            adapter = self.transport.adapter(adapter)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = "Mozilla/5.0 (compatible; news-aggregator link resolver)"
+        return session
+
+    def resolve_headlines(
+        self,
+        headlines: Iterable[NewsHeadline],
+        on_settled: Optional[Callable[[], None]] = None,
+    ) -> Tuple[List[NewsHeadline], int]:
+        """Replace redirect links in place.
+
+        Returns the headlines ready to publish, in their original order, and how many
+        were rewritten; headlines whose lookup is still running are left out.
+        ``on_settled`` is called once those lookups have all finished, on a resolver
+        thread, and only if any headline was held back.
+        """
+        headlines = list(headlines)
+        pending: List[Tuple[NewsHeadline, Future]] = []
+        rewritten = 0
+        for headline in headlines:
+            if not is_redirect(headline.link):
+                continue
+            hit, url = self.cache.get(headline.link)
+            if hit:
+                if url:
+                    headline.link = url
+                    rewritten += 1
+                continue
+            pending.append((headline, self._submit(headline.link)))
+
+        held: Set[int] = set()
+        if pending:
+            done, not_done = wait([future for _, future in pending], timeout=self.budget_seconds)
+            if not_done:
+                logger.info(
+                    "%s link lookups still running after %ss; holding their headlines back",
+                    len(not_done),
+                    self.budget_seconds,
+                )
+            for headline, future in pending:
+                if future not in done:
+                    held.add(id(headline))
+                elif future.exception() is None and future.result():
+                    headline.link = future.result()
+                    rewritten += 1
+            if not_done and on_settled is not None:
+                self._when_done(not_done, on_settled)
+        if held:
+            headlines = [headline for headline in headlines if id(headline) not in held]
+        return headlines, rewritten
+
+    @staticmethod
+    def _when_done(futures: Set[Future], callback: Callable[[], None]) -> None:
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def settle(_: Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                try:
+                    callback()
+                except Exception as exc:
+                    logger.error("Callback after link lookups failed: %s", exc)
+
+        for future in futures:
+            future.add_done_callback(settle)
+
+    def resolve(self, redirect: str) -> Optional[str]:
+        """Publisher URL for one redirect, or None if it cannot be resolved"""
+        hit, url = self.cache.get(redirect)
+        if hit:
+            return url
+        return self._submit(redirect).result()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.cache.close()
+
+    def _submit(self, redirect: str) -> Future:
+        with self._lock:
+            future = self._in_flight.get(redirect)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency, thread_name_prefix="resolve"
+                    )
+                future = self._executor.submit(self._resolve_and_store, redirect)
+                self._in_flight[redirect] = future
+            return future
+
+    def _resolve_and_store(self, redirect: str) -> Optional[str]:
+        try:
+            url = decode_google_news_url(redirect) or self._fetch(redirect)
+            url = normalize_url(url) if url else None
+        except Exception as exc:
+            logger.debug("Could not resolve %s: %s", redirect, exc)
+            url = None
+        try:
+            self.cache.put(redirect, url)
+        finally:
+            # Cached before leaving the in-flight map, so no caller can miss both
+            with self._lock:
+                self._in_flight.pop(redirect, None)
+        return url
+
+    def _follow(self, redirect: str) -> Optional[str]:
+        """Follow HTTP redirects; if they end on the aggregator, read the publisher URL
+        from the interstitial page"""
+        response = self.session.get(redirect, allow_redirects=True, timeout=(2, self.timeout), stream=True)
+        try:
+            if urlsplit(response.url).netloc.lower() not in REDIRECT_HOSTS and response.ok:
+                return response.url
+            body = response.raw.read(_MAX_PAGE_BYTES, decode_content=True).decode("utf-8", "replace")
+        finally:
+            response.close()
+        for pattern in _PUBLISHER_URL_ATTRIBUTES:
+            match = pattern.search(body)
+            if match and urlsplit(match.group(1)).netloc.lower() not in REDIRECT_HOSTS:
+                return match.group(1)
+        return None
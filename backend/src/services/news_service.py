@@ -1,15 +1,27 @@
-from typing import List, Dict, Any
-from ..cache.base import NewsCacheBackend
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set
+from ..archive.base import HeadlineArchive
+from ..cache.async_adapter import AsyncCacheAdapter
+from ..cache.base import AsyncNewsCacheBackend, CacheSnapshot, NewsCacheBackend, is_fresh
 from ..cache.in_memory import InMemoryNewsCache
+from ..jobs.base import JobQueue
 from ..models.news_source import NewsSource
 from ..models.news_headline import NewsHeadline, NewsHeadlineResponse
-from ..models.source_config import SourceConfig
+from ..models.watchlist import Watchlist
+from .clustering_service import ClusteringService
+from .entity_service import EntityService
+from .fetch_orchestrator import FetchOrchestrator
+from .link_resolver import LinkResolver
 from .rss_service import RSSService
 from .scraping_service import ScrapingService
+from .source_registry import RegistryDiff, SourceRegistry
+from .stats_service import StatsService
+from .timeline import TimelineCursor, merge_page
+from .watchlist_service import WatchlistService
+from ..tracing import get_tracer
 import logging
-from datetime import timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -17,37 +29,84 @@ logger = logging.getLogger(__name__)
 class NewsService:
     """Service for aggregating news from multiple sources"""
 
+    HEADLINE_FIELDS = tuple(NewsHeadlineResponse.model_fields)
+
     def __init__(
         self,
         cache: NewsCacheBackend | None = None,
         rss_service: RSSService | None = None,
         scraping_service: ScrapingService | None = None,
+        archive: HeadlineArchive | None = None,
+        clustering_service: ClusteringService | None = None,
+        refresh_min_interval_seconds: int = 0,
+        source_registry: SourceRegistry | None = None,
+        orchestrator: FetchOrchestrator | None = None,
+        job_queue: JobQueue | None = None,
+        entity_service: EntityService | None = None,
+        link_resolver: LinkResolver | None = None,
+        async_cache: AsyncNewsCacheBackend | None = None,
+        watchlist_service: WatchlistService | None = None,
+        stats_service: StatsService | None = None,
     ) -> None:
         self.cache: NewsCacheBackend = cache or InMemoryNewsCache()
+        # The same data for async routes, which must not block the event loop on Redis
+        self.async_cache: AsyncNewsCacheBackend = async_cache or AsyncCacheAdapter(self.cache)
         self._lock = threading.Lock()
+        # Reader (watchlists, stats) -> cache generation it last caught up with
+        self._synced_generations: Dict[str, int] = {}
+        # Sources with a fetch pending until link lookups that held headlines back finish
+        self._refetch_pending: Set[str] = set()
         self.rss_service = rss_service or RSSService()
         self.scraping_service = scraping_service or ScrapingService()
+        self.archive = archive
+        self.clustering_service = clustering_service or ClusteringService()
+        self.entity_service = entity_service or EntityService()
+        self.watchlist_service = watchlist_service or WatchlistService()
+        self.stats_service = stats_service or StatsService()
+        # Rewrites aggregator redirect links (Google News) to publisher URLs at ingest
+        self.link_resolver = link_resolver
+        self.refresh_min_interval_seconds = refresh_min_interval_seconds
+        self._refresh_lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self.source_registry = source_registry or SourceRegistry()
+        self.orchestrator = orchestrator or FetchOrchestrator()
+        # With a job queue, fetches are handed to workers (src.worker) instead of run here
+        self.job_queue = job_queue
+
+    def fetch_all_news(
+        self,
+        collapse: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        limit_per_source: Optional[int] = None,
+        tickers: Optional[Sequence[str]] = None,
+        entities: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch news from all sources.
 
-    def fetch_all_news(self) -> Dict[str, Any]:
-        """Fetch news from all sources"""
+        ``collapse`` keeps one headline per duplicate cluster, ``fields`` projects each
+        headline onto a subset of HEADLINE_FIELDS and ``limit_per_source`` caps the
+        number of headlines returned per source. ``tickers`` and ``entities`` keep only
+        headlines tagged with one of each, served from the entity index.
+        """
         try:
             # Check if cache is fresh
             if self.cache.is_fresh and self.cache.total_sources_count > 0:
-                logger.info("Returning fresh cached data")
-                return self._format_response()
+                logger.debug("Returning fresh cached data")
+                return self._format_response(collapse, fields, limit_per_source, tickers, entities)
             
             # Fetch fresh data
             logger.info("Fetching fresh data from all sources")
-            self._refresh_all_sources()
+            with get_tracer().span("refresh"):
+                self._refresh_once()
             
-            return self._format_response()
+            return self._format_response(collapse, fields, limit_per_source, tickers, entities)
             
         except Exception as e:
-            logger.error(f"Error in fetch_all_news: {e}")
+            logger.error("Error in fetch_all_news: %s", e)
             # Return cached data if available, otherwise empty response
             if self.cache.total_sources_count > 0:
                 logger.info("Returning cached data due to error")
-                return self._format_response()
+                return self._format_response(collapse, fields, limit_per_source, tickers, entities)
             else:
                 return {
                     "sources": [],
@@ -57,136 +116,491 @@ class NewsService:
                     "cache_status": "error"
                 }
 
+    def iter_headlines(
+        self,
+        sources: Optional[Sequence[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[NewsHeadline]:
+        """Yield cached headlines one at a time, optionally filtered by source and time"""
+        try:
+            if not (self.cache.is_fresh and self.cache.total_sources_count > 0):
+                self._refresh_once()
+        except Exception as e:
+            logger.error("Error refreshing before export: %s", e)
+
+        since = self._as_utc(since)
+        until = self._as_utc(until)
+        wanted = set(sources) if sources else None
+
+        for name, source in self.cache.get_all_sources().items():
+            if wanted is not None and name not in wanted:
+                continue
+            for headline in source.headlines:
+                if since and headline.published_at < since:
+                    continue
+                if until and headline.published_at > until:
+                    continue
+                yield headline
+
+    def timeline(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sources: Optional[Sequence[str]] = None,
+        since: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Headlines of all sources merged newest first, a page at a time.
+
+        ``next_cursor`` continues from this page in the same cache generation, so pages
+        neither repeat nor skip headlines while refreshes publish new ones. If that
+        generation is no longer retained, paging resumes after the last headline's
+        time in the current one. Raises ValueError for a malformed cursor.
+        """
+        position = TimelineCursor.decode(cursor) if cursor else None
+        if position is None:
+            try:
+                if not (self.cache.is_fresh and self.cache.total_sources_count > 0):
+                    self._refresh_once()
+            except Exception as e:
+                logger.error("Error refreshing before timeline: %s", e)
+
+        tracer = get_tracer()
+        with tracer.span("cache.read"):
+            snapshot = self.cache.snapshot_at(position.generation) if position else None
+            if snapshot is None:
+                snapshot = self.cache.snapshot()
+        with tracer.span("merge"):
+            page = merge_page(snapshot, limit, position, sources, self._as_utc(since))
+        return {
+            "headlines": [self._project_headline(headline, self.HEADLINE_FIELDS) for headline in page.headlines],
+            "count": len(page.headlines),
+            "next_cursor": page.next_cursor,
+            "generation": page.generation,
+            "last_updated": snapshot.last_refresh.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        }
+
+    def save_watchlist(self, watchlist: Watchlist) -> Watchlist:
+        """Create or replace a watchlist, backfilled from the cached headlines"""
+        return self.watchlist_service.save(watchlist, self.cache.snapshot().sources)
+
+    def stats(
+        self,
+        bucket_seconds: Optional[int] = None,
+        range_seconds: Optional[int] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Time-bucketed headline, latency and fetch statistics; raises ValueError for
+        a bucket or range the stats do not cover"""
+        # Counts sources that queue workers wrote since the last query; the sources
+        # are scanned only when the cache generation moved, keeping a query O(buckets)
+        snapshot = self.cache.snapshot()
+        if not self._synced("stats", snapshot.generation):
+            self.stats_service.sync(snapshot.sources)
+        return self.stats_service.query(bucket_seconds, range_seconds, sources)
+
+    def _synced(self, reader: str, generation: int) -> bool:
+        """Whether ``reader`` already caught up with cache ``generation``; marks it if not"""
+        with self._lock:
+            if self._synced_generations.get(reader) == generation:
+                return True
+            self._synced_generations[reader] = generation
+            return False
+
+    def _sync_watchlists(self) -> CacheSnapshot:
+        """Current snapshot, with watchlists caught up on other processes' writes.
+
+        Cached sources are scanned only when the generation moved since the last
+        read, so polling a watchlist does not cost a pass over every headline.
+        """
+        snapshot = self.cache.snapshot()
+        if self._synced("watchlists", snapshot.generation):
+            self.watchlist_service.reload(snapshot.sources)
+        else:
+            self.watchlist_service.sync(snapshot.sources)
+        return snapshot
+
+    def list_watchlists(self) -> List[Watchlist]:
+        self._sync_watchlists()
+        return self.watchlist_service.all()
+
+    def get_watchlist(self, watchlist_id: str) -> Optional[Watchlist]:
+        """A watchlist by id, including ones saved by other processes"""
+        self._sync_watchlists()
+        return self.watchlist_service.get(watchlist_id)
+
+    def delete_watchlist(self, watchlist_id: str) -> bool:
+        return self.watchlist_service.delete(watchlist_id, self.cache.snapshot().sources)
+
+    def watchlist_results(self, watchlist_id: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """A watchlist's materialized matches; raises ValueError for an unknown id"""
+        # Picks up sources that queue workers wrote since the last read
+        snapshot = self._sync_watchlists()
+        watchlist, headlines = self.watchlist_service.results(watchlist_id, limit)
+        return {
+            "watchlist": watchlist.model_dump(),
+            "headlines": [self._project_headline(headline, self.HEADLINE_FIELDS) for headline in headlines],
+            "count": len(headlines),
+            "last_updated": snapshot.last_refresh.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        }
+
+    @staticmethod
+    def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+        if value is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=timezone.utc)
+
+    def _refresh_once(self) -> bool:
+        """Run a refresh cycle unless one is already in flight, in which case wait for it.
+
+        Returns True if this call performed the refresh.
+        """
+        if self._refresh_lock.acquire(blocking=False):
+            try:
+                self._refresh_all_sources()
+            finally:
+                self._refresh_lock.release()
+            return True
+
+        logger.info("Refresh already in progress; waiting for it to finish")
+        with self._refresh_lock:
+            return False
+
+    def refresh_cycle(self) -> bool:
+        """Refresh every enabled source regardless of cache freshness (scheduled refreshes)"""
+        return self._refresh_once()
+
+    def cancel_refreshes(self):
+        """Stop starting new source fetches; used on shutdown while a cycle is in flight"""
+        self._cancel_event.set()
+
+    def _refreshed_recently(self) -> bool:
+        """Whether the last completed refresh falls inside the minimum refresh interval"""
+        if self.refresh_min_interval_seconds <= 0 or self.cache.total_sources_count == 0:
+            return False
+        age = datetime.now(timezone.utc) - self.cache.last_refresh
+        return age.total_seconds() < self.refresh_min_interval_seconds
+
     def _refresh_all_sources(self):
         """Refresh data from all enabled sources in parallel"""
-        sources = SourceConfig.get_enabled_sources()
+        sources = self.source_registry.enabled_sources()
+        tracer = get_tracer()
+        # Each source gets its own trace (see _fetch_source); this one covers the cycle
+        started = time.monotonic()
+        with tracer.start_trace("refresh.cycle", sources=len(sources)):
+            with tracer.span("fetch"):
+                fetched = self._refresh_sources(sources)
+            if self.job_queue is not None:
+                # Workers mark the cache fresh as their results land
+                return
+            self.stats_service.record_cycle(time.monotonic() - started)
 
-        max_workers = min(8, max(1, len(sources)))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(self._refresh_source, source): source for source in sources}
-            for fut in as_completed(futures):
-                src_obj = futures[fut]
-                try:
-                    fut.result()
-                except Exception as e:
-                    logger.error(f"Error refreshing source {src_obj.name}: {e}")
-                    continue
+            # Mark cache as refreshed
+            self.cache.refresh()
+            with tracer.span("archive"):
+                self._archive_headlines(fetched)
 
-        # Mark cache as refreshed
-        self.cache.refresh()
+    def _refresh_sources(self, sources: Sequence[NewsSource]) -> List[NewsHeadline]:
+        """Fetch the given sources concurrently; each is written to the cache as it finishes"""
+        if self.job_queue is not None:
+            queued = sum(1 for source in sources if self.job_queue.enqueue(source.name))
+            logger.info("Queued %s fetch jobs (%s already pending)", queued, len(sources) - queued)
+            return []
+        return self.orchestrator.run(sources, self._refresh_source, cancel_event=self._cancel_event)
 
-    def _refresh_source(self, source: NewsSource):
-        """Refresh data from a single source"""
+    def refresh_source(self, source: NewsSource) -> bool:
+        """Fetch a single source now and archive its headlines; False if the fetch failed"""
+        fetched = self._fetch_source(source)
+        self._archive_headlines(fetched.headlines)
+        return fetched.status == "active"
+
+    def _refetch_after_lookups(self, source_name: str) -> None:
+        """Fetch a source again once the link lookups that held some of its headlines
+        back are done, so they are published now rather than on the next cycle"""
+        with self._lock:
+            if source_name in self._refetch_pending or self._cancel_event.is_set():
+                return
+            self._refetch_pending.add(source_name)
+
+        def refetch() -> None:
+            try:
+                source = self.source_registry.get(source_name)
+                if source is not None and source.enabled and not self._cancel_event.is_set():
+                    self.refresh_source(source)
+            except Exception as e:
+                logger.error("Error re-fetching %s after link lookups: %s", source_name, e)
+            finally:
+                with self._lock:
+                    self._refetch_pending.discard(source_name)
+
+        threading.Thread(target=refetch, name=f"refetch-{source_name}", daemon=True).start()
+
+    def apply_source_changes(self, diff: RegistryDiff):
+        """Bring the cache in line with a source catalog change without a full refresh"""
+        for name in diff.removed:
+            self.cache.remove_source(name)
+            self.clustering_service.remove_source(name)
+            self.entity_service.remove_source(name)
+            self.watchlist_service.remove_source(name)
+            self.stats_service.remove_source(name)
+
+        to_fetch = []
+        for source in diff.added + diff.changed:
+            if source.enabled:
+                to_fetch.append(source)
+            else:
+                self.cache.remove_source(source.name)
+                self.clustering_service.remove_source(source.name)
+                self.entity_service.remove_source(source.name)
+                self.watchlist_service.remove_source(source.name)
+                self.stats_service.remove_source(source.name)
+
+        if to_fetch:
+            self._archive_headlines(self._refresh_sources(to_fetch))
+
+    def _archive_headlines(self, headlines: List[NewsHeadline]):
+        """Append this cycle's headlines to the archive in one batch"""
+        if self.archive is None or not headlines:
+            return
         try:
-            # Try RSS first
-            headlines = self.rss_service.fetch_rss_feed(source)
-            source.status = "active"
-            source.last_updated = headlines[0].fetched_at if headlines else None
-            
-        except Exception as rss_error:
-            logger.warning(f"RSS failed for {source.name}, trying scraping: {rss_error}")
-            
+            inserted = self.archive.append(headlines)
+            logger.info("Archived %s new headlines", inserted)
+        except Exception as e:
+            logger.error("Error archiving headlines: %s", e)
+
+    def _refresh_source(self, source: NewsSource) -> List[NewsHeadline]:
+        """Refresh data from a single source"""
+        return self._fetch_source(source).headlines
+
+    def _fetch_source(self, source: NewsSource) -> NewsSource:
+        """Fetch a source and publish it to the cache; returns the updated copy"""
+        # Registry snapshots are shared and immutable; fetch state goes on a private copy
+        source = source.model_copy()
+        source.last_fetched = datetime.now(timezone.utc)
+        tracer = get_tracer()
+        with tracer.start_trace("refresh.source", source=source.name) as span:
             try:
-                # Fallback to scraping
-                headlines = self.scraping_service.scrape_headlines(source)
+                # Try RSS first
+                headlines = self.rss_service.fetch_rss_feed(source)
                 source.status = "active"
                 source.last_updated = headlines[0].fetched_at if headlines else None
+            
+            except Exception as rss_error:
+                logger.warning("RSS failed for %s, trying scraping: %s", source.name, rss_error)
+            
+                try:
+                    # Fallback to scraping
+                    headlines = self.scraping_service.scrape_headlines(source)
+                    source.status = "active"
+                    source.last_updated = headlines[0].fetched_at if headlines else None
                 
-            except Exception as scrape_error:
-                logger.error(f"Both RSS and scraping failed for {source.name}: {scrape_error}")
-                source.status = "error"
-                headlines = []
+                except Exception as scrape_error:
+                    logger.error("Both RSS and scraping failed for %s: %s", source.name, scrape_error)
+                    source.status = "error"
+                    headlines = []
         
-        # Update source with headlines
-        source.headlines = headlines
-        source_with_headlines = source
+            # The timeline merge relies on every source being newest first
+            headlines.sort(key=lambda headline: headline.published_at, reverse=True)
+
+            if self.link_resolver is not None and headlines:
+                with tracer.span("resolve") as resolve_span:
+                    headlines, rewritten = self.link_resolver.resolve_headlines(
+                        headlines, on_settled=lambda: self._refetch_after_lookups(source.name)
+                    )
+                    resolve_span.set_attribute("links", rewritten)
+
+            # Tag near-duplicates across sources before the headlines become visible
+            with tracer.span("cluster"):
+                self.clustering_service.assign(source.name, headlines)
+            with tracer.span("tag"):
+                self.entity_service.tag(headlines)
+
+            # Update source with headlines
+            source.headlines = headlines
+            source_with_headlines = source
         
-        # Update cache (thread-safe)
-        with self._lock:
-            self.cache.update_source(source_with_headlines)
+            # Update cache (thread-safe)
+            with tracer.span("cache.write"), self._lock:
+                self.cache.update_source(source_with_headlines)
+            self.entity_service.index_source(source_with_headlines)
+            with tracer.span("watchlists") as watchlist_span:
+                watchlist_span.set_attribute("matches", self.watchlist_service.ingest_source(source_with_headlines))
+            self.stats_service.record_fetch(source_with_headlines, succeeded=source.status == "active")
+            span.set_attribute("status", source.status)
+            span.set_attribute("headlines", len(headlines))
+
+            return source_with_headlines
 
-    def _format_response(self) -> Dict[str, Any]:
+    def _format_response(
+        self,
+        collapse: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        limit_per_source: Optional[int] = None,
+        tickers: Optional[Sequence[str]] = None,
+        entities: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
         """Format cached data for API response"""
-        cached_sources = self.cache.get_all_sources()
-        sources_response = []
+        tracer = get_tracer()
+        # One generation for the whole response: sources, counts and timestamp agree
+        # even while a refresh publishes sources alongside this read
+        with tracer.span("cache.read"):
+            snapshot = self.cache.snapshot()
+        cached_sources = snapshot.sources
 
-        for source in cached_sources.values():
-            source_response = {
-                "name": source.name,
-                "headlines": [
-                    NewsHeadlineResponse(
-                        title=headline.title,
-                        link=headline.link,
-                        published_at=headline.published_at.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z'),
-                        source=headline.source
-                    ).model_dump() for headline in source.headlines
-                ],
-                "status": source.status,
-                "last_updated": (source.last_updated.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z') if source.last_updated else None),
-                "story_count": len(source.headlines)
+        selected = None
+        if tickers or entities:
+            with tracer.span("index.lookup"):
+                selected = self.entity_service.lookup(cached_sources, tickers or (), entities or ())
+
+        with tracer.span("format"):
+            sources_response = []
+            seen_clusters = set()
+            fields = tuple(fields) if fields else self.HEADLINE_FIELDS
+
+            for source in cached_sources.values():
+                headlines = source.headlines if selected is None else selected.get(source.name, [])
+                if collapse:
+                    headlines = [h for h in headlines if not self._seen_cluster(h, seen_clusters)]
+                if limit_per_source is not None:
+                    headlines = headlines[:limit_per_source]
+                source_response = {
+                    "name": source.name,
+                    "headlines": [self._project_headline(headline, fields) for headline in headlines],
+                    "status": source.status,
+                    "last_updated": (source.last_updated.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z') if source.last_updated else None),
+                    "story_count": len(headlines)
+                }
+                sources_response.append(source_response)
+
+            return {
+                "sources": sources_response,
+                "total_sources": len(cached_sources),
+                "active_sources": snapshot.active_sources,
+                "last_updated": snapshot.last_refresh.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z'),
+                "cache_status": self.cache.cache_status
             }
-            sources_response.append(source_response)
-        
-        total_sources = len(cached_sources)
-        active_sources = sum(1 for src in cached_sources.values() if src.status == "active")
 
-        return {
-            "sources": sources_response,
-            "total_sources": total_sources,
-            "active_sources": active_sources,
-            "last_updated": self.cache.last_refresh.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z'),
-            "cache_status": self.cache.cache_status
-        }
+    @staticmethod
+    def _project_headline(headline: NewsHeadline, fields: Sequence[str]) -> Dict[str, Any]:
+        """Render only the requested NewsHeadlineResponse fields of a headline"""
+        row: Dict[str, Any] = {}
+        for field in fields:
+            if field == "published_at":
+                row[field] = headline.published_at.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+            else:
+                row[field] = getattr(headline, field)
+        return row
+
+    @staticmethod
+    def _seen_cluster(headline: NewsHeadline, seen_clusters: set) -> bool:
+        """Record the headline's cluster and report whether it was already shown"""
+        if headline.cluster_id is None:
+            return False
+        if headline.cluster_id in seen_clusters:
+            return True
+        seen_clusters.add(headline.cluster_id)
+        return False
 
     def get_sources_config(self) -> List[Dict[str, Any]]:
         """Get source configuration"""
-        sources = SourceConfig.get_source_configs()
+        sources = self.source_registry.all_sources()
         return [
             {
                 "name": source.name,
                 "rss_url": source.rss_url,
                 "fallback_url": source.fallback_url,
                 "enabled": source.enabled,
-                "max_stories": source.max_stories
+                "max_stories": source.max_stories,
+                "priority": source.priority,
+                "weight": source.weight
             }
             for source in sources
         ]
 
     def get_source_status(self, source_name: str) -> Dict[str, Any]:
         """Get status of a specific source"""
-        # First check if source exists in configuration
-        config_source = SourceConfig.get_source_by_name(source_name)
+        config_source = self._configured_source(source_name)
+        return self._source_status(config_source, self.cache.snapshot())
+
+    async def get_source_status_async(self, source_name: str) -> Dict[str, Any]:
+        """``get_source_status`` from one awaited cache read"""
+        config_source = self._configured_source(source_name)
+        return self._source_status(config_source, await self.async_cache.snapshot())
+
+    def _configured_source(self, source_name: str) -> NewsSource:
+        config_source = self.source_registry.get(source_name)
         if not config_source:
             raise ValueError(f"Source '{source_name}' not found")
-        
-        # Get cached status if available, otherwise use config
-        cached_source = self.cache.get_source(source_name)
-        source = cached_source if cached_source else config_source
-        
+        return config_source
+
+    @staticmethod
+    def _source_status(config_source: NewsSource, snapshot: CacheSnapshot) -> Dict[str, Any]:
+        # Cached status if available, otherwise the configuration
+        source = snapshot.sources.get(config_source.name) or config_source
         return {
             "source": source.name,
             "status": source.status,
             "error": None if source.status == "active" else f"Source has status: {source.status}",
-            "last_attempt": self.cache.last_refresh.isoformat(),
-            "last_success": source.last_updated.isoformat() if source.last_updated else None
+            "last_attempt": snapshot.last_refresh.isoformat(),
+            "last_success": source.last_updated.isoformat() if source.last_updated else None,
+            "headlines": len(source.headlines),
+            "memory_bytes": snapshot.source_bytes.get(source.name, 0),
+        }
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """Estimated cache size against the configured budget"""
+        return self._memory_usage(self.cache.snapshot())
+
+    async def memory_usage_async(self) -> Dict[str, Any]:
+        return self._memory_usage(await self.async_cache.snapshot())
+
+    def _memory_usage(self, snapshot: CacheSnapshot) -> Dict[str, Any]:
+        budget = self.async_cache.memory_budget
+        return {
+            "estimated_bytes": snapshot.memory_bytes,
+            # Including older generations kept for timeline cursors (in-memory cache)
+            "reachable_bytes": getattr(self.cache, "reachable_bytes", snapshot.memory_bytes),
+            "budget_bytes": budget.max_bytes or None,
+            "eviction_policy": budget.policy,
+            "evicted_headlines": budget.evicted_headlines,
+            "sources": dict(snapshot.source_bytes),
+        }
+
+    async def cache_overview(self) -> Dict[str, Any]:
+        """Cache freshness, counts and size from a single awaited read, for /health and /metrics"""
+        snapshot = await self.async_cache.snapshot()
+        fresh = is_fresh(snapshot.last_refresh, self.async_cache.refresh_interval_minutes)
+        memory = self._memory_usage(snapshot)
+        del memory["sources"]
+        return {
+            "status": "fresh" if fresh else "stale",
+            "last_refresh": snapshot.last_refresh,
+            "total_sources": len(snapshot.sources),
+            "active_sources": snapshot.active_sources,
+            "generation": snapshot.generation,
+            "memory": memory,
         }
 
     def refresh_news(self) -> Dict[str, Any]:
         """Manually trigger news refresh"""
         try:
-            sources = SourceConfig.get_enabled_sources()
-            
-            # Clear cache to force fresh fetch
-            self.cache.clear()
-            
-            # Fetch fresh data
-            self._refresh_all_sources()
-            
+            sources = self.source_registry.enabled_sources()
+
+            # Serve current data instead of refetching if a refresh just completed or is
+            # already running; sources are overwritten in place so readers never see an empty cache
+            if self._refreshed_recently() or not self._refresh_once():
+                return {
+                    "message": "Data was refreshed recently; returning current data",
+                    "sources_to_refresh": 0,
+                    "last_updated": self.cache.last_refresh.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z'),
+                    "cache_status": self.cache.cache_status
+                }
+
             return {
                 "message": "Refresh triggered successfully",
                 "sources_to_refresh": len(sources)
             }
             
         except Exception as e:
-            logger.error(f"Error in refresh_news: {e}")
+            logger.error("Error in refresh_news: %s", e)
             raise Exception(f"Error refreshing news: {e}")
@@ -1,13 +1,11 @@
-import feedparser
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from functools import cached_property
 from typing import List
 from datetime import datetime, timezone
 import calendar
 from email.utils import parsedate_to_datetime
 from ..models.news_headline import NewsHeadline
 from ..models.news_source import NewsSource
+from ..tracing import get_tracer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,42 +16,93 @@ class RSSService:
 
     MAX_STORY_AGE_SECONDS = 2592000  # 30 days
 
-    def __init__(self, timeout: int = 10, pool_maxsize: int = 100):
+    def __init__(self, timeout: int = 10, pool_maxsize: int = 100, transport=None):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.pool_maxsize = pool_maxsize
+        # Optional HttpTransport that records, replays or breaks the responses
+        self.transport = transport
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'application/rss+xml, application/xml, text/xml',
+            'Accept-Language': 'en-US,en;q=0.9',
+        }
+
+    @cached_property
+    def session(self):
+        """Pooled session with retries, built on first fetch so startup skips requests/urllib3"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
         retries = Retry(
             total=2,
             backoff_factor=0.2,
             status_forcelist=[502, 503, 504],
             allowed_methods=["GET", "HEAD"],
         )
-        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retries)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/rss+xml, application/xml, text/xml',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_maxsize, pool_maxsize=self.pool_maxsize, max_retries=retries
+        )
+        if self.transport is not None:
+            adapter = self.transport.adapter(adapter)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def fetch_rss_feed(self, source: NewsSource) -> List[NewsHeadline]:
         """Fetch and parse RSS feed for a given source"""
+        import requests
+
         try:
-            logger.info(f"Fetching RSS feed for {source.name}: {source.rss_url}")
+            logger.info("Fetching RSS feed for %s: %s", source.name, source.rss_url)
+
+            tracer = get_tracer()
+            # Fetch RSS feed using pooled session; streaming splits connect from download
+            with tracer.span("http.connect", **{"http.url": source.rss_url}) as span:
+                response = self.session.get(
+                    source.rss_url,
+                    timeout=(2, self.timeout),
+                    headers=self.headers,
+                    stream=True,
+                )
+                span.set_attribute("http.status_code", response.status_code)
+            try:
+                response.raise_for_status()
+                with tracer.span("http.download") as span:
+                    content = response.content
+                    span.set_attribute("http.response_size", len(content))
+            finally:
+                response.close()
+
+            headlines = self.parse_feed(content, source)
+
+            logger.info("Successfully fetched %s headlines from %s (sorted by freshness)", len(headlines), source.name)
+            return headlines
 
-            # Fetch RSS feed using pooled session
-            response = self.session.get(
-                source.rss_url,
-                timeout=(2, self.timeout),
-                headers=self.headers,
-            )
-            response.raise_for_status()
+        except requests.Timeout:
+            logger.error("Timeout fetching RSS feed for %s", source.name)
+            raise Exception(f"Timeout fetching RSS feed for {source.name}")
+        except requests.RequestException as e:
+            logger.error("Error fetching RSS feed for %s: %s", source.name, e)
+            raise Exception(f"Error fetching RSS feed for {source.name}: {e}")
+        except Exception as e:
+            logger.error("Unexpected error fetching RSS feed for %s: %s", source.name, e)
+            raise Exception(f"Unexpected error fetching RSS feed for {source.name}: {e}")
+
+    def parse_feed(self, content: bytes, source: NewsSource) -> List[NewsHeadline]:
+        """Parse a downloaded feed into the source's freshest headlines"""
+        import feedparser
 
-            # Parse RSS feed (feedparser works directly on bytes)
-            feed = feedparser.parse(response.content)
+        tracer = get_tracer()
+        # feedparser works directly on bytes
+        with tracer.span("parse") as span:
+            feed = feedparser.parse(content)
+            span.set_attribute("feed.entries", len(feed.entries))
 
-            headlines: List[NewsHeadline] = []
-            # Process all entries first, then sort and limit
+        headlines: List[NewsHeadline] = []
+        # Process all entries first, then sort and limit
+        with tracer.span("validate"):
             for entry in feed.entries:
                 try:
                     # Parse publication date
@@ -78,25 +127,12 @@ class RSSService:
                     headlines.append(headline)
 
                 except Exception as e:
-                    logger.warning(f"Error parsing entry for {source.name}: {e}")
+                    logger.warning("Error parsing entry for %s: %s", source.name, e)
                     continue
 
-            # Sort by publication date (most recent first) and limit
-            headlines.sort(key=lambda x: x.published_at, reverse=True)
-            headlines = headlines[:source.max_stories]
-
-            logger.info(f"Successfully fetched {len(headlines)} headlines from {source.name} (sorted by freshness)")
-            return headlines
-
-        except requests.Timeout:
-            logger.error(f"Timeout fetching RSS feed for {source.name}")
-            raise Exception(f"Timeout fetching RSS feed for {source.name}")
-        except requests.RequestException as e:
-            logger.error(f"Error fetching RSS feed for {source.name}: {e}")
-            raise Exception(f"Error fetching RSS feed for {source.name}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error fetching RSS feed for {source.name}: {e}")
-            raise Exception(f"Unexpected error fetching RSS feed for {source.name}: {e}")
+        # Sort by publication date (most recent first) and limit
+        headlines.sort(key=lambda x: x.published_at, reverse=True)
+        return headlines[:source.max_stories]
 
     def _parse_published_date(self, entry) -> datetime:
         """Parse publication date from RSS entry as UTC-aware datetime"""
@@ -126,5 +162,5 @@ class RSSService:
             return datetime.now(timezone.utc)
 
         except Exception as e:
-            logger.warning(f"Error parsing date from RSS entry: {e}, using current time (UTC)")
+            logger.warning("Error parsing date from RSS entry: %s, using current time (UTC)", e)
             return datetime.now(timezone.utc)
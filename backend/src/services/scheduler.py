@@ -1,52 +1,160 @@
 from __future__ import annotations
 
-import threading
-import time
+import asyncio
 import logging
-from typing import Optional
+import math
+import random
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+MISSED_TICK_POLICIES = ("skip", "catch_up")
+
+
+@dataclass(frozen=True)
+class TickRecord:
+    """Timing of one scheduled refresh (seconds, on the event loop clock)."""
+
+    tick: int
+    lag: float
+    duration: float
+    skipped: int
+    error: Optional[str] = None
+
 
 class RefreshScheduler:
-    """Simple background scheduler to keep the news cache warm."""
+    """Fixed-rate background refresh running as an asyncio task.
+
+    Tick ``n`` is due ``initial_delay + n * interval`` after start, plus a random jitter of
+    up to ``jitter_seconds`` so processes started together spread their load, and
+    regardless of how long earlier refreshes took. When a refresh overruns later ticks,
+    ``missed_tick_policy`` decides what happens: ``skip`` drops them and waits for the next
+    future tick, ``catch_up`` runs them back to back.
+
+    ``refresh_fn`` is blocking and runs in the default executor. On ``stop`` the
+    ``cancel_fn`` asks an in-flight refresh to wind down, and the scheduler waits up to
+    ``shutdown_timeout`` seconds for it.
+    """
 
     def __init__(
         self,
-        refresh_fn,
-        interval_seconds: int,
-        initial_delay_seconds: int = 5,
+        refresh_fn: Callable[[], Any],
+        interval_seconds: float,
+        initial_delay_seconds: float = 5,
+        jitter_seconds: float = 0,
+        missed_tick_policy: str = "skip",
+        cancel_fn: Optional[Callable[[], None]] = None,
+        shutdown_timeout: float = 10,
+        history: int = 50,
     ) -> None:
+        if missed_tick_policy not in MISSED_TICK_POLICIES:
+            raise ValueError(f"missed_tick_policy must be one of {MISSED_TICK_POLICIES}")
         self._refresh = refresh_fn
         self._interval = max(interval_seconds, 0)
         self._initial_delay = max(initial_delay_seconds, 0)
-        self._stop_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
+        self._jitter = max(jitter_seconds, 0)
+        self.missed_tick_policy = missed_tick_policy
+        self._cancel = cancel_fn
+        self._shutdown_timeout = shutdown_timeout
+        self._task: Optional[asyncio.Task] = None
+        self.ticks: Deque[TickRecord] = deque(maxlen=history)
+        self.missed_ticks = 0
+
+    @property
+    def interval_seconds(self) -> float:
+        return self._interval
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
 
     def start(self) -> None:
         if self._interval <= 0:
             logger.info("RefreshScheduler disabled (interval <= 0)")
             return
-        if self._thread and self._thread.is_alive():
+        if self.running:
             return
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
-        logger.info("RefreshScheduler started with %ss interval", self._interval)
-
-    def stop(self) -> None:
-        self._stop_event.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=5)
-            logger.info("RefreshScheduler stopped")
-
-    def _run(self) -> None:
-        if self._initial_delay:
-            logger.debug("RefreshScheduler initial delay %ss", self._initial_delay)
-            if self._stop_event.wait(self._initial_delay):
-                return
-        while not self._stop_event.wait(self._interval):
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="refresh-scheduler")
+        logger.info(
+            "RefreshScheduler started with %ss interval (jitter %ss, missed ticks: %s)",
+            self._interval,
+            self._jitter,
+            self.missed_tick_policy,
+        )
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        logger.info("RefreshScheduler stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        last = self.ticks[-1] if self.ticks else None
+        return {
+            "interval_seconds": self._interval,
+            "jitter_seconds": self._jitter,
+            "missed_tick_policy": self.missed_tick_policy,
+            "missed_ticks": self.missed_ticks,
+            "last_tick": asdict(last) if last else None,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        origin = loop.time() + self._initial_delay
+        tick = 0
+        while True:
+            due = origin + tick * self._interval + random.uniform(0, self._jitter)
+            await asyncio.sleep(max(0.0, due - loop.time()))
+
+            started = loop.time()
+            error = None
             try:
-                self._refresh()
+                await self._run_refresh(loop)
+            except asyncio.CancelledError:
+                raise
             except Exception as exc:  # pragma: no cover - defensive logging
                 logger.exception("Scheduled refresh failed: %s", exc)
+                error = str(exc)
+            finished = loop.time()
+
+            next_tick = tick + 1
+            skipped = 0
+            if self.missed_tick_policy == "skip":
+                # First tick whose slot has not started yet
+                next_tick = max(next_tick, math.ceil((finished - origin) / self._interval))
+                skipped = next_tick - tick - 1
+                self.missed_ticks += skipped
+
+            record = TickRecord(
+                tick=tick,
+                lag=round(started - due, 4),
+                duration=round(finished - started, 4),
+                skipped=skipped,
+                error=error,
+            )
+            self.ticks.append(record)
+            logger.info(
+                "Scheduled refresh tick %s took %.2fs (lag %.3fs, skipped %s)",
+                tick,
+                record.duration,
+                record.lag,
+                skipped,
+            )
+            tick = next_tick
 
+    async def _run_refresh(self, loop: asyncio.AbstractEventLoop) -> None:
+        future = loop.run_in_executor(None, self._refresh)
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The executor thread cannot be interrupted; ask it to stop early and let it finish
+            if self._cancel:
+                self._cancel()
+            await asyncio.wait([future], timeout=self._shutdown_timeout)
+            raise
@@ -1,66 +1,97 @@
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime, timezone
 from ..models.news_headline import NewsHeadline
 from ..models.news_source import NewsSource
+from ..tracing import get_tracer
 import logging
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 logger = logging.getLogger(__name__)
 
 
 class ScrapingService:
     """Service for web scraping when RSS fails"""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, transport=None):
         self.timeout = timeout
+        # Optional HttpTransport that records, replays or breaks the responses
+        self.transport = transport
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        }
+
+    @cached_property
+    def session(self):
+        """Session reused across scrapes, built on first use so startup skips requests/urllib3"""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter()
+        if self.transport is not None:
+            adapter = self.transport.adapter(adapter)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def scrape_headlines(self, source: NewsSource) -> List[NewsHeadline]:
         """Scrape headlines from fallback URL"""
+        # Only needed when RSS fails, so kept out of the startup import path
+        import requests
+
         try:
-            logger.info(f"Scraping headlines for {source.name}: {source.fallback_url}")
+            logger.info("Scraping headlines for %s: %s", source.name, source.fallback_url)
             
             # Fetch webpage
-            response = requests.get(
-                source.fallback_url,
-                timeout=self.timeout,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1'
-                }
-            )
+            with get_tracer().span("scrape.download", **{"http.url": source.fallback_url}):
+                response = self.session.get(source.fallback_url, timeout=self.timeout, headers=self.headers)
             response.raise_for_status()
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract headlines based on source-specific selectors
-            headlines = self._extract_headlines(soup, source)
-            
-            # Limit to max_stories
-            headlines = headlines[:source.max_stories]
+            headlines = self.parse_page(response.content, source)
             
-            logger.info(f"Successfully scraped {len(headlines)} headlines from {source.name}")
+            logger.info("Successfully scraped %s headlines from %s", len(headlines), source.name)
             return headlines
             
         except requests.Timeout:
-            logger.error(f"Timeout scraping {source.name}")
+            logger.error("Timeout scraping %s", source.name)
             raise Exception(f"Timeout scraping {source.name}")
         except requests.RequestException as e:
-            logger.error(f"Error scraping {source.name}: {e}")
+            logger.error("Error scraping %s: %s", source.name, e)
             raise Exception(f"Error scraping {source.name}: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error scraping {source.name}: {e}")
+            logger.error("Unexpected error scraping %s: %s", source.name, e)
             raise Exception(f"Unexpected error scraping {source.name}: {e}")
 
-    def _extract_headlines(self, soup: BeautifulSoup, source: NewsSource) -> List[NewsHeadline]:
+    def parse_page(self, content: bytes, source: NewsSource) -> List[NewsHeadline]:
+        """Extract up to ``max_stories`` headlines from a downloaded page"""
+        from bs4 import BeautifulSoup
+
+        tracer = get_tracer()
+        # Parse HTML
+        with tracer.span("scrape.parse"):
+            soup = BeautifulSoup(content, 'html.parser')
+
+        # Extract headlines based on source-specific selectors
+        with tracer.span("scrape.select"):
+            headlines = self._extract_headlines(soup, source)
+
+        # Limit to max_stories
+        return headlines[:source.max_stories]
+
+    def _extract_headlines(self, soup: "BeautifulSoup", source: NewsSource) -> List[NewsHeadline]:
         """Extract headlines using source-specific logic"""
         headlines = []
+        # One timestamp per page keeps page order and the newest-first invariant
+        scraped_at = datetime.now(timezone.utc)
         
         # Define selectors for different sources
         selectors = self._get_selectors_for_source(source.name)
@@ -71,18 +102,18 @@ class ScrapingService:
                 
                 for element in elements[:source.max_stories]:
                     try:
-                        headline = self._parse_headline_element(element, source)
+                        headline = self._parse_headline_element(element, source, scraped_at)
                         if headline:
                             headlines.append(headline)
                     except Exception as e:
-                        logger.warning(f"Error parsing headline element for {source.name}: {e}")
+                        logger.warning("Error parsing headline element for %s: %s", source.name, e)
                         continue
                         
                 if headlines:
                     break
                     
             except Exception as e:
-                logger.warning(f"Error using selector '{selector}' for {source.name}: {e}")
+                logger.warning("Error using selector '%s' for %s: %s", selector, source.name, e)
                 continue
         
         return headlines
@@ -108,7 +139,9 @@ class ScrapingService:
         # Return source-specific selectors if available, otherwise generic
         return source_selectors.get(source_name, generic_selectors)
 
-    def _parse_headline_element(self, element, source: NewsSource) -> Optional[NewsHeadline]:
+    def _parse_headline_element(
+        self, element, source: NewsSource, scraped_at: Optional[datetime] = None
+    ) -> Optional[NewsHeadline]:
         """Parse a single headline element"""
         try:
             # Extract text
@@ -131,12 +164,12 @@ class ScrapingService:
             headline = NewsHeadline(
                 title=title,
                 link=link,
-                published_at=datetime.now(),  # Scraping doesn't always provide exact dates
+                published_at=scraped_at or datetime.now(timezone.utc),  # Scraping doesn't always provide exact dates
                 source=source.name
             )
             
             return headline
             
         except Exception as e:
-            logger.warning(f"Error parsing headline element: {e}")
+            logger.warning("Error parsing headline element: %s", e)
             return None
\ No newline at end of file
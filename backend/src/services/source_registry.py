@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import yaml
+
+from ..models.news_source import NewsSource
+from ..models.source_config import SourceConfig
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FIELDS = ("name", "rss_url", "fallback_url", "enabled", "max_stories", "priority", "weight")
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """Immutable, validated view of the source catalog."""
+
+    version: int
+    sources: Tuple[NewsSource, ...]
+    by_name: Mapping[str, NewsSource]
+    enabled: Tuple[NewsSource, ...]
+
+    @classmethod
+    def build(cls, version: int, sources: Sequence[NewsSource]) -> "RegistrySnapshot":
+        by_name: Dict[str, NewsSource] = {}
+        for source in sources:
+            if source.name in by_name:
+                raise ValueError(f"Duplicate source name '{source.name}'")
+            by_name[source.name] = source
+        return cls(
+            version=version,
+            sources=tuple(sources),
+            by_name=MappingProxyType(by_name),
+            enabled=tuple(source for source in sources if source.enabled),
+        )
+
+
+@dataclass(frozen=True)
+class RegistryDiff:
+    """Sources added, removed or reconfigured between two snapshots."""
+
+    added: Tuple[NewsSource, ...] = ()
+    removed: Tuple[str, ...] = ()
+    changed: Tuple[NewsSource, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _config_of(source: NewsSource) -> Dict[str, Any]:
+    return {name: getattr(source, name) for name in CONFIG_FIELDS}
+
+
+def diff_snapshots(old: RegistrySnapshot, new: RegistrySnapshot) -> RegistryDiff:
+    added = tuple(s for name, s in new.by_name.items() if name not in old.by_name)
+    removed = tuple(name for name in old.by_name if name not in new.by_name)
+    changed = tuple(
+        s
+        for name, s in new.by_name.items()
+        if name in old.by_name and _config_of(s) != _config_of(old.by_name[name])
+    )
+    return RegistryDiff(added=added, removed=removed, changed=changed)
+
+
+class SourceRegistry:
+    """Source catalog loaded from YAML, validated once and indexed by name.
+
+    Readers use the current snapshot, which is replaced with a single reference swap
+    on reload. When no catalog file exists the built-in ``SourceConfig.SOURCES`` are used.
+    """
+
+    def __init__(self, path: Optional[str | Path] = None) -> None:
+        self.path = Path(path) if path else None
+        self._listeners: List[Callable[[RegistryDiff], None]] = []
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot = RegistrySnapshot.build(1, self._read_sources())
+
+    # Reads -----------------------------------------------------------------
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        return self._snapshot
+
+    def get(self, name: str) -> Optional[NewsSource]:
+        return self._snapshot.by_name.get(name)
+
+    def all_sources(self) -> Tuple[NewsSource, ...]:
+        return self._snapshot.sources
+
+    def enabled_sources(self) -> Tuple[NewsSource, ...]:
+        return self._snapshot.enabled
+
+    # Loading ---------------------------------------------------------------
+    def _read_sources(self) -> List[NewsSource]:
+        if self.path is None or not self.path.exists():
+            if self.path is not None:
+                logger.warning("No source catalog at %s; using the built-in sources", self.path)
+            self._file_signature = None
+            self._digest = None
+            return [NewsSource(**config) for config in SourceConfig.SOURCES]
+
+        stat = self.path.stat()
+        raw = self.path.read_bytes()
+        data = yaml.safe_load(raw) or {}
+        entries = data.get("sources", []) if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError(f"{self.path}: expected a list of sources")
+
+        sources = [NewsSource(**entry) for entry in entries]
+        self._file_signature = (stat.st_mtime_ns, stat.st_size)
+        self._digest = hashlib.sha256(raw).hexdigest()
+        logger.info("Loaded %s sources from %s", len(sources), self.path)
+        return sources
+
+    def _file_changed(self) -> bool:
+        if self.path is None:
+            return False
+        if not self.path.exists():
+            return self._file_signature is not None
+        stat = self.path.stat()
+        if (stat.st_mtime_ns, stat.st_size) == self._file_signature:
+            return False
+        return hashlib.sha256(self.path.read_bytes()).hexdigest() != self._digest
+
+    def reload(self, force: bool = False) -> RegistryDiff:
+        """Reload the catalog if the file changed and notify listeners of the diff.
+
+        An invalid file is logged and the previous snapshot is kept.
+        """
+        with self._reload_lock:
+            if not force and not self._file_changed():
+                return RegistryDiff()
+            previous = self._snapshot
+            try:
+                snapshot = RegistrySnapshot.build(previous.version + 1, self._read_sources())
+            except Exception as exc:
+                logger.error("Keeping previous source catalog; reload failed: %s", exc)
+                return RegistryDiff()
+
+            diff = diff_snapshots(previous, snapshot)
+            self._snapshot = snapshot
+
+        if diff:
+            logger.info(
+                "Source catalog v%s: %s added, %s removed, %s changed",
+                snapshot.version,
+                len(diff.added),
+                len(diff.removed),
+                len(diff.changed),
+            )
+            for listener in list(self._listeners):
+                try:
+                    listener(diff)
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    logger.exception("Source catalog listener failed: %s", exc)
+        return diff
+
+    def subscribe(self, listener: Callable[[RegistryDiff], None]) -> None:
+        self._listeners.append(listener)
+
+    # Watching --------------------------------------------------------------
+    def start_watching(self, interval_seconds: float) -> None:
+        if self.path is None or interval_seconds <= 0:
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._watch, args=(interval_seconds,), daemon=True
+        )
+        self._thread.start()
+        logger.info("Watching %s for changes every %ss", self.path, interval_seconds)
+
+    def stop_watching(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+
+    def _watch(self, interval_seconds: float) -> None:
+        while not self._stop_event.wait(interval_seconds):
+            self.reload()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from ..models.news_source import NewsSource
+
+HEADLINES = "headlines"
+LATENCY_SUM = "latency_sum"
+LATENCY_COUNT = "latency_count"
+LATENCY_MAX = "latency_max"
+FETCHES = "fetches"
+SUCCESSES = "successes"
+SOURCE_FIELDS = (HEADLINES, LATENCY_SUM, LATENCY_COUNT, LATENCY_MAX, FETCHES, SUCCESSES)
+
+CYCLES = "cycles"
+CYCLE_SECONDS = "cycle_seconds"
+CYCLE_FIELDS = (CYCLES, CYCLE_SECONDS)
+
+_MAXIMA = frozenset({LATENCY_MAX})
+
+
+class _Ring:
+    """Fixed number of time buckets, each a few counters, reused as time moves on.
+
+    Slot ``i`` holds bucket ``epoch`` where ``epoch % size == i``; a slot still holding
+    an older epoch is stale and is reset on its next write, or read as zeros.
+    """
+
+    __slots__ = ("size", "epochs", "values")
+
+    def __init__(self, size: int, fields: Sequence[str]) -> None:
+        self.size = size
+        self.epochs = [-1] * size
+        self.values = {field: [0.0] * size for field in fields}
+
+    def add(self, epoch: int, field: str, value: float) -> None:
+        slot = epoch % self.size
+        if self.epochs[slot] != epoch:
+            if self.epochs[slot] > epoch:
+                # Older than anything this ring still covers
+                return
+            self.epochs[slot] = epoch
+            for values in self.values.values():
+                values[slot] = 0.0
+        values = self.values[field]
+        values[slot] = max(values[slot], value) if field in _MAXIMA else values[slot] + value
+
+    def totals(self, first_epoch: int, count: int, group: int) -> Dict[str, List[float]]:
+        """``count`` buckets of ``group`` consecutive epochs each, starting at ``first_epoch``"""
+        totals = {field: [0.0] * count for field in self.values}
+        for offset in range(count * group):
+            epoch = first_epoch + offset
+            slot = epoch % self.size
+            if self.epochs[slot] != epoch:
+                continue
+            bucket = offset // group
+            for field, values in self.values.items():
+                if field in _MAXIMA:
+                    totals[field][bucket] = max(totals[field][bucket], values[slot])
+                else:
+                    totals[field][bucket] += values[slot]
+        return totals
+
+
+class StatsService:
+    """Per-source headline, latency and fetch counters in time-bucketed ring buffers.
+
+    Counters are updated as sources are ingested and refresh cycles finish, at a
+    resolution of ``bucket_seconds`` for ``retention_seconds``. Headlines count in the
+    bucket they were published in, latency (``fetched_at - published_at``) and fetch
+    outcomes in the bucket they were fetched in; headlines dated after their fetch
+    count as published when fetched. Only headlines new since a source's previous
+    ingest are counted. Sources fetched by another process are picked up by ``sync``
+    from the cache, including the outcome of their latest fetch; several fetches of
+    one source between two syncs count as one. Queries roll base buckets up into coarser ones, so
+    their cost depends on the number of buckets, never on the number of headlines.
+    """
+
+    def __init__(self, bucket_seconds: int = 300, retention_seconds: int = 48 * 3600) -> None:
+        if bucket_seconds <= 0 or retention_seconds < bucket_seconds:
+            raise ValueError("bucket_seconds must be positive and no longer than retention_seconds")
+        self.bucket_seconds = bucket_seconds
+        self.size = -(-retention_seconds // bucket_seconds)
+        self.retention_seconds = self.size * bucket_seconds
+        self._sources: Dict[str, _Ring] = {}
+        self._cycles = _Ring(self.size, CYCLE_FIELDS)
+        # Source name -> (version, links) as of the last ingest
+        self._seen: Dict[str, Tuple[Tuple[object, object, int], FrozenSet[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _epoch(self, moment: datetime | float) -> int:
+        timestamp = moment.timestamp() if isinstance(moment, datetime) else moment
+        return int(timestamp // self.bucket_seconds)
+
+    def _ring(self, source_name: str) -> _Ring:
+        ring = self._sources.get(source_name)
+        if ring is None:
+            ring = self._sources[source_name] = _Ring(self.size, SOURCE_FIELDS)
+        return ring
+
+    # Recording -------------------------------------------------------------
+    @staticmethod
+    def _version(source: NewsSource) -> Tuple[object, object, int]:
+        return (source.last_fetched, source.last_updated, len(source.headlines))
+
+    def record_fetch(self, source: NewsSource, succeeded: bool, at: Optional[float] = None) -> None:
+        """Count a fetch attempt and the source's new headlines"""
+        epoch = self._epoch(time.time() if at is None else at)
+        with self._lock:
+            ring = self._ring(source.name)
+            self._count_fetch(ring, epoch, succeeded)
+            self._ingest(source, ring)
+
+    def record_cycle(self, duration_seconds: float, at: Optional[float] = None) -> None:
+        epoch = self._epoch(time.time() if at is None else at)
+        with self._lock:
+            self._cycles.add(epoch, CYCLES, 1)
+            self._cycles.add(epoch, CYCLE_SECONDS, duration_seconds)
+
+    def sync(self, sources: Mapping[str, NewsSource]) -> None:
+        """Count fetches and headlines of sources written to the cache by another process (queue workers)"""
+        with self._lock:
+            for source in sources.values():
+                seen = self._seen.get(source.name)
+                if seen is not None and seen[0] == self._version(source):
+                    continue
+                ring = self._ring(source.name)
+                if source.last_fetched is not None and (seen is None or seen[0][0] != source.last_fetched):
+                    self._count_fetch(ring, self._epoch(source.last_fetched), source.status == "active")
+                self._ingest(source, ring)
+
+    def remove_source(self, source_name: str) -> None:
+        with self._lock:
+            self._sources.pop(source_name, None)
+            self._seen.pop(source_name, None)
+
+    @staticmethod
+    def _count_fetch(ring: _Ring, epoch: int, succeeded: bool) -> None:
+        ring.add(epoch, FETCHES, 1)
+        if succeeded:
+            ring.add(epoch, SUCCESSES, 1)
+
+    def _ingest(self, source: NewsSource, ring: _Ring) -> None:
+        _, seen = self._seen.get(source.name, (None, frozenset()))
+        self._seen[source.name] = (self._version(source), frozenset(h.link for h in source.headlines))
+        now = time.time()
+        for headline in source.headlines:
+            if headline.link in seen:
+                continue
+            # Clamped so a future date never claims a slot ahead of the current buckets,
+            # where it would make the ring drop current writes as too old
+            fetched_at = min(headline.fetched_at.timestamp(), now)
+            published_at = min(headline.published_at.timestamp(), fetched_at)
+            ring.add(self._epoch(published_at), HEADLINES, 1)
+            latency = fetched_at - published_at
+            fetched = self._epoch(fetched_at)
+            ring.add(fetched, LATENCY_SUM, latency)
+            ring.add(fetched, LATENCY_COUNT, 1)
+            ring.add(fetched, LATENCY_MAX, latency)
+
+    # Queries ---------------------------------------------------------------
+    def query(
+        self,
+        bucket_seconds: Optional[int] = None,
+        range_seconds: Optional[int] = None,
+        sources: Optional[Sequence[str]] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, object]:
+        """Buckets of ``bucket_seconds`` covering the last ``range_seconds``, oldest first.
+
+        Both must be multiples of the base bucket size, and the range at most the
+        retention; raises ValueError otherwise.
+        """
+        bucket_seconds = bucket_seconds or 3600
+        range_seconds = range_seconds or 24 * 3600
+        if bucket_seconds % self.bucket_seconds or range_seconds % bucket_seconds:
+            raise ValueError(
+                f"bucket must be a multiple of {self.bucket_seconds}s and range a multiple of the bucket"
+            )
+        if range_seconds > self.retention_seconds:
+            raise ValueError(f"range cannot exceed the {self.retention_seconds}s of retained stats")
+
+        group = bucket_seconds // self.bucket_seconds
+        count = range_seconds // bucket_seconds
+        # Buckets align to multiples of their size; the newest holds the current moment
+        last_epoch = self._epoch(time.time() if now is None else now)
+        first_epoch = (last_epoch // group + 1 - count) * group
+        wanted = set(sources) if sources else None
+
+        with self._lock:
+            per_source = {
+                name: ring.totals(first_epoch, count, group)
+                for name, ring in self._sources.items()
+                if wanted is None or name in wanted
+            }
+            cycles = self._cycles.totals(first_epoch, count, group)
+
+        starts = [
+            datetime.fromtimestamp((first_epoch + index * group) * self.bucket_seconds, timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z")
+            for index in range(count)
+        ]
+        return {
+            "bucket_seconds": bucket_seconds,
+            "range_seconds": range_seconds,
+            "buckets": starts,
+            "sources": {name: self._source_series(totals) for name, totals in sorted(per_source.items())},
+            "cycles": {
+                "count": [int(value) for value in cycles[CYCLES]],
+                "avg_seconds": _ratios(cycles[CYCLE_SECONDS], cycles[CYCLES]),
+            },
+        }
+
+    @staticmethod
+    def _source_series(totals: Dict[str, List[float]]) -> Dict[str, List]:
+        return {
+            "headlines": [int(value) for value in totals[HEADLINES]],
+            "latency_avg_seconds": _ratios(totals[LATENCY_SUM], totals[LATENCY_COUNT]),
+            "latency_max_seconds": [
+                round(value, 3) if count else None for value, count in zip(totals[LATENCY_MAX], totals[LATENCY_COUNT])
+            ],
+            "fetches": [int(value) for value in totals[FETCHES]],
+            "success_rate": _ratios(totals[SUCCESSES], totals[FETCHES]),
+        }
+
+
+def _ratios(numerators: List[float], denominators: List[float]) -> List[Optional[float]]:
+    """Element-wise ratio, None where nothing was counted"""
+    return [round(top / bottom, 3) if bottom else None for top, bottom in zip(numerators, denominators)]
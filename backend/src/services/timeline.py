@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..cache.base import CacheSnapshot
+from ..models.news_headline import NewsHeadline
+
+
+@dataclass(frozen=True)
+class TimelineCursor:
+    """Where the previous timeline page stopped.
+
+    ``offsets`` are per-source positions in the snapshot of ``generation``. The last
+    headline's ``(timestamp, source)`` is kept as well, so paging can still resume by
+    time once that generation is no longer retained.
+    """
+
+    generation: int
+    offsets: Dict[str, int] = field(default_factory=dict)
+    last_timestamp: Optional[float] = None
+    last_source: Optional[str] = None
+
+    def encode(self) -> str:
+        payload = {"g": self.generation, "o": {k: v for k, v in self.offsets.items() if v}}
+        if self.last_timestamp is not None:
+            payload["t"] = self.last_timestamp
+            payload["s"] = self.last_source
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TimelineCursor":
+        """Parse a cursor from ``encode``; raises ValueError for anything else"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            offsets = {str(name): int(offset) for name, offset in payload.get("o", {}).items()}
+            if any(offset < 0 for offset in offsets.values()):
+                raise ValueError("negative offset")
+            timestamp = payload.get("t")
+            return cls(
+                generation=int(payload["g"]),
+                offsets=offsets,
+                last_timestamp=float(timestamp) if timestamp is not None else None,
+                last_source=str(payload["s"]) if timestamp is not None else None,
+            )
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            raise ValueError(f"Invalid timeline cursor: {exc}") from None
+
+
+@dataclass
+class TimelinePage:
+    headlines: List[NewsHeadline]
+    generation: int
+    next_cursor: Optional[str]
+
+
+def _seek(headlines: Sequence[NewsHeadline], name: str, cursor: TimelineCursor) -> int:
+    """First position ordered after the cursor's last headline in a newest-first list"""
+    if cursor.last_timestamp is None:
+        return 0
+    negated = -cursor.last_timestamp
+    key = lambda headline: -headline.published_at.timestamp()  # noqa: E731
+    # Ties on time are ordered by source name, as in the merge
+    if name > cursor.last_source:
+        return bisect_left(headlines, negated, key=key)
+    return bisect_right(headlines, negated, key=key)
+
+
+def merge_page(
+    snapshot: CacheSnapshot,
+    limit: int,
+    cursor: Optional[TimelineCursor] = None,
+    sources: Optional[Sequence[str]] = None,
+    since: Optional[datetime] = None,
+) -> TimelinePage:
+    """One page of headlines across sources, newest first, by k-way merge.
+
+    Each source's headlines are already newest first, so a heap holding the next
+    headline of every source yields the global order: a page costs
+    O(sources + limit * log sources) however many headlines are cached. Ties on
+    ``published_at`` go by source name, then position. ``cursor`` continues a
+    previous page: exactly, by offsets, when it belongs to ``snapshot``'s generation,
+    otherwise by seeking past its last headline's time.
+    """
+    wanted = set(sources) if sources else None
+    exact = cursor is not None and cursor.generation == snapshot.generation
+
+    lists: Dict[str, Sequence[NewsHeadline]] = {}
+    offsets: Dict[str, int] = {}
+    heap: List[Tuple[float, str, int]] = []
+    for name, source in snapshot.sources.items():
+        if wanted is not None and name not in wanted:
+            continue
+        headlines = source.headlines
+        if cursor is None:
+            start = 0
+        elif exact:
+            start = cursor.offsets.get(name, 0)
+        else:
+            start = _seek(headlines, name, cursor)
+        lists[name] = headlines
+        offsets[name] = start
+        if start < len(headlines):
+            heap.append((-headlines[start].published_at.timestamp(), name, start))
+    heapq.heapify(heap)
+
+    page: List[NewsHeadline] = []
+    last_name: Optional[str] = None
+    exhausted = False
+    while heap and len(page) < limit:
+        negated, name, position = heap[0]
+        headline = lists[name][position]
+        if since is not None and headline.published_at < since:
+            # Everything left is older still
+            exhausted = True
+            break
+        page.append(headline)
+        last_name = name
+        offsets[name] = position + 1
+        if position + 1 < len(lists[name]):
+            following = lists[name][position + 1]
+            heapq.heapreplace(heap, (-following.published_at.timestamp(), name, position + 1))
+        else:
+            heapq.heappop(heap)
+
+    next_cursor = None
+    if page and heap and not exhausted:
+        last = page[-1]
+        next_cursor = TimelineCursor(
+            generation=snapshot.generation,
+            offsets=offsets,
+            last_timestamp=last.published_at.timestamp(),
+            last_source=last_name,
+        ).encode()
+    return TimelinePage(headlines=page, generation=snapshot.generation, next_cursor=next_cursor)
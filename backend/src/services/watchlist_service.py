@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from bisect import insort
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore
+
+from ..models.news_headline import NewsHeadline
+from ..models.news_source import NewsSource
+from ..models.watchlist import Watchlist
+from .entity_service import AhoCorasick, tokenize
+
+logger = logging.getLogger(__name__)
+
+
+def _newest_first(headline: NewsHeadline) -> float:
+    return -headline.published_at.timestamp()
+
+
+class _Matcher:
+    """Every watchlist compiled into one matcher.
+
+    Keywords share an Aho-Corasick automaton and tickers and sources are dict
+    lookups, so matching a headline costs the same however many watchlists there are,
+    plus the number that match.
+    """
+
+    def __init__(self, watchlists: Iterable[Watchlist]) -> None:
+        keyword_owners: Dict[Tuple[str, ...], Set[str]] = {}
+        self.ticker_owners: Dict[str, Set[str]] = {}
+        self.source_owners: Dict[str, Set[str]] = {}
+        self.all_sources: Set[str] = set()
+        # Watchlists with sources only: everything from those sources matches
+        self.unconditional: Set[str] = set()
+        for watchlist in watchlists:
+            for keyword in watchlist.keywords:
+                tokens = tuple(token.lower() for token in tokenize(keyword))
+                if tokens:
+                    keyword_owners.setdefault(tokens, set()).add(watchlist.id)
+            for symbol in watchlist.tickers:
+                self.ticker_owners.setdefault(symbol, set()).add(watchlist.id)
+            for source in watchlist.sources:
+                self.source_owners.setdefault(source, set()).add(watchlist.id)
+            if not watchlist.sources:
+                self.all_sources.add(watchlist.id)
+            if not watchlist.keywords and not watchlist.tickers:
+                self.unconditional.add(watchlist.id)
+        self.keyword_owners: List[FrozenSet[str]] = [frozenset(owners) for owners in keyword_owners.values()]
+        self.keywords = AhoCorasick((tokens, value) for value, tokens in enumerate(keyword_owners))
+
+    def match(self, source_name: str, headline: NewsHeadline) -> Set[str]:
+        """Ids of the watchlists ``headline`` belongs to"""
+        allowed = self.all_sources | self.source_owners.get(source_name, set())
+        if not allowed:
+            return set()
+        matched = set(self.unconditional)
+        tokens = tokenize(headline.title)
+        if self.keyword_owners:
+            for _, value in self.keywords.iter_matches([token.lower() for token in tokens]):
+                matched |= self.keyword_owners[value]
+        if self.ticker_owners:
+            # Tagged at ingest, or the bare symbol written in the title
+            for symbol in (*headline.tickers, *tokens):
+                owners = self.ticker_owners.get(symbol)
+                if owners:
+                    matched |= owners
+        return matched & allowed
+
+
+class WatchlistService:
+    """Saved watchlists with results kept up to date at ingest.
+
+    Each ingested source is compared with what was seen of it last time, and only its
+    new headlines go through the matcher; matches are inserted into each watchlist's
+    result list (newest first, capped at ``max_results``). Reading a watchlist returns
+    that list without scanning anything. A watchlist saved or changed is backfilled
+    once from the cached headlines. Definitions persist to a JSON file when ``path``
+    is set, which other processes re-read when it changes; results are rebuilt from
+    the cache. Changes hold an exclusive lock on a ``.lock`` file beside it from
+    re-reading the file to writing it back, so processes saving at the same time
+    never overwrite each other's watchlists. At most ``max_watchlists`` are kept.
+    """
+
+    def __init__(self, path: Optional[str | Path] = None, max_watchlists: int = 100) -> None:
+        self.path = Path(path) if path else None
+        self.max_watchlists = max_watchlists
+        self._watchlists: Dict[str, Watchlist] = {}
+        self._results: Dict[str, List[NewsHeadline]] = {}
+        # (source, link) of each result, the archive's identity for a headline
+        self._result_keys: Dict[str, Set[Tuple[str, str]]] = {}
+        # Source name -> (version, links) as of the last ingest
+        self._seen: Dict[str, Tuple[Tuple[object, int], FrozenSet[str]]] = {}
+        self._lock = threading.RLock()
+        self._matcher = _Matcher(())
+        # (mtime, size) of the definitions file as last read or written
+        self._file_version: Optional[Tuple[int, int]] = None
+        if self.path is not None:
+            self._reload({})
+            logger.info("Loaded %s watchlists from %s", len(self._watchlists), self.path)
+
+    # Definitions -----------------------------------------------------------
+    def all(self) -> List[Watchlist]:
+        with self._lock:
+            return list(self._watchlists.values())
+
+    def get(self, watchlist_id: str) -> Optional[Watchlist]:
+        with self._lock:
+            return self._watchlists.get(watchlist_id)
+
+    def save(self, watchlist: Watchlist, sources: Mapping[str, NewsSource]) -> Watchlist:
+        """Create or replace a watchlist and backfill it from ``sources``.
+
+        Raises ValueError when creating one would exceed ``max_watchlists``.
+        """
+        with self._lock, self._file_lock():
+            # Keep watchlists saved by other processes since the file was last read
+            self._reload(sources)
+            if watchlist.id not in self._watchlists and len(self._watchlists) >= self.max_watchlists:
+                raise ValueError(f"At most {self.max_watchlists} watchlists can be saved")
+            self._store(watchlist, sources)
+            self._matcher = _Matcher(self._watchlists.values())
+            self._persist()
+        return watchlist
+
+    def _store(self, watchlist: Watchlist, sources: Mapping[str, NewsSource]) -> None:
+        self._watchlists[watchlist.id] = watchlist
+        self._results[watchlist.id] = []
+        self._result_keys[watchlist.id] = set()
+        backfill = _Matcher([watchlist])
+        for name, source in sources.items():
+            for headline in source.headlines:
+                if backfill.match(name, headline):
+                    self._add(watchlist.id, headline)
+
+    def delete(self, watchlist_id: str, sources: Mapping[str, NewsSource]) -> bool:
+        with self._lock, self._file_lock():
+            self._reload(sources)
+            if self._watchlists.pop(watchlist_id, None) is None:
+                return False
+            self._results.pop(watchlist_id, None)
+            self._result_keys.pop(watchlist_id, None)
+            self._matcher = _Matcher(self._watchlists.values())
+            self._persist()
+            return True
+
+    def results(self, watchlist_id: str, limit: Optional[int] = None) -> Tuple[Watchlist, List[NewsHeadline]]:
+        """The watchlist and its materialized matches, newest first, read together;
+        raises ValueError for an unknown id"""
+        with self._lock:
+            watchlist = self._watchlists.get(watchlist_id)
+            if watchlist is None:
+                raise ValueError(f"Watchlist '{watchlist_id}' not found")
+            results = self._results[watchlist_id]
+            return watchlist, list(results[:limit] if limit is not None else results)
+
+    # Ingest ----------------------------------------------------------------
+    @staticmethod
+    def _version(source: NewsSource) -> Tuple[object, int]:
+        return (source.last_updated, len(source.headlines))
+
+    def ingest_source(self, source: NewsSource) -> int:
+        """Match the headlines of ``source`` not seen at its previous ingest.
+
+        Returns the number of (watchlist, headline) matches added.
+        """
+        with self._lock:
+            _, seen = self._seen.get(source.name, (None, frozenset()))
+            links = frozenset(headline.link for headline in source.headlines)
+            self._seen[source.name] = (self._version(source), links)
+            added = 0
+            if not self._watchlists:
+                return 0
+            for headline in source.headlines:
+                if headline.link in seen:
+                    continue
+                for watchlist_id in self._matcher.match(source.name, headline):
+                    added += self._add(watchlist_id, headline)
+            return added
+
+    def reload(self, sources: Mapping[str, NewsSource]) -> None:
+        """Pick up watchlists saved by other API workers, backfilled from ``sources``"""
+        with self._lock:
+            self._reload(sources)
+
+    def sync(self, sources: Mapping[str, NewsSource]) -> None:
+        """Catch up with other processes: watchlists saved by other API workers and
+        sources written to the cache by queue workers"""
+        with self._lock:
+            self._reload(sources)
+            for source in sources.values():
+                seen = self._seen.get(source.name)
+                if seen is None or seen[0] != self._version(source):
+                    self.ingest_source(source)
+
+    def remove_source(self, source_name: str) -> None:
+        with self._lock:
+            self._seen.pop(source_name, None)
+
+    def _add(self, watchlist_id: str, headline: NewsHeadline) -> int:
+        keys = self._result_keys[watchlist_id]
+        key = (headline.source, headline.link)
+        if key in keys:
+            return 0
+        results = self._results[watchlist_id]
+        insort(results, headline, key=_newest_first)
+        keys.add(key)
+        limit = self._watchlists[watchlist_id].max_results
+        if len(results) > limit:
+            for dropped in results[limit:]:
+                keys.discard((dropped.source, dropped.link))
+            del results[limit:]
+        return 1
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _reload(self, sources: Mapping[str, NewsSource]) -> None:
+        """Re-read the definitions file if it changed; new or edited watchlists are
+        backfilled from ``sources``"""
+        if self.path is None:
+            return
+        version = self._file_stat()
+        if version == self._file_version:
+            return
+        self._file_version = version
+        rows = json.loads(self.path.read_text() or "[]") if version else []
+        definitions = {watchlist.id: watchlist for watchlist in map(Watchlist.model_validate, rows)}
+        for watchlist_id in [key for key in self._watchlists if key not in definitions]:
+            del self._watchlists[watchlist_id]
+            self._results.pop(watchlist_id, None)
+            self._result_keys.pop(watchlist_id, None)
+        for watchlist in definitions.values():
+            if self._watchlists.get(watchlist.id) != watchlist:
+                self._store(watchlist, sources)
+        self._matcher = _Matcher(self._watchlists.values())
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared with other processes using the same file"""
+        if self.path is None or fcntl is None:
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(self.path.name + ".lock"), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _persist(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps([watchlist.model_dump() for watchlist in self._watchlists.values()], indent=2)
+        fd, temporary = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(payload)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self._file_version = self._file_stat()
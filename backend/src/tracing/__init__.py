@@ -0,0 +1,16 @@
+from .base import SpanExporter
+from .logging_exporter import LoggingSpanExporter
+from .otlp import OTLPHttpExporter
+from .tracer import NOOP_SPAN, Span, Tracer, get_tracer, server_timing_header, set_tracer
+
+__all__ = [
+    "SpanExporter",
+    "LoggingSpanExporter",
+    "OTLPHttpExporter",
+    "NOOP_SPAN",
+    "Span",
+    "Tracer",
+    "get_tracer",
+    "server_timing_header",
+    "set_tracer",
+]
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from .tracer import Span
+
+
+class SpanExporter(Protocol):
+    """Protocol for destinations of finished, sampled traces."""
+
+    def export(self, spans: Sequence["Span"]) -> None:
+        """Hand over every span of one finished trace; must not block the caller."""
+        ...
+
+    def shutdown(self) -> None:
+        """Flush anything buffered and release resources."""
+        ...
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import logging
+from typing import Sequence
+
+from .tracer import Span
+
+logger = logging.getLogger("src.tracing")
+
+
+class LoggingSpanExporter:
+    """Writes one log line per sampled trace with the duration of each phase."""
+
+    def __init__(self, min_duration_ms: float = 0.0) -> None:
+        self.min_duration_ms = min_duration_ms
+
+    def export(self, spans: Sequence[Span]) -> None:
+        root = next((span for span in spans if span.is_root), None)
+        if root is None or root.duration_ms < self.min_duration_ms:
+            return
+        attributes = " ".join(f"{key}={value}" for key, value in root.attributes.items())
+        phases = " ".join(
+            f"{span.name}={span.duration_ms:.1f}ms" for span in spans if span is not root
+        )
+        logger.info(
+            "trace %032x %s %.1fms %s| %s%s",
+            root.trace.trace_id,
+            root.name,
+            root.duration_ms,
+            f"{attributes} " if attributes else "",
+            phases,
+            f" error={root.error}" if root.error else "",
+        )
+
+    def shutdown(self) -> None:
+        pass
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from .tracer import Span
+
+logger = logging.getLogger(__name__)
+
+_SPAN_KIND_INTERNAL = 1
+_SPAN_KIND_SERVER = 2
+_STATUS_ERROR = 2
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def encode_spans(spans: Sequence[Span], service_name: str) -> Dict[str, Any]:
+    """OTLP/HTTP JSON ``ExportTraceServiceRequest`` body for ``spans``"""
+    encoded = []
+    for span in spans:
+        row: Dict[str, Any] = {
+            "traceId": f"{span.trace.trace_id:032x}",
+            "spanId": f"{span.span_id:016x}",
+            "name": span.name,
+            "kind": _SPAN_KIND_SERVER if span.attributes.get("http.method") else _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.start_time_ns + (span.duration_ns or 0)),
+            "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+        }
+        if span.parent_id is not None:
+            row["parentSpanId"] = f"{span.parent_id:016x}"
+        if span.error:
+            row["status"] = {"code": _STATUS_ERROR, "message": span.error}
+        encoded.append(row)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", service_name)]},
+                "scopeSpans": [{"scope": {"name": "news-aggregator"}, "spans": encoded}],
+            }
+        ]
+    }
+
+
+class OTLPHttpExporter:
+    """Ships sampled traces to an OTLP/HTTP collector (``<endpoint>/v1/traces``) as JSON.
+
+    Spans are queued and posted in batches from a background thread, so request and
+    fetch threads never wait on the collector. When the queue is full, traces are
+    dropped rather than buffered without bound.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318",
+        service_name: str = "news-aggregator",
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        flush_interval_seconds: float = 2.0,
+        timeout_seconds: float = 2.0,
+    ) -> None:
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.max_batch_size = max_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            try:
+                self._queue.put_nowait(span)
+            except queue.Full:
+                self.dropped += 1
+
+    def shutdown(self) -> None:
+        try:
+            self._queue.put(None, timeout=self.timeout_seconds)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=self.timeout_seconds + self.flush_interval_seconds)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Span] = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval_seconds)
+                while True:
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.max_batch_size:
+                        break
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            if batch:
+                self._post(batch)
+
+    def _post(self, batch: List[Span]) -> None:
+        import urllib.request
+
+        body = json.dumps(encode_spans(batch, self.service_name)).encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+                response.read()
+        except Exception as exc:
+            logger.debug("OTLP export of %s spans failed: %s", len(batch), exc)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Union
+
+from .base import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class _Trace:
+    """Spans of one trace, appended as they finish (from any thread)."""
+
+    __slots__ = ("trace_id", "sampled", "spans")
+
+    def __init__(self, sampled: bool) -> None:
+        self.trace_id = random.getrandbits(128)
+        self.sampled = sampled
+        self.spans: List[Span] = []
+
+
+class Span:
+    """A timed phase; use as a context manager so it becomes the parent of nested spans."""
+
+    __slots__ = (
+        "tracer", "name", "trace", "span_id", "parent_id", "attributes",
+        "start_time_ns", "_start", "duration_ns", "error", "_token",
+    )
+    recording = True
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace: _Trace,
+        parent_id: Optional[int],
+        attributes: Dict[str, Any],
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.trace = trace
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_time_ns = time.time_ns()
+        self._start = time.perf_counter_ns()
+        self.duration_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._token: Optional[Token] = None
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id is None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.duration_ns if self.duration_ns is not None else time.perf_counter_ns() - self._start
+        return end / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        if self.duration_ns is not None:
+            return
+        self.duration_ns = time.perf_counter_ns() - self._start
+        self.tracer._finish(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        self.end()
+
+
+class _NoopSpan:
+    """Stands in for spans of traces that are neither sampled nor forced."""
+
+    __slots__ = ()
+    recording = False
+    is_root = False
+    duration_ms = 0.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+AnySpan = Union[Span, _NoopSpan]
+
+
+class Tracer:
+    """Minimal span tracer with head sampling.
+
+    ``start_trace`` opens a root span that is sampled at ``sample_rate``; sampled traces
+    are handed to the exporter when their root ends. ``force`` records a trace that was
+    not sampled so its timings can still be read (Server-Timing) without exporting it.
+    ``span`` opens a child of the current span and costs one context lookup when there
+    is no recording trace, so instrumentation can stay in hot paths.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        exporter: Optional[SpanExporter] = None,
+        service_name: str = "news-aggregator",
+    ) -> None:
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0) if exporter else 0.0
+        self.exporter = exporter
+        self.service_name = service_name
+
+    def start_trace(self, name: str, force: bool = False, **attributes: Any) -> AnySpan:
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not (sampled or force):
+            return NOOP_SPAN
+        return Span(self, name, _Trace(sampled), None, attributes)
+
+    def span(self, name: str, **attributes: Any) -> AnySpan:
+        parent = _current_span.get()
+        if parent is None:
+            return NOOP_SPAN
+        return Span(self, name, parent.trace, parent.span_id, attributes)
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _current_span.get()
+
+    def _finish(self, span: Span) -> None:
+        trace = span.trace
+        trace.spans.append(span)
+        if span.is_root and trace.sampled and self.exporter is not None:
+            try:
+                self.exporter.export(list(trace.spans))
+            except Exception as exc:  # pragma: no cover - exporters must never break callers
+                logger.warning("Span export failed: %s", exc)
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+def server_timing_header(root: Span) -> str:
+    """``Server-Timing`` value with the summed duration of each phase of ``root``'s trace"""
+    totals: Dict[str, float] = {}
+    for span in root.trace.spans:
+        if span is not root:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+    metrics = [f"{name};dur={duration:.2f}" for name, duration in totals.items()]
+    metrics.append(f"total;dur={root.duration_ms:.2f}")
+    return ", ".join(metrics)
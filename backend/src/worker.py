@@ -0,0 +1,69 @@
+"""Standalone fetch worker: ``python -m src.worker``.
+
+Pulls per-source fetch jobs from the job queue and writes results through the shared
+cache backend, so fetching scales separately from the API. Run API processes with
+``SCHEDULER_ENABLED=false`` and ``FETCH_MODE=queue`` and point everything at the same
+``REDIS_URL`` with ``CACHE_BACKEND=redis``. Without Redis the queue and cache are
+process-local, which is only useful with ``--once`` or for development.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import threading
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from .core.bootstrap import build_archive, build_cache, build_job_queue, build_news_service
+from .core.log_config import configure_logging
+from .core.settings import _env_files, get_settings
+from .services.fetch_worker import FetchWorker
+
+logger = logging.getLogger("src.worker")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.worker", description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, help="parallel fetches (default WORKER_CONCURRENCY)")
+    parser.add_argument("--once", action="store_true", help="queue one refresh cycle, drain it and exit")
+    args = parser.parse_args(argv)
+
+    for env_file in _env_files():
+        load_dotenv(env_file, override=False)
+
+    settings = get_settings()
+    configure_logging(settings.log_level, settings.log_format)
+    cache = build_cache(settings)
+    archive = build_archive(settings)
+    news_service = build_news_service(settings, cache=cache, archive=archive)
+    worker = FetchWorker(
+        queue=build_job_queue(settings),
+        news_service=news_service,
+        concurrency=args.concurrency or settings.worker_concurrency,
+        max_attempts=settings.job_max_attempts,
+        retry_backoff_seconds=settings.job_retry_backoff_seconds,
+        cycle_interval_seconds=settings.refresh_interval_minutes * 60,
+    )
+
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+
+    news_service.source_registry.start_watching(settings.sources_reload_seconds)
+    logger.info("Fetch worker %s started with %s consumers", worker.name, worker.concurrency)
+    try:
+        worker.run(stop_event, once=args.once)
+    finally:
+        news_service.source_registry.stop_watching()
+        if archive:
+            archive.close()
+        if news_service.link_resolver:
+            news_service.link_resolver.close()
+        logger.info("Fetch worker %s stopped", worker.name)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,31 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_archive_routes_unavailable_when_disabled(async_client):
+    """Archive endpoints report 503 unless ARCHIVE_ENABLED is set"""
+    response = await async_client.get("/api/archive/headlines")
+    assert response.status_code == 503
+
+    response = await async_client.get("/api/archive/search", params={"q": "markets"})
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_refresh_appends_to_archive(async_client, tmp_path):
+    """Headlines fetched during a refresh cycle are written to the archive"""
+    from src.archive import SQLiteHeadlineArchive
+    from src.main import app
+
+    archive = SQLiteHeadlineArchive(tmp_path / "archive.sqlite3")
+    app.state.archive = archive
+    app.state.news_service.archive = archive
+    try:
+        response = await async_client.post("/api/refresh")
+        assert response.status_code == 200
+
+        response = await async_client.get("/api/archive/search", params={"q": "sample headline"})
+        assert response.status_code == 200
+        assert response.json()["count"] > 0
+    finally:
+        archive.close()
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.news_headline import NewsHeadline
+from src.services.rss_service import RSSService
+
+
+@pytest.mark.asyncio
+async def test_collapse_returns_one_headline_per_cluster(async_client, monkeypatch):
+    """Every source carrying the same story collapses to a single copy"""
+
+    def _same_story(self, source):
+        return [
+            NewsHeadline(
+                title="Fed holds interest rates steady, signals two cuts this year",
+                link=f"https://example.com/{source.name.replace(' ', '-')}",
+                published_at=datetime.now(timezone.utc),
+                source=source.name,
+            )
+        ]
+
+    monkeypatch.setattr(RSSService, "fetch_rss_feed", _same_story)
+
+    full = (await async_client.get("/api/news")).json()
+    collapsed = (await async_client.get("/api/news", params={"collapse": "true"})).json()
+
+    full_headlines = [h for s in full["sources"] for h in s["headlines"]]
+    collapsed_headlines = [h for s in collapsed["sources"] for h in s["headlines"]]
+
+    assert len(full_headlines) == full["total_sources"]
+    assert len({h["cluster_id"] for h in full_headlines}) == 1
+    assert len(collapsed_headlines) == 1
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_export_csv_streams_all_headlines(async_client):
+    """CSV export includes a header row and one row per cached headline"""
+    response = await async_client.get("/api/news/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) > 0
+    assert set(rows[0]) == {"source", "title", "link", "published_at", "fetched_at"}
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_filters_by_source(async_client):
+    """NDJSON export honours the sources filter"""
+    response = await async_client.get(
+        "/api/news/export", params={"format": "ndjson", "sources": "CNBC"}
+    )
+
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert records
+    assert all(record["source"] == "CNBC" for record in records)
+
+
+@pytest.mark.asyncio
+async def test_export_json_is_a_valid_document(async_client):
+    """JSON export is a single parseable document even though it is streamed"""
+    response = await async_client.get(
+        "/api/news/export", params={"format": "json", "since": "2100-01-01T00:00:00Z"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "exported_at" in data
+    assert data["headlines"] == []
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(async_client):
+    response = await async_client.get("/api/news/export", params={"format": "xml"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_timeline_pages_cover_every_headline_once(async_client):
+    """Following next_cursor yields each cached headline once, newest first"""
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 7, **({"cursor": cursor} if cursor else {})}
+        response = await async_client.get("/api/news/timeline", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(page["headlines"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    export = await async_client.get("/api/news/export", params={"format": "json"})
+    assert len(seen) == len(export.json()["headlines"]) > 0
+    published = [headline["published_at"] for headline in seen]
+    assert published == sorted(published, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_timeline_rejects_a_malformed_cursor(async_client):
+    response = await async_client.get("/api/news/timeline", params={"cursor": "garbage"})
+
+    assert response.status_code == 400
@@ -0,0 +1,112 @@
+import msgpack
+import pytest
+
+from src.api.response_formats import COLUMNAR_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, negotiate_format
+from src.main import app
+
+
+@pytest.mark.asyncio
+async def test_fields_projection_and_limit_per_source(async_client):
+    response = await async_client.get(
+        "/api/news", params={"fields": "title,link", "limit_per_source": 1}
+    )
+
+    assert response.status_code == 200
+    for source in response.json()["sources"]:
+        assert len(source["headlines"]) <= 1
+        for headline in source["headlines"]:
+            assert set(headline) == {"title", "link"}
+
+
+@pytest.mark.asyncio
+async def test_unknown_field_is_rejected(async_client):
+    response = await async_client.get("/api/news", params={"fields": "title,body"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_columnar_response_via_accept_header(async_client):
+    response = await async_client.get("/api/news", headers={"Accept": COLUMNAR_MEDIA_TYPE})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+    assert response.headers["vary"] == "Accept"
+    data = response.json()
+    assert "source" not in data["fields"]
+    for source in data["sources"]:
+        assert set(source["headlines"]) == set(data["fields"])
+        assert len(source["headlines"]["title"]) == source["story_count"]
+
+
+@pytest.mark.asyncio
+async def test_msgpack_response(async_client):
+    response = await async_client.get("/api/news", params={"format": "msgpack", "fields": "title"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    data = msgpack.unpackb(response.content)
+    assert data["fields"] == ["title"]
+    assert data["total_sources"] == len(data["sources"])
+
+
+def test_negotiate_format_honours_quality_values():
+    accept = f"application/json;q=0.5, {MSGPACK_MEDIA_TYPE}"
+    assert negotiate_format(accept) == "msgpack"
+    assert negotiate_format("text/html, */*") == "json"
+    assert negotiate_format(MSGPACK_MEDIA_TYPE, requested="columnar") == "columnar"
+
+
+@pytest.mark.asyncio
+async def test_news_response_carries_server_timing_phases(async_client):
+    app.state.server_timing = True
+    await async_client.get("/api/news")
+    response = await async_client.get("/api/news")
+
+    assert response.status_code == 200
+    metrics = dict(
+        metric.split(";dur=") for metric in response.headers["server-timing"].split(", ")
+    )
+    assert {"cache.read", "format", "serialize", "total"} <= set(metrics)
+    assert all(float(duration) >= 0 for duration in metrics.values())
+
+
+@pytest.mark.asyncio
+async def test_server_timing_is_off_by_default(async_client):
+    response = await async_client.get("/api/news")
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_ticker_and_entity_filters(async_client, monkeypatch):
+    from datetime import datetime, timezone
+
+    from src.models.news_headline import NewsHeadline
+    from src.services.rss_service import RSSService
+
+    def _tagged_feed(self, source):
+        return [
+            NewsHeadline(
+                title=title,
+                link=f"https://example.com/{index}",
+                published_at=datetime.now(timezone.utc),
+                source=source.name,
+            )
+            for index, title in enumerate(
+                ["Apple earnings beat as iPhone sales grow", "Federal Reserve leaves rates unchanged"]
+            )
+        ]
+
+    monkeypatch.setattr(RSSService, "fetch_rss_feed", _tagged_feed)
+
+    by_ticker = (await async_client.get("/api/news", params={"ticker": "AAPL"})).json()
+    by_entity = (await async_client.get("/api/news", params={"entity": "Fed", "fields": "title,entities"})).json()
+
+    ticker_headlines = [h for s in by_ticker["sources"] for h in s["headlines"]]
+    assert ticker_headlines and all(h["tickers"] == ["AAPL"] for h in ticker_headlines)
+    entity_headlines = [h for s in by_entity["sources"] for h in s["headlines"]]
+    assert entity_headlines and all(h == {
+        "title": "Federal Reserve leaves rates unchanged", "entities": ["Fed"]
+    } for h in entity_headlines)
@@ -59,3 +59,47 @@ async def test_news_data_freshness(async_client):
             pub_date = datetime.fromisoformat(headline["published_at"].replace("Z", "+00:00"))
             pub_diff = now - pub_date
             assert pub_diff.total_seconds() < 604800  # 7 days
+
+
+@pytest.mark.asyncio
+async def test_cache_memory_reports_every_cached_source(async_client):
+    await async_client.get("/api/news")
+    response = await async_client.get("/api/cache/memory")
+
+    assert response.status_code == 200
+    usage = response.json()
+    assert usage["sources"] and all(size > 0 for size in usage["sources"].values())
+    assert usage["estimated_bytes"] == sum(usage["sources"].values())
+
+
+@pytest.mark.asyncio
+async def test_watchlist_results_are_served_from_ingest(async_client, tmp_path):
+    from src.main import app
+    from src.services.watchlist_service import WatchlistService
+
+    app.state.news_service.watchlist_service = WatchlistService(tmp_path / "watchlists.json")
+    response = await async_client.post("/api/watchlists", json={"name": "CNBC", "sources": ["CNBC"]})
+    assert response.status_code == 201
+    watchlist_id = response.json()["id"]
+
+    await async_client.post("/api/refresh")
+    response = await async_client.get(f"/api/watchlists/{watchlist_id}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 1 and data["headlines"][0]["source"] == "CNBC"
+    assert (await async_client.get("/api/watchlists/missing")).status_code == 404
+    assert (await async_client.delete(f"/api/watchlists/{watchlist_id}")).status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_stats_report_fetches_per_source(async_client):
+    await async_client.post("/api/refresh")
+    response = await async_client.get("/api/stats", params={"bucket": "1h", "range": "6h", "sources": "CNBC"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["buckets"]) == 6 and list(data["sources"]) == ["CNBC"]
+    assert sum(data["sources"]["CNBC"]["fetches"]) >= 1
+    assert (await async_client.get("/api/stats", params={"bucket": "7m"})).status_code == 400
+    assert (await async_client.get("/api/stats", params={"range": "soon"})).status_code == 422
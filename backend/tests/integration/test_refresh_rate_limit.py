@@ -0,0 +1,79 @@
+import ipaddress
+
+import pytest
+
+from src.main import app
+from src.ratelimit import InMemoryRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_refresh_within_min_interval_returns_current_data(async_client):
+    """A second refresh right after a completed one does not refetch upstream"""
+    first = await async_client.post("/api/refresh")
+    second = await async_client.post("/api/refresh")
+
+    assert first.status_code == 200
+    assert first.json()["message"] == "Refresh triggered successfully"
+    assert second.status_code == 200
+    assert second.json()["sources_to_refresh"] == 0
+    assert second.json()["cache_status"] == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_refresh_returns_429_with_retry_after_when_limited(async_client):
+    """Clients exceeding their token bucket receive 429 and a Retry-After header"""
+    app.state.refresh_client_limiter = InMemoryRateLimiter(rate_per_minute=1, burst=1)
+
+    assert (await async_client.post("/api/refresh")).status_code == 200
+    response = await async_client.post("/api/refresh")
+
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_clients_behind_a_trusted_proxy_get_their_own_buckets(async_client):
+    """Forwarded addresses are believed only from trusted proxies"""
+    app.state.refresh_client_limiter = InMemoryRateLimiter(rate_per_minute=1, burst=1)
+    app.state.trusted_proxies = (ipaddress.ip_network("127.0.0.1/32"),)
+
+    first = await async_client.post("/api/refresh", headers={"X-Forwarded-For": "203.0.113.5"})
+    other = await async_client.post("/api/refresh", headers={"X-Forwarded-For": "198.51.100.7"})
+    # A spoofed leftmost entry does not escape the real client's bucket
+    spoofed = await async_client.post("/api/refresh", headers={"X-Forwarded-For": "10.9.9.9, 203.0.113.5"})
+
+    assert first.status_code == 200
+    assert other.status_code == 200
+    assert spoofed.status_code == 429
+
+    app.state.trusted_proxies = ()
+    assert (await async_client.post("/api/refresh", headers={"X-Forwarded-For": "192.0.2.1"})).status_code == 200
+    assert (await async_client.post("/api/refresh", headers={"X-Forwarded-For": "192.0.2.2"})).status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_request_rejected_globally_does_not_spend_the_client_token(async_client):
+    app.state.refresh_client_limiter = InMemoryRateLimiter(rate_per_minute=1, burst=1)
+    app.state.refresh_global_limiter = InMemoryRateLimiter(rate_per_minute=1, burst=1)
+    app.state.refresh_global_limiter.acquire("global")
+
+    assert (await async_client.post("/api/refresh")).status_code == 429
+    app.state.refresh_global_limiter = None
+    assert (await async_client.post("/api/refresh")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_watchlist_writes_are_rate_limited(async_client, tmp_path):
+    from src.services.watchlist_service import WatchlistService
+
+    app.state.news_service.watchlist_service = WatchlistService(tmp_path / "watchlists.json")
+    app.state.watchlist_write_limiter = InMemoryRateLimiter(rate_per_minute=1, burst=1)
+    try:
+        created = await async_client.post("/api/watchlists", json={"name": "CNBC", "sources": ["CNBC"]})
+        response = await async_client.delete(f"/api/watchlists/{created.json()['id']}")
+    finally:
+        app.state.watchlist_write_limiter = None
+
+    assert created.status_code == 201
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
@@ -0,0 +1,164 @@
+import threading
+from datetime import datetime, timezone
+
+import pytest
+from redis.exceptions import WatchError
+
+from src.cache import AsyncCacheAdapter, InMemoryNewsCache
+from src.cache.async_redis_cache import AsyncRedisNewsCache
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+from src.services.news_service import NewsService
+
+
+class _StubRedis:
+    """Just enough of redis.asyncio.Redis for the cache: GET/SET/INCR/DELETE,
+    pipelines and WATCH, with a count of reads per key"""
+
+    def __init__(self):
+        self.data, self.versions, self.reads = {}, {}, {}
+
+    def pipeline(self, transaction=True):
+        return _StubPipeline(self)
+
+    async def get(self, key):
+        self.reads[key] = self.reads.get(key, 0) + 1
+        return self.data.get(key)
+
+    def apply(self, command, key, *args):
+        if command == "get":
+            self.reads[key] = self.reads.get(key, 0) + 1
+            return self.data.get(key)
+        self.versions[key] = self.versions.get(key, 0) + 1
+        if command == "set":
+            self.data[key] = args[0]
+        elif command == "incr":
+            self.data[key] = str(int(self.data.get(key) or 0) + 1)
+            return int(self.data[key])
+        elif command == "delete":
+            for name in (key, *args):
+                self.data.pop(name, None)
+        return True
+
+    async def aclose(self):
+        pass
+
+
+class _StubPipeline:
+    def __init__(self, redis):
+        self.redis, self.commands, self.watched, self.buffering = redis, [], None, True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def watch(self, *keys):
+        self.watched = {key: self.redis.versions.get(key, 0) for key in keys}
+        self.buffering = False
+
+    def multi(self):
+        self.buffering = True
+
+    def _command(self, command, key, *args):
+        if not self.buffering:
+            async def immediate():
+                return self.redis.apply(command, key, *args)
+
+            return immediate()
+        self.commands.append((command, key, args))
+        return self
+
+    def get(self, key):
+        return self._command("get", key)
+
+    def set(self, key, value):
+        return self._command("set", key, value)
+
+    def incr(self, key):
+        return self._command("incr", key)
+
+    def delete(self, key, *keys):
+        return self._command("delete", key, *keys)
+
+    async def execute(self):
+        if self.watched and any(self.redis.versions.get(k, 0) != v for k, v in self.watched.items()):
+            raise WatchError("watched key changed")
+        return [self.redis.apply(command, key, *args) for command, key, args in self.commands]
+
+
+def _source(name, headlines=2):
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/rss",
+        fallback_url="https://example.com",
+        headlines=[
+            NewsHeadline(
+                title=f"{name} headline number {i}",
+                link=f"https://example.com/{name}/{i}",
+                published_at=datetime.now(timezone.utc),
+                source=name,
+            )
+            for i in range(headlines)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_decodes_the_payload_once_per_generation():
+    redis = _StubRedis()
+    cache = AsyncRedisNewsCache(client=redis, namespace="test")
+    await cache.update_source(_source("Alpha"))
+
+    first = await cache.snapshot()
+    again = await cache.snapshot()
+    await cache.update_source(_source("Beta"))
+    after_write = await cache.snapshot()
+
+    assert again is first
+    assert list(after_write.sources) == ["Alpha", "Beta"]
+    assert after_write.generation == first.generation + 1
+    # Two writes read it inside their transactions, two snapshots after each write
+    assert redis.reads["test:sources"] == 4
+
+
+@pytest.mark.asyncio
+async def test_write_retries_when_another_writer_gets_in_first(monkeypatch):
+    redis = _StubRedis()
+    cache = AsyncRedisNewsCache(client=redis, namespace="test")
+    other = AsyncRedisNewsCache(client=redis, namespace="test")
+    original_watch = _StubPipeline.watch
+    pending = [_source("Beta")]
+
+    async def watch_then_interfere(pipe, *keys):
+        await original_watch(pipe, *keys)
+        if pending:
+            # Lands between this writer's WATCH and EXEC, once
+            await other.update_source(pending.pop())
+
+    monkeypatch.setattr(_StubPipeline, "watch", watch_then_interfere)
+    await cache.update_source(_source("Alpha"))
+
+    assert sorted((await cache.snapshot()).sources) == ["Alpha", "Beta"]
+
+
+@pytest.mark.asyncio
+async def test_offloading_adapter_keeps_sync_calls_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    callers = []
+
+    class _RecordingCache(InMemoryNewsCache):
+        def snapshot(self):
+            callers.append(threading.get_ident())
+            return super().snapshot()
+
+    cache = _RecordingCache()
+    cache.update_source(_source("Alpha"))
+    service = NewsService(cache=cache, async_cache=AsyncCacheAdapter(cache, offload=True))
+
+    overview = await service.cache_overview()
+
+    assert overview["total_sources"] == overview["active_sources"] == 1
+    assert overview["status"] == "fresh"
+    assert callers and loop_thread not in callers
@@ -0,0 +1,72 @@
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from src.cache import InMemoryNewsCache
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+
+
+def _source(name, status="active", headlines=0):
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/rss",
+        fallback_url="https://example.com",
+        status=status,
+        headlines=[
+            NewsHeadline(
+                title=f"{name} headline number {i}",
+                link=f"https://example.com/{i}",
+                published_at=datetime.now(timezone.utc),
+                source=name,
+            )
+            for i in range(headlines)
+        ],
+    )
+
+
+def test_snapshot_is_unaffected_by_later_writes():
+    cache = InMemoryNewsCache()
+    cache.update_source(_source("Alpha"))
+    before = cache.snapshot()
+
+    cache.update_source(_source("Beta", status="error"))
+    cache.remove_source("Alpha")
+    after = cache.snapshot()
+
+    assert list(before.sources) == ["Alpha"] and before.active_sources == 1
+    assert list(after.sources) == ["Beta"] and after.active_sources == 0
+    assert after.generation == before.generation + 2
+    with pytest.raises(TypeError):
+        cache.get_all_sources()["Gamma"] = _source("Gamma")
+
+
+def test_readers_always_see_a_consistent_generation():
+    cache = InMemoryNewsCache()
+    stop = threading.Event()
+
+    def write(name):
+        # Active sources always carry headlines; failed ones never do
+        flip = False
+        while not stop.is_set():
+            flip = not flip
+            cache.update_source(_source(name, "active" if flip else "error", 2 if flip else 0))
+
+    writers = [threading.Thread(target=write, args=(name,)) for name in ("Alpha", "Beta", "Gamma")]
+    for writer in writers:
+        writer.start()
+    try:
+        generations = []
+        for _ in range(2000):
+            snapshot = cache.snapshot()
+            generations.append(snapshot.generation)
+            sources = snapshot.sources.values()
+            assert snapshot.active_sources == sum(1 for s in sources if s.status == "active")
+            assert all(bool(s.headlines) == (s.status == "active") for s in sources)
+    finally:
+        stop.set()
+        for writer in writers:
+            writer.join()
+
+    assert generations == sorted(generations)
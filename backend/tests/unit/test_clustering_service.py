@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+
+from src.models.news_headline import NewsHeadline
+from src.services.clustering_service import ClusteringService, normalize_title
+
+
+def _headline(title, source):
+    return NewsHeadline(
+        title=title,
+        link="https://example.com/article",
+        published_at=datetime.now(timezone.utc),
+        source=source,
+    )
+
+
+def test_normalize_title_strips_publisher_suffix_and_stopwords():
+    assert normalize_title("Fed holds rates steady as inflation cools - Reuters") == [
+        "fed", "holds", "rates", "steady", "inflation", "cools",
+    ]
+
+
+def test_near_duplicates_across_sources_share_a_cluster():
+    service = ClusteringService()
+    reuters = [_headline("Nvidia shares jump 5% after blowout earnings report - Reuters", "Reuters")]
+    cnbc = [
+        _headline("Nvidia shares surge 5% after blowout earnings report", "CNBC"),
+        _headline("Oil prices fall as OPEC weighs output increase", "CNBC"),
+    ]
+
+    service.assign("Reuters", reuters)
+    service.assign("CNBC", cnbc)
+
+    assert cnbc[0].cluster_id == reuters[0].cluster_id
+    assert cnbc[1].cluster_id != reuters[0].cluster_id
+
+
+def test_refreshing_a_source_replaces_its_index_entries():
+    service = ClusteringService()
+    service.assign("Reuters", [_headline("Gold hits record high as dollar weakens", "Reuters")])
+    service.assign("Reuters", [_headline("Tesla recalls two million vehicles", "Reuters")])
+
+    assert len(service._clusters) == 1
+
+    service.remove_source("Reuters")
+
+    assert service._clusters == {}
+    assert not service._buckets
+
+
+def test_simhash_matches_per_bit_majority_vote():
+    from src.services.clustering_service import _feature_hash, simhash
+
+    tokens = ["fed", "holds", "rates", "steady", "inflation", "cools", "markets"]
+    for size in range(len(tokens) + 1):
+        words = tokens[:size]
+        expected = 0
+        for bit in range(64):
+            votes = sum(1 if (_feature_hash(w) >> bit) & 1 else -1 for w in words)
+            if votes > 0:
+                expected |= 1 << bit
+        assert simhash(words) == expected
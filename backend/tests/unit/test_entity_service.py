@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+from src.services.entity_service import AhoCorasick, EntityService
+
+DICTIONARY = {
+    "tickers": {"AAPL": ["Apple"], "BRK.B": ["Berkshire Hathaway"], "C": ["Citigroup"]},
+    "entities": {"Fed": ["Federal Reserve", "FOMC"], "SEC": [], "S&P 500": ["S&P"]},
+}
+
+
+def _source(name, titles):
+    now = datetime.now(timezone.utc)
+    headlines = [
+        NewsHeadline(title=title, link="https://example.com/a", published_at=now, source=name)
+        for title in titles
+    ]
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/rss",
+        fallback_url="https://example.com",
+        headlines=headlines,
+        last_updated=now,
+    )
+
+
+def test_automaton_reports_overlapping_matches_through_failure_links():
+    matcher = AhoCorasick([(["b", "c"], 0), (["a", "b", "c", "d"], 1), (["c"], 2)])
+
+    assert sorted(matcher.iter_matches(["a", "b", "c", "x"])) == [(2, 0), (2, 2)]
+    assert sorted(matcher.iter_matches(["a", "b", "c", "d"])) == [(2, 0), (2, 2), (3, 1)]
+
+
+def test_case_sensitive_entries_match_only_their_exact_spelling():
+    service = EntityService(
+        entities={
+            "Fed": {"aliases": ["Federal Reserve"], "case_sensitive": True},
+            "Gold": {"aliases": ["BULLION"], "case_sensitive": False},
+        }
+    )
+
+    assert service.tag_title("Fed holds rates as Federal Reserve waits") == ([], ["Fed"])
+    assert service.tag_title("Investors fed up with federal reserve guidance") == ([], [])
+    assert service.tag_title("gold and bullion climb") == ([], ["Gold"])
+
+
+def test_tagging_matches_whole_words_and_respects_acronym_case():
+    service = EntityService(DICTIONARY["tickers"], DICTIONARY["entities"])
+
+    assert service.tag_title("Apple and $AAPL rally as Federal Reserve holds") == (["AAPL"], ["Fed"])
+    assert service.tag_title("Berkshire Hathaway adds BRK.B buybacks; S&P 500 flat") == (["BRK.B"], ["S&P 500"])
+    # Lowercase 'sec' is not the regulator, 'Applebee' is not Apple, bare 'C' is not a symbol
+    assert service.tag_title("Applebee's opens in 30 sec, Series C round closes") == ([], [])
+    assert service.tag_title("SEC sues Citigroup over disclosures") == (["C"], ["SEC"])
+
+
+def test_lookup_serves_filters_from_the_index():
+    service = EntityService(DICTIONARY["tickers"], DICTIONARY["entities"])
+    reuters = _source("Reuters", ["Apple shares climb before FOMC decision", "Citigroup to cut 5,000 jobs"])
+    cnbc = _source("CNBC", ["Federal Reserve signals patience on cuts", "Apple unveils new iPhone lineup"])
+    for source in (reuters, cnbc):
+        service.tag(source.headlines)
+        service.index_source(source)
+    sources = {"Reuters": reuters, "CNBC": cnbc}
+
+    by_ticker = service.lookup(sources, tickers=["aapl"])
+    assert [h.title for h in by_ticker["Reuters"]] == ["Apple shares climb before FOMC decision"]
+    assert [h.title for h in by_ticker["CNBC"]] == ["Apple unveils new iPhone lineup"]
+
+    both = service.lookup(sources, tickers=["AAPL"], entities=["fed"])
+    assert list(both) == ["Reuters"]
+
+    service.remove_source("Reuters")
+    assert list(service.lookup({"CNBC": cnbc}, tickers=["C"])) == []
+
+
+def test_lookup_indexes_sources_written_by_another_process():
+    tagger = EntityService(DICTIONARY["tickers"], DICTIONARY["entities"])
+    source = _source("Reuters", ["Apple shares climb", "Markets steady ahead of data"])
+    tagger.tag(source.headlines)
+
+    # A fresh service (the API process) only sees the cached, already tagged source
+    reader = EntityService()
+    assert [h.title for h in reader.lookup({"Reuters": source}, tickers=["AAPL"])["Reuters"]] == [
+        "Apple shares climb"
+    ]
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from benchmarks.bench_parsers import FEEDS, PAGES, load_corpus, rebase_dates, scale_items
+from src.models.news_source import NewsSource
+from src.services.rss_service import RSSService
+from src.services.scraping_service import ScrapingService
+
+
+def _source(name: str, max_stories: int = 10) -> NewsSource:
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/feed",
+        fallback_url="https://example.com",
+        max_stories=max_stories,
+    )
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return load_corpus()
+
+
+@pytest.mark.parametrize("fixture", sorted(FEEDS))
+def test_every_recorded_feed_parses_to_fresh_sorted_headlines(corpus, fixture):
+    headlines = RSSService().parse_feed(corpus[fixture], _source(FEEDS[fixture]))
+
+    assert len(headlines) == 10
+    stamps = [h.published_at for h in headlines]
+    assert stamps == sorted(stamps, reverse=True)
+    assert all(h.published_at.utcoffset() == timedelta(0) for h in headlines)
+    assert datetime.now(timezone.utc) - stamps[0] < timedelta(minutes=1)
+
+
+def test_rebase_keeps_offsets_and_spacing():
+    content = (
+        b"<item><pubDate>Mon, 04 Mar 2024 22:00:00 +0800</pubDate></item>"
+        b"<item><pubDate>Mon, 04 Mar 2024 13:00:00 GMT</pubDate></item>"
+    )
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    rebased = rebase_dates(content, now)
+
+    assert b"Wed, 01 Jan 2025 20:00:00 +0800" in rebased
+    assert b"Wed, 01 Jan 2025 11:00:00 GMT" in rebased
+
+
+def test_scaled_feed_has_distinct_entries(corpus):
+    content = scale_items(corpus["financial_times.xml"], 3)
+    source = _source("Financial Times", max_stories=50)
+
+    headlines = RSSService().parse_feed(content, source)
+
+    assert len(headlines) == 50
+    assert len({h.link for h in headlines}) == 50
+
+
+def test_listing_page_scrapes_absolute_links(corpus):
+    [fixture] = PAGES
+    headlines = ScrapingService().parse_page(corpus[fixture], _source(PAGES[fixture]))
+
+    assert len(headlines) == 10
+    assert all(h.link.startswith("https://example.com/news/") for h in headlines)
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from src.models.news_source import NewsSource
+from src.services.fetch_orchestrator import FetchOrchestrator
+
+
+def _source(name, host="example.com", **overrides):
+    return NewsSource(
+        name=name,
+        rss_url=f"https://{host}/{name}.rss",
+        fallback_url=f"https://{host}/{name}",
+        **overrides,
+    )
+
+
+def test_dispatches_by_priority_then_learned_cost():
+    orchestrator = FetchOrchestrator(max_concurrency=1)
+    order = []
+    delays = {"slow": 0.05, "fast": 0.0, "urgent": 0.0}
+
+    def _fetch(source):
+        order.append(source.name)
+        time.sleep(delays[source.name])
+        return []
+
+    sources = [_source("slow"), _source("fast"), _source("urgent", priority=1)]
+    orchestrator.run(sources, _fetch)
+    assert order[0] == "urgent"
+
+    # After one cycle the slow feed's cost is known and it moves behind the fast one
+    order.clear()
+    orchestrator.run(sources, _fetch)
+    assert order == ["urgent", "fast", "slow"]
+
+
+def test_respects_global_and_per_host_limits():
+    orchestrator = FetchOrchestrator(max_concurrency=4, per_host_limit=2)
+    active = {"total": 0, "a.com": 0}
+    peaks = {"total": 0, "a.com": 0}
+    lock = threading.Lock()
+
+    def _fetch(source):
+        host = source.rss_url.split("/")[2]
+        with lock:
+            active["total"] += 1
+            active[host] = active.get(host, 0) + 1
+            for key in peaks:
+                peaks[key] = max(peaks[key], active.get(key, 0))
+        time.sleep(0.01)
+        with lock:
+            active["total"] -= 1
+            active[host] -= 1
+        return []
+
+    sources = [_source(f"a{i}", host="a.com") for i in range(6)]
+    sources += [_source(f"b{i}", host=f"b{i}.com") for i in range(6)]
+    orchestrator.run(sources, _fetch)
+
+    assert peaks["total"] <= 4
+    assert peaks["a.com"] <= 2
+
+
+def test_failed_sources_do_not_stop_the_cycle():
+    orchestrator = FetchOrchestrator(max_concurrency=2)
+
+    def _fetch(source):
+        if source.name == "broken":
+            raise RuntimeError("boom")
+        return ["headline"]
+
+    result = orchestrator.run([_source("broken"), _source("ok1"), _source("ok2")], _fetch)
+
+    assert result == ["headline", "headline"]
+
+
+def test_cancel_event_stops_dispatching_but_lets_running_fetches_finish():
+    orchestrator = FetchOrchestrator(max_concurrency=1)
+    cancel = threading.Event()
+    fetched = []
+
+    def _fetch(source):
+        cancel.set()
+        time.sleep(0.01)
+        fetched.append(source.name)
+        return []
+
+    orchestrator.run([_source("a"), _source("b"), _source("c")], _fetch, cancel_event=cancel)
+    assert fetched == ["a"]
@@ -0,0 +1,162 @@
+import threading
+from datetime import datetime, timezone
+
+from src.cache import InMemoryNewsCache
+from src.jobs import InMemoryJobQueue
+from src.jobs import in_memory
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+from src.services.fetch_worker import FetchWorker
+from src.services.news_service import NewsService
+from src.services.source_registry import SourceRegistry
+
+
+def _registry(tmp_path, names):
+    catalog = tmp_path / "sources.yaml"
+    catalog.write_text(
+        "sources:\n"
+        + "".join(
+            f"  - name: {name}\n    rss_url: https://example.com/{name}.rss\n"
+            f"    fallback_url: https://example.com/{name}\n"
+            for name in names
+        )
+    )
+    return SourceRegistry(catalog)
+
+
+class _StubRSS:
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+
+    def fetch_rss_feed(self, source):
+        if self.failures.get(source.name, 0) > 0:
+            self.failures[source.name] -= 1
+            raise RuntimeError("upstream down")
+        return [
+            NewsHeadline(
+                title=f"{source.name} headline",
+                link=f"https://example.com/{source.name}/1",
+                published_at=datetime.now(timezone.utc),
+                source=source.name,
+            )
+        ]
+
+
+class _FailingScraper:
+    def scrape_headlines(self, source):
+        raise RuntimeError("scrape failed")
+
+
+def _service(tmp_path, names, failures=None, job_queue=None):
+    return NewsService(
+        cache=InMemoryNewsCache(),
+        rss_service=_StubRSS(failures),
+        scraping_service=_FailingScraper(),
+        source_registry=_registry(tmp_path, names),
+        job_queue=job_queue,
+    )
+
+
+def test_queue_dedupes_pending_sources_until_acked():
+    queue = InMemoryJobQueue()
+    assert queue.enqueue("a")
+    assert not queue.enqueue("a")
+
+    job = queue.reserve("c1", timeout=0)
+    assert job.source == "a" and job.attempts == 0
+    assert not queue.enqueue("a")
+
+    queue.ack(job)
+    assert queue.pending() == 0
+    assert queue.enqueue("a")
+
+
+def test_expired_lease_is_redelivered_with_attempt_counted(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(in_memory.time, "monotonic", lambda: now[0])
+    queue = InMemoryJobQueue(visibility_timeout_seconds=30)
+    queue.enqueue("a")
+
+    first = queue.reserve("c1", timeout=0)
+    assert queue.reserve("c2", timeout=0) is None
+
+    now[0] += 31
+    second = queue.reserve("c2", timeout=0)
+    assert second.source == "a" and second.attempts == 1
+
+    # The stale lease can no longer ack or retry the job
+    queue.ack(first)
+    assert queue.pending() == 1
+
+
+def test_retry_waits_for_its_delay(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(in_memory.time, "monotonic", lambda: now[0])
+    queue = InMemoryJobQueue()
+    queue.enqueue("a")
+
+    queue.retry(queue.reserve("c1", timeout=0), delay=10)
+    assert queue.reserve("c1", timeout=0) is None
+
+    now[0] += 10
+    assert queue.reserve("c1", timeout=0).attempts == 1
+
+
+def test_claim_cycle_grants_one_caller_per_interval(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(in_memory.time, "monotonic", lambda: now[0])
+    queue = InMemoryJobQueue()
+
+    assert queue.claim_cycle(60)
+    assert not queue.claim_cycle(60)
+    now[0] += 60
+    assert queue.claim_cycle(60)
+
+
+def test_worker_retries_failed_fetch_then_gives_up(tmp_path):
+    queue = InMemoryJobQueue()
+    service = _service(tmp_path, ["flaky", "down"], failures={"flaky": 1, "down": 5})
+    worker = FetchWorker(queue, service, max_attempts=2, retry_backoff_seconds=0)
+    worker.enqueue_cycle()
+
+    results = {}
+    while queue.pending():
+        job = queue.reserve("c1", timeout=1)
+        results.setdefault(job.source, []).append(worker.handle(job))
+
+    assert results == {"flaky": [False, True], "down": [False, False]}
+    assert service.cache.get_source("flaky").status == "active"
+    assert service.cache.get_source("down").status == "error"
+
+
+def test_worker_drops_jobs_for_unknown_sources(tmp_path):
+    queue = InMemoryJobQueue()
+    worker = FetchWorker(queue, _service(tmp_path, ["a"]))
+    queue.enqueue("removed")
+
+    assert worker.handle(queue.reserve("c1", timeout=0)) is False
+    assert queue.pending() == 0
+
+
+def test_worker_run_once_drains_the_cycle(tmp_path):
+    queue = InMemoryJobQueue()
+    service = _service(tmp_path, ["a", "b", "c"])
+    worker = FetchWorker(queue, service, concurrency=2, poll_seconds=0.01)
+
+    worker.run(threading.Event(), once=True)
+
+    assert set(service.cache.get_all_sources()) == {"a", "b", "c"}
+    assert queue.pending() == 0
+
+
+def test_queue_mode_service_enqueues_instead_of_fetching(tmp_path):
+    queue = InMemoryJobQueue()
+    service = _service(tmp_path, ["a", "b"], job_queue=queue)
+
+    response = service.fetch_all_news()
+
+    assert response["total_sources"] == 0
+    assert queue.pending() == 2
+    # A second stale read does not pile up duplicate jobs
+    service.fetch_all_news()
+    assert queue.pending() == 2
@@ -0,0 +1,83 @@
+import gzip
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount, Route
+
+from src.core.frontend_assets import (
+    IMMUTABLE,
+    FrontendShell,
+    PrecompressedStaticFiles,
+    accepted_encodings,
+    precompress_directory,
+)
+
+BUNDLE = b"console.log('news aggregator');\n" * 200
+
+
+@pytest.fixture
+def build_dir(tmp_path):
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "main.1a2b3c4d.js").write_bytes(BUNDLE)
+    (tmp_path / "manifest.json").write_bytes(b'{"short_name": "News"}')
+    return tmp_path
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+
+def test_accepted_encodings_ignores_refused_codings():
+    assert accepted_encodings("gzip;q=0.8, br;q=0, identity") == {"gzip", "identity"}
+    assert accepted_encodings(None) == frozenset()
+
+
+def test_precompress_writes_missing_variants_once(build_dir):
+    assert precompress_directory(build_dir) >= 1
+    assert gzip.decompress((build_dir / "js" / "main.1a2b3c4d.js.gz").read_bytes()) == BUNDLE
+    # Too small to be worth compressing
+    assert not (build_dir / "manifest.json.gz").exists()
+    assert precompress_directory(build_dir) == 0
+
+
+@pytest.mark.asyncio
+async def test_hashed_assets_are_immutable_and_served_precompressed(build_dir):
+    app = Starlette(routes=[Mount("/static", PrecompressedStaticFiles(directory=str(build_dir), precompress=True))])
+
+    async with _client(app) as client:
+        compressed = await client.get("/static/js/main.1a2b3c4d.js", headers={"Accept-Encoding": "gzip"})
+        plain = await client.get("/static/js/main.1a2b3c4d.js", headers={"Accept-Encoding": "identity"})
+        manifest = await client.get("/static/manifest.json")
+        sibling = await client.get("/static/js/main.1a2b3c4d.js.gz")
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"].startswith(("application/javascript", "text/javascript"))
+    assert compressed.headers["cache-control"] == IMMUTABLE
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.content == BUNDLE
+    assert "content-encoding" not in plain.headers and plain.content == BUNDLE
+    assert manifest.headers["cache-control"] == "no-cache"
+    assert sibling.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_shell_is_served_from_memory_and_revalidates_with_etag(tmp_path):
+    index = tmp_path / "index.html"
+    index.write_bytes(b"<!doctype html><div id=root></div>" + b"<script></script>" * 100)
+    shell = FrontendShell.load(index)
+    index.unlink()
+
+    app = Starlette(routes=[Route("/{path:path}", lambda request: shell.response(request))])
+    async with _client(app) as client:
+        first = await client.get("/news/today", headers={"Accept-Encoding": "gzip"})
+        repeat = await client.get(
+            "/", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]}
+        )
+
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.text.startswith("<!doctype html>")
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert FrontendShell.load(index) is None
@@ -0,0 +1,221 @@
+import gzip
+import time
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from benchmarks.bench_parsers import FEEDS, PAGES, load_corpus
+from src.cache import InMemoryNewsCache
+from src.models.news_source import NewsSource
+from src.services.http_transport import (
+    Cassette,
+    FaultInjectingAdapter,
+    HttpTransport,
+    RecordingAdapter,
+    ReplayAdapter,
+)
+from src.services.link_resolver import LinkCache, LinkResolver
+from src.services.news_service import NewsService
+from src.services.rss_service import RSSService
+from src.services.scraping_service import ScrapingService
+from src.services.source_registry import SourceRegistry
+
+FEED_URL = "https://feeds.example.com/markets.rss"
+
+
+class _StubUpstream(BaseAdapter):
+    """Answers every request with ``body`` as a live adapter would"""
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        super().__init__()
+        self.body = body
+        self.status = status
+        self.requests = []
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.requests.append(request.url)
+        response = requests.Response()
+        response.status_code = self.status
+        response.reason = "OK"
+        response.headers["Content-Type"] = "application/rss+xml; charset=utf-8"
+        response.headers["Content-Encoding"] = "gzip"
+        response._content = self.body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _session(adapter: BaseAdapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def _source(name: str = "Financial Times", rss_url: str = FEED_URL) -> NewsSource:
+    return NewsSource(name=name, rss_url=rss_url, fallback_url="https://www.example.com/markets", max_stories=10)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return load_corpus()
+
+
+def test_recorded_responses_replay_identically_without_the_upstream(tmp_path, corpus):
+    cassette = Cassette(tmp_path)
+    upstream = _StubUpstream(corpus["financial_times.xml"])
+    recorded = _session(RecordingAdapter(cassette, upstream)).get(FEED_URL)
+
+    stored = cassette.path("GET", FEED_URL)
+    assert stored.exists()
+    assert gzip.decompress(stored.read_bytes()).endswith(corpus["financial_times.xml"])
+
+    replayed = _session(ReplayAdapter(cassette)).get(FEED_URL)
+    assert upstream.requests == [FEED_URL]
+    assert replayed.status_code == recorded.status_code == 200
+    assert replayed.content == recorded.content
+    # The recorded body is already decoded, so urllib3 must not gunzip it again
+    assert recorded.raw.read(decode_content=True) == replayed.raw.read(decode_content=True)
+    assert replayed.content == corpus["financial_times.xml"]
+    assert replayed.headers["Content-Type"] == "application/rss+xml; charset=utf-8"
+    # The stored body is already decoded
+    assert "Content-Encoding" not in replayed.headers
+
+
+def test_replay_drives_the_real_fetch_and_parse_path(tmp_path, corpus):
+    transport = HttpTransport("replay", tmp_path)
+    transport.cassette.record(FEED_URL, corpus["financial_times.xml"], headers={"Content-Type": "text/xml"})
+
+    headlines = RSSService(transport=transport).fetch_rss_feed(_source())
+    assert len(headlines) == 10
+    parsed = RSSService().parse_feed(corpus["financial_times.xml"], _source())
+    assert [(h.title, h.link, h.published_at) for h in headlines] == [(h.title, h.link, h.published_at) for h in parsed]
+
+
+def test_unrecorded_request_fails_like_an_unreachable_host(tmp_path):
+    service = RSSService(transport=HttpTransport("replay", tmp_path))
+
+    with pytest.raises(Exception, match="Error fetching RSS feed for Financial Times"):
+        service.fetch_rss_feed(_source())
+
+
+def test_replay_emulates_recorded_latency_and_times_out_past_the_read_timeout(tmp_path, corpus):
+    cassette = Cassette(tmp_path)
+    cassette.record(FEED_URL, corpus["financial_times.xml"], elapsed_seconds=0.05)
+
+    started = time.perf_counter()
+    _session(ReplayAdapter(cassette, latency_scale=1.0)).get(FEED_URL)
+    assert time.perf_counter() - started >= 0.05
+
+    started = time.perf_counter()
+    _session(ReplayAdapter(cassette, latency_scale=0)).get(FEED_URL)
+    assert time.perf_counter() - started < 0.05
+
+    with pytest.raises(requests.ReadTimeout):
+        _session(ReplayAdapter(cassette, latency_scale=10)).get(FEED_URL, timeout=(1, 0.1))
+
+
+def test_faults_are_deterministic_per_seed_and_url(tmp_path, corpus):
+    cassette = Cassette(tmp_path)
+    urls = [f"https://feeds.example.com/{index}.rss" for index in range(200)]
+    for url in urls:
+        cassette.record(url, corpus["scmp.xml"])
+
+    def outcomes(seed):
+        adapter = FaultInjectingAdapter(
+            ReplayAdapter(cassette), timeout_rate=0.2, error_rate=0.2, truncate_rate=0.2, seed=seed
+        )
+        session = _session(adapter)
+        seen = []
+        for url in urls:
+            try:
+                response = session.get(url)
+            except requests.ReadTimeout:
+                seen.append("timeout")
+                continue
+            if response.status_code >= 500:
+                seen.append(response.status_code)
+            else:
+                seen.append(len(response.content))
+        return seen, adapter.injected
+
+    first, injected = outcomes(seed=7)
+    assert outcomes(seed=7)[0] == first
+    assert outcomes(seed=8)[0] != first
+    assert set(first) >= {"timeout", len(corpus["scmp.xml"]), len(corpus["scmp.xml"]) // 2}
+    assert {status for status in first if isinstance(status, int) and 500 <= status < 600}
+    assert sum(injected.values()) == len(urls) - first.count(len(corpus["scmp.xml"]))
+    for fault in ("timeout", "error", "truncated"):
+        assert 20 <= injected[fault] <= 60
+
+
+def test_truncated_responses_cut_the_raw_stream_too(tmp_path, corpus):
+    cassette = Cassette(tmp_path)
+    cassette.record(FEED_URL, corpus["scmp.xml"])
+
+    response = _session(FaultInjectingAdapter(ReplayAdapter(cassette), truncate_rate=1.0)).get(FEED_URL)
+
+    half = corpus["scmp.xml"][: len(corpus["scmp.xml"]) // 2]
+    assert response.content == half
+    assert response.raw.read(1024, decode_content=True) + response.raw.read() == half
+
+
+def test_fault_rates_are_validated():
+    with pytest.raises(ValueError):
+        HttpTransport("fault", "unused", timeout_rate=0.6, error_rate=0.6)
+    with pytest.raises(ValueError):
+        HttpTransport("offline", "unused")
+
+
+def test_refresh_over_replayed_corpus_falls_back_to_the_recorded_page(tmp_path, corpus):
+    fixtures = {**FEEDS, **PAGES}
+    names = list(fixtures.values())
+    catalog = tmp_path / "sources.yaml"
+    catalog.write_text(
+        "sources:\n"
+        + "".join(
+            f"  - name: {name}\n    rss_url: https://feeds.example.com/{index}.rss\n"
+            f"    fallback_url: https://www.example.com/{index}\n    max_stories: 10\n"
+            for index, name in enumerate(names)
+        )
+    )
+    transport = HttpTransport("replay", tmp_path / "cassettes")
+    for index, fixture in enumerate(fixtures):
+        if fixture in FEEDS:
+            transport.cassette.record(f"https://feeds.example.com/{index}.rss", corpus[fixture])
+        else:
+            # No feed recorded: the RSS fetch fails and the page is scraped instead
+            transport.cassette.record(f"https://www.example.com/{index}", corpus[fixture])
+
+    cache = InMemoryNewsCache()
+    service = NewsService(
+        cache=cache,
+        rss_service=RSSService(transport=transport),
+        scraping_service=ScrapingService(transport=transport),
+        source_registry=SourceRegistry(catalog),
+    )
+    service._refresh_all_sources()
+
+    for name in names:
+        source = cache.get_source(name)
+        assert source.status == "active"
+        assert len(source.headlines) == 10
+
+
+def test_link_resolver_reads_a_replayed_interstitial_page(tmp_path):
+    redirect = "https://news.google.com/rss/articles/AU_yqLOpaqueToken?oc=5"
+    publisher = "https://www.reuters.com/markets/us/stocks-rally-2024-06-01/"
+    transport = HttpTransport("replay", tmp_path / "cassettes")
+    transport.cassette.record(
+        redirect,
+        f'<html><body><c-wiz data-n-au="{publisher}"></c-wiz></body></html>'.encode(),
+        headers={"Content-Type": "text/html; charset=utf-8"},
+    )
+    resolver = LinkResolver(LinkCache(), transport=transport)
+    try:
+        assert resolver.resolve(redirect) == publisher
+    finally:
+        resolver.close()
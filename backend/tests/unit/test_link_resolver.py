@@ -0,0 +1,165 @@
+import base64
+import threading
+import time
+from datetime import datetime, timezone
+
+from src.models.news_headline import NewsHeadline
+from src.services.link_resolver import LinkCache, LinkResolver, decode_google_news_url, normalize_url
+
+
+def _google_link(article_id):
+    return f"https://news.google.com/rss/articles/{article_id}?oc=5"
+
+
+def _encoded_id(url):
+    payload = b"\x08\x13\x22" + bytes([len(url)]) + url.encode() + b"\xd2\x01\x00"
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _headline(link):
+    return NewsHeadline(
+        title="Stocks rally as yields retreat - Reuters",
+        link=link,
+        published_at=datetime.now(timezone.utc),
+        source="Reuters",
+    )
+
+
+def test_normalize_url_strips_tracking_parameters():
+    url = "HTTPS://www.WSJ.com:443/articles/stocks-rally?mod=rss_markets&utm_source=x&page=2#comments"
+
+    assert normalize_url(url) == "https://www.wsj.com/articles/stocks-rally?page=2"
+
+
+def test_decodes_publisher_url_embedded_in_article_id():
+    publisher = "https://www.reuters.com/markets/us/stocks-rally-2024-06-01/"
+
+    assert decode_google_news_url(_google_link(_encoded_id(publisher))) == publisher
+    assert decode_google_news_url(_google_link("AU_yqLOpaqueToken")) is None
+
+
+def test_each_redirect_is_fetched_once_and_shared_by_concurrent_callers(tmp_path):
+    calls = []
+    release = threading.Event()
+
+    def fetch(redirect):
+        calls.append(redirect)
+        release.wait(2)
+        return "https://www.wsj.com/articles/a?mod=rss"
+
+    resolver = LinkResolver(LinkCache(tmp_path / "links.sqlite3"), max_concurrency=2, fetch=fetch)
+    redirect = _google_link("AU_yqLOpaque")
+    first, second = _headline(redirect), _headline(redirect)
+
+    threads = [threading.Thread(target=resolver.resolve_headlines, args=([h],)) for h in (first, second)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [redirect]
+    assert first.link == second.link == "https://www.wsj.com/articles/a"
+    resolver.close()
+
+    # A new process reads the resolution from disk instead of fetching again
+    reopened = LinkResolver(LinkCache(tmp_path / "links.sqlite3"), fetch=fetch)
+    assert reopened.resolve(redirect) == "https://www.wsj.com/articles/a"
+    assert calls == [redirect]
+    reopened.close()
+
+
+def test_failures_are_cached_until_the_negative_ttl_expires():
+    calls = []
+
+    def fetch(redirect):
+        calls.append(redirect)
+        raise ConnectionError("offline")
+
+    resolver = LinkResolver(LinkCache(negative_ttl_seconds=0.05), fetch=fetch)
+    headline = _headline(_google_link("AU_yqLOpaque"))
+
+    resolver.resolve_headlines([headline])
+    resolver.resolve_headlines([headline])
+    assert len(calls) == 1
+    assert headline.link.startswith("https://news.google.com/")
+
+    time.sleep(0.06)
+    resolver.resolve_headlines([headline])
+    assert len(calls) == 2
+    resolver.close()
+
+
+def test_slow_lookups_hold_their_headline_back_until_resolved():
+    release = threading.Event()
+
+    def fetch(redirect):
+        release.wait(2)
+        return "https://www.reuters.com/world/slow"
+
+    resolver = LinkResolver(budget_seconds=0.01, fetch=fetch)
+    headline = _headline(_google_link("AU_yqLSlow"))
+    direct = _headline("https://www.reuters.com/markets/direct")
+
+    settled = threading.Event()
+    # Never published under the redirect, so its identity never changes later
+    assert resolver.resolve_headlines([headline, direct], on_settled=settled.set) == ([direct], 0)
+    assert headline.link == _google_link("AU_yqLSlow") and not settled.is_set()
+    release.set()
+    assert settled.wait(2)
+    assert resolver.resolve(_google_link("AU_yqLSlow")) == "https://www.reuters.com/world/slow"
+    assert resolver.resolve_headlines([headline, direct]) == ([headline, direct], 1)
+    assert headline.link == "https://www.reuters.com/world/slow"
+    resolver.close()
+
+
+def test_refresh_archives_a_slowly_resolved_headline_once(tmp_path):
+    from src.archive import SQLiteHeadlineArchive
+    from src.cache import InMemoryNewsCache
+    from src.services.news_service import NewsService
+    from src.services.source_registry import SourceRegistry
+
+    catalog = tmp_path / "sources.yaml"
+    catalog.write_text(
+        "sources:\n  - name: Reuters\n    rss_url: https://news.google.com/rss/search?q=reuters\n"
+        "    fallback_url: https://www.reuters.com/markets/\n"
+    )
+    redirect = _google_link("AU_yqLSlowRefresh")
+    release = threading.Event()
+
+    class _StubRSS:
+        def fetch_rss_feed(self, source):
+            return [_headline(redirect)]
+
+    def fetch(link):
+        release.wait(2)
+        return "https://www.reuters.com/markets/slow-story"
+
+    archive = SQLiteHeadlineArchive(tmp_path / "archive.sqlite3")
+    resolver = LinkResolver(budget_seconds=0.01, fetch=fetch)
+    cache = InMemoryNewsCache()
+    service = NewsService(
+        cache=cache,
+        rss_service=_StubRSS(),
+        archive=archive,
+        source_registry=SourceRegistry(catalog),
+        link_resolver=resolver,
+    )
+    try:
+        service._refresh_all_sources()
+        assert cache.get_source("Reuters").headlines == []
+
+        # The source is fetched again as soon as the lookup finishes, not on the next cycle
+        release.set()
+        deadline = time.monotonic() + 2
+        while not archive.query() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [h.link for h in cache.get_source("Reuters").headlines] == ["https://www.reuters.com/markets/slow-story"]
+        service._refresh_all_sources()
+
+        assert [h.link for h in cache.get_source("Reuters").headlines] == ["https://www.reuters.com/markets/slow-story"]
+        assert [row["link"] for row in archive.query()] == ["https://www.reuters.com/markets/slow-story"]
+    finally:
+        resolver.close()
+        archive.close()
@@ -0,0 +1,95 @@
+import io
+import json
+import logging
+import sys
+
+import pytest
+
+from src.core.log_config import (
+    DeferredQueueHandler,
+    JsonFormatter,
+    RequestLogSampler,
+    configure_logging,
+    log_request,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_sampler_uses_longest_prefix_and_always_logs_server_errors():
+    sampler = RequestLogSampler.parse("/api=1, /api/news=0, *=0.5, /bogus=abc, junk")
+
+    assert sampler.rate_for("/api/news/stream") == 0.0
+    assert sampler.rate_for("/api/sources") == 1.0
+    assert sampler.rate_for("/health") == 0.5
+    assert not sampler.should_log("/api/news", 200)
+    assert sampler.should_log("/api/news", 503)
+    assert sampler.should_log("/api/sources", 404)
+
+
+def test_json_formatter_includes_extras_and_exceptions():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.ERROR, __file__, 1, "failed %s", ("job",), sys.exc_info(), extra={"source": "FT"}
+        )
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["msg"] == "failed job"
+    assert entry["level"] == "ERROR"
+    assert entry["source"] == "FT"
+    assert "ValueError: boom" in entry["exc"]
+
+
+def test_queued_access_log_is_written_by_listener(restore_root_logger):
+    stream = io.StringIO()
+    configure_logging("INFO", "json", stream=stream)
+    configure_logging("INFO", "json", stream=stream)
+
+    root = logging.getLogger()
+    assert sum(isinstance(handler, DeferredQueueHandler) for handler in root.handlers) == 1
+
+    log_request(logging.getLogger("src.access"), "GET", "/api/news", 200, 0.0)
+    logging.getLogger("src.access").debug("not written")
+    shutdown_logging()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["logger"] == "src.access"
+    assert (entry["method"], entry["path"], entry["status"]) == ("GET", "/api/news", 200)
+
+
+def test_text_format_string_is_respected(restore_root_logger):
+    stream = io.StringIO()
+    configure_logging("WARNING", "%(levelname)s|%(message)s", stream=stream)
+
+    logging.getLogger("src.test").warning("disk at %d%%", 91)
+    shutdown_logging()
+
+    assert stream.getvalue() == "WARNING|disk at 91%\n"
+
+
+def test_only_scalar_arguments_are_formatted_on_the_listener():
+    handler = DeferredQueueHandler(None)
+    deferred = logging.makeLogRecord({"msg": "%s took %.1fs", "args": ("CNBC", 1.5)})
+    assert handler.prepare(deferred).args == ("CNBC", 1.5)
+
+    sources = ["CNBC"]
+    record = logging.makeLogRecord({"msg": "refreshing %s", "args": (sources,)})
+    prepared = handler.prepare(record)
+    sources.append("Reuters")
+
+    assert prepared.args is None
+    assert prepared.getMessage() == "refreshing ['CNBC']"
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.cache import InMemoryNewsCache
+from src.cache.memory_budget import MemoryBudget, estimate_source_bytes
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+
+NOW = datetime.now(timezone.utc)
+
+
+def _source(name, minutes_ago):
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/rss",
+        fallback_url="https://example.com",
+        headlines=[
+            NewsHeadline(
+                title=f"{name} headline from {minutes} minutes ago",
+                link=f"https://example.com/{name}/{minutes}",
+                published_at=NOW - timedelta(minutes=minutes),
+                source=name,
+            )
+            for minutes in sorted(minutes_ago)
+        ],
+    )
+
+
+def _kept(sources):
+    return {name: len(source.headlines) for name, source in sources.items()}
+
+
+def test_oldest_policy_evicts_the_oldest_headlines_across_sources():
+    busy = _source("Busy", range(0, 20))
+    quiet = _source("Quiet", [100, 200, 300])
+    full = estimate_source_bytes(busy) + estimate_source_bytes(quiet)
+    budget = MemoryBudget(full - 1, policy="oldest")
+
+    trimmed, sizes = budget.enforce({"Busy": busy, "Quiet": quiet})
+
+    # The quiet source's oldest headline is the oldest overall
+    assert _kept(trimmed) == {"Busy": 20, "Quiet": 2}
+    assert sum(sizes.values()) <= budget.max_bytes
+    assert budget.evicted_headlines == 1
+    assert len(quiet.headlines) == 3
+
+
+def test_fair_policy_gives_small_sources_their_share():
+    busy = _source("Busy", range(0, 40))
+    quiet = _source("Quiet", [100, 200, 300])
+    budget = MemoryBudget(estimate_source_bytes(busy) // 2 + estimate_source_bytes(quiet), policy="fair")
+
+    trimmed, sizes = budget.enforce({"Busy": busy, "Quiet": quiet})
+
+    assert _kept(trimmed)["Quiet"] == 3
+    assert 0 < _kept(trimmed)["Busy"] < 40
+    # Kept headlines are the newest
+    assert trimmed["Busy"].headlines == busy.headlines[: _kept(trimmed)["Busy"]]
+    assert sum(sizes.values()) <= budget.max_bytes
+
+
+def test_cache_enforces_its_budget_and_accounts_per_source():
+    one = _source("One", range(0, 10))
+    budget = MemoryBudget(estimate_source_bytes(one) + 2 * 1024)
+    cache = InMemoryNewsCache(memory_budget=budget)
+
+    cache.update_source(one)
+    cache.update_source(_source("Two", range(5, 15)))
+    snapshot = cache.snapshot()
+
+    assert snapshot.memory_bytes <= budget.max_bytes
+    assert set(snapshot.source_bytes) == {"One", "Two"}
+    assert snapshot.source_bytes["One"] == estimate_source_bytes(snapshot.sources["One"])
+    assert budget.evicted_headlines > 0
+
+
+def _reachable_bytes(cache):
+    """Distinct sources held by any retained generation, measured from scratch"""
+    distinct = {}
+    for generation in range(cache.snapshot().generation + 1):
+        snapshot = cache.snapshot_at(generation)
+        if snapshot is not None:
+            for source in snapshot.sources.values():
+                distinct[id(source)] = estimate_source_bytes(source)
+    return sum(distinct.values())
+
+
+def test_retained_generations_count_against_the_budget():
+    budget = MemoryBudget(3 * estimate_source_bytes(_source("One", range(0, 10))))
+    cache = InMemoryNewsCache(retained_generations=32, memory_budget=budget)
+
+    # Every fetch publishes new objects, which older generations keep alive
+    for _ in range(20):
+        cache.update_source(_source("One", range(0, 10)))
+        cache.update_source(_source("Two", range(0, 10)))
+
+    assert cache.reachable_bytes == _reachable_bytes(cache)
+    assert cache.reachable_bytes <= budget.max_bytes
+    assert 1 < cache.retained_generations < 32
+    assert cache.snapshot_at(cache.snapshot().generation) is cache.snapshot()
+
+
+def test_without_a_budget_all_generations_are_retained():
+    cache = InMemoryNewsCache(retained_generations=8)
+    for _ in range(10):
+        cache.update_source(_source("One", range(0, 10)))
+
+    assert cache.retained_generations == 8
+    assert cache.reachable_bytes == _reachable_bytes(cache)
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        MemoryBudget(1024, policy="random")
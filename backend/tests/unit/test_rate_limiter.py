@@ -0,0 +1,40 @@
+from src.ratelimit import InMemoryRateLimiter
+from src.ratelimit import in_memory
+
+
+def test_bucket_allows_burst_then_reports_retry_after(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(in_memory.time, "monotonic", lambda: now[0])
+    limiter = InMemoryRateLimiter(rate_per_minute=6, burst=2)
+
+    assert limiter.acquire("client:a") == 0
+    assert limiter.acquire("client:a") == 0
+    assert limiter.acquire("client:a") == 10.0
+
+    # Buckets are independent per key
+    assert limiter.acquire("client:b") == 0
+
+    now[0] += 10
+    assert limiter.acquire("client:a") == 0
+
+
+def test_idle_buckets_are_evicted_beyond_max_keys():
+    limiter = InMemoryRateLimiter(rate_per_minute=1, burst=1, max_keys=2)
+    for key in ("a", "b", "c"):
+        limiter.acquire(key)
+
+    assert list(limiter._buckets) == ["b", "c"]
+
+
+def test_refund_returns_a_token_up_to_the_burst(monkeypatch):
+    monkeypatch.setattr(in_memory.time, "monotonic", lambda: 1000.0)
+    limiter = InMemoryRateLimiter(rate_per_minute=1, burst=1)
+
+    assert limiter.acquire("client:a") == 0
+    limiter.refund("client:a")
+    assert limiter.acquire("client:a") == 0
+    assert limiter.acquire("client:a") > 0
+
+    limiter.refund("client:a")
+    limiter.refund("client:a")
+    assert limiter._buckets["client:a"][0] == 1
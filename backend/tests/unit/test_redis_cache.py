@@ -0,0 +1,162 @@
+import threading
+from datetime import datetime, timezone
+
+from redis.exceptions import WatchError
+
+from src.cache.redis_cache import RedisNewsCache
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+
+
+class _StubRedis:
+    """Just enough of redis.Redis for the cache: GET/SET/INCR/DELETE and WATCH
+    pipelines, shared by every client built on the same ``data``"""
+
+    def __init__(self, data=None, versions=None, lock=None):
+        self.data = {} if data is None else data
+        self.versions = {} if versions is None else versions
+        self.lock = lock or threading.Lock()
+        # Called with the key after a watched read, before the transaction runs
+        self.after_watched_read = None
+
+    def client(self):
+        """Another connection to the same server"""
+        return _StubRedis(self.data, self.versions, self.lock)
+
+    def pipeline(self, transaction=True):
+        return _StubPipeline(self)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def apply(self, command, key, *args):
+        if command == "get":
+            return self.data.get(key)
+        self.versions[key] = self.versions.get(key, 0) + 1
+        if command == "set":
+            self.data[key] = args[0]
+        elif command == "incr":
+            self.data[key] = str(int(self.data.get(key) or 0) + 1)
+            return int(self.data[key])
+        elif command == "delete":
+            for name in (key, *args):
+                self.data.pop(name, None)
+        return True
+
+
+class _StubPipeline:
+    def __init__(self, redis):
+        self.redis, self.commands, self.watched, self.buffering = redis, [], None, True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def watch(self, *keys):
+        self.watched = {key: self.redis.versions.get(key, 0) for key in keys}
+        self.buffering = False
+
+    def multi(self):
+        self.buffering = True
+
+    def _command(self, command, key, *args):
+        if not self.buffering:
+            value = self.redis.apply(command, key, *args)
+            hook, self.redis.after_watched_read = self.redis.after_watched_read, None
+            if hook is not None:
+                hook(key)
+            return value
+        self.commands.append((command, key, args))
+        return self
+
+    def get(self, key):
+        return self._command("get", key)
+
+    def set(self, key, value):
+        return self._command("set", key, value)
+
+    def incr(self, key):
+        return self._command("incr", key)
+
+    def delete(self, *keys):
+        return self._command("delete", *keys)
+
+    def execute(self):
+        with self.redis.lock:
+            if self.watched and any(self.redis.versions.get(k, 0) != v for k, v in self.watched.items()):
+                raise WatchError("watched key changed")
+            return [self.redis.apply(command, key, *args) for command, key, args in self.commands]
+
+
+def _source(name):
+    return NewsSource(
+        name=name,
+        rss_url=f"https://example.com/{name}.rss",
+        fallback_url=f"https://example.com/{name}",
+        headlines=[
+            NewsHeadline(
+                title=f"{name} publishes a market headline",
+                link=f"https://example.com/{name}/1",
+                published_at=datetime.now(timezone.utc),
+                source=name,
+            )
+        ],
+    )
+
+
+def test_concurrent_updates_from_two_clients_keep_both_sources():
+    server = _StubRedis()
+    first = RedisNewsCache(url=None, client=server)
+    second = RedisNewsCache(url=None, client=server.client())
+    first.update_source(_source("Existing"))
+
+    # The second worker writes between the first one's read and its transaction
+    server.after_watched_read = lambda key: second.update_source(_source("Second"))
+    first.update_source(_source("First"))
+
+    assert set(first.get_all_sources()) == {"Existing", "First", "Second"}
+    assert first.snapshot().generation == 3
+
+
+def test_concurrent_removal_does_not_resurrect_or_drop_sources():
+    server = _StubRedis()
+    first = RedisNewsCache(url=None, client=server)
+    second = RedisNewsCache(url=None, client=server.client())
+    first.update_source(_source("Stale"))
+    first.update_source(_source("Kept"))
+
+    server.after_watched_read = lambda key: second.update_source(_source("Added"))
+    first.remove_source("Stale")
+
+    assert set(second.get_all_sources()) == {"Kept", "Added"}
+
+
+def test_updates_from_many_threads_all_land():
+    server = _StubRedis()
+    caches = [RedisNewsCache(url=None, client=server.client()) for _ in range(4)]
+    threads = [
+        threading.Thread(target=cache.update_source, args=(_source(f"Source{index}"),))
+        for index, cache in enumerate(caches)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(caches[0].get_all_sources()) == 4
+
+
+def test_snapshot_is_decoded_again_only_after_a_write():
+    server = _StubRedis()
+    reader = RedisNewsCache(url=None, client=server)
+    writer = RedisNewsCache(url=None, client=server.client())
+    writer.update_source(_source("First"))
+
+    first = reader.snapshot()
+    assert reader.snapshot() is first
+
+    writer.update_source(_source("Second"))
+    second = reader.snapshot()
+    assert second is not first and set(second.sources) == {"First", "Second"}
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.scheduler import RefreshScheduler
+
+
+def _recording_refresh(duration, starts):
+    def _refresh():
+        starts.append(time.monotonic())
+        time.sleep(duration)
+
+    return _refresh
+
+
+async def test_ticks_are_fixed_rate_not_interval_after_completion():
+    starts = []
+    scheduler = RefreshScheduler(
+        _recording_refresh(0.03, starts), interval_seconds=0.1, initial_delay_seconds=0
+    )
+    scheduler.start()
+    await asyncio.sleep(0.35)
+    await scheduler.stop()
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(gaps) >= 2
+    # Sleeping `interval` after each refresh would space starts 0.13s apart
+    assert all(abs(gap - 0.1) < 0.025 for gap in gaps)
+    assert [record.tick for record in scheduler.ticks] == list(range(len(scheduler.ticks)))
+
+
+async def test_skip_policy_drops_ticks_overrun_by_a_slow_refresh():
+    starts = []
+    scheduler = RefreshScheduler(
+        _recording_refresh(0.12, starts), interval_seconds=0.05, initial_delay_seconds=0
+    )
+    scheduler.start()
+    await asyncio.sleep(0.3)
+    await scheduler.stop()
+
+    assert scheduler.missed_ticks >= 2
+    assert scheduler.ticks[0].skipped == 2
+    assert scheduler.ticks[1].tick == 3
+
+
+async def test_catch_up_policy_runs_missed_ticks_back_to_back():
+    starts = []
+    scheduler = RefreshScheduler(
+        _recording_refresh(0.12, starts),
+        interval_seconds=0.05,
+        initial_delay_seconds=0,
+        missed_tick_policy="catch_up",
+    )
+    scheduler.start()
+    await asyncio.sleep(0.3)
+    await scheduler.stop()
+
+    assert scheduler.missed_ticks == 0
+    assert [record.tick for record in scheduler.ticks] == list(range(len(scheduler.ticks)))
+    assert scheduler.ticks[1].lag > 0.05
+
+
+async def test_stop_cancels_and_waits_for_in_flight_refresh():
+    cancelled = threading.Event()
+    finished = threading.Event()
+
+    def _refresh():
+        cancelled.wait(2)
+        finished.set()
+
+    scheduler = RefreshScheduler(
+        _refresh, interval_seconds=10, initial_delay_seconds=0, cancel_fn=cancelled.set
+    )
+    scheduler.start()
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert cancelled.is_set()
+    assert finished.is_set()
+    assert not scheduler.running
+
+
+def test_rejects_unknown_missed_tick_policy():
+    with pytest.raises(ValueError):
+        RefreshScheduler(lambda: None, interval_seconds=1, missed_tick_policy="burst")
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+
+import yaml
+
+from src.models.news_headline import NewsHeadline
+from src.models.source_config import SourceConfig
+from src.services.news_service import NewsService
+from src.services.source_registry import SourceRegistry
+
+
+def _write_catalog(path, sources):
+    path.write_text(yaml.safe_dump({"sources": sources}))
+
+
+def _source(name, **overrides):
+    return {
+        "name": name,
+        "rss_url": f"https://example.com/{name.lower()}.rss",
+        "fallback_url": f"https://example.com/{name.lower()}",
+        "max_stories": 10,
+        **overrides,
+    }
+
+
+def test_falls_back_to_builtin_sources_without_a_file(tmp_path):
+    registry = SourceRegistry(tmp_path / "missing.yaml")
+
+    assert len(registry.all_sources()) == len(SourceConfig.SOURCES)
+    assert registry.get("CNBC").name == "CNBC"
+    assert registry.get("Unknown") is None
+
+
+def test_reload_reports_added_removed_and_changed_sources(tmp_path):
+    path = tmp_path / "sources.yaml"
+    _write_catalog(path, [_source("Alpha"), _source("Beta"), _source("Gamma")])
+    registry = SourceRegistry(path)
+    diffs = []
+    registry.subscribe(diffs.append)
+
+    _write_catalog(path, [_source("Alpha"), _source("Beta", max_stories=20), _source("Delta")])
+    diff = registry.reload()
+
+    assert [s.name for s in diff.added] == ["Delta"]
+    assert list(diff.removed) == ["Gamma"]
+    assert [s.name for s in diff.changed] == ["Beta"]
+    assert diffs == [diff]
+    assert registry.snapshot.version == 2
+    assert registry.get("Beta").max_stories == 20
+
+    # Unchanged file is a no-op
+    assert not registry.reload()
+
+
+def test_invalid_catalog_keeps_previous_snapshot(tmp_path):
+    path = tmp_path / "sources.yaml"
+    _write_catalog(path, [_source("Alpha")])
+    registry = SourceRegistry(path)
+
+    _write_catalog(path, [_source("Alpha"), _source("Alpha", enabled=False)])
+
+    assert not registry.reload()
+    assert [s.name for s in registry.enabled_sources()] == ["Alpha"]
+
+
+def test_news_service_applies_catalog_changes_incrementally(tmp_path):
+    path = tmp_path / "sources.yaml"
+    _write_catalog(path, [_source("Alpha"), _source("Beta")])
+    registry = SourceRegistry(path)
+    service = NewsService(source_registry=registry)
+    fetched = []
+
+    def _fake_fetch(source):
+        fetched.append(source.name)
+        return [
+            NewsHeadline(
+                title=f"{source.name} sample headline",
+                link="https://example.com/article",
+                published_at=datetime.now(timezone.utc),
+                source=source.name,
+            )
+        ]
+
+    service.rss_service.fetch_rss_feed = _fake_fetch
+    registry.subscribe(service.apply_source_changes)
+    service.refresh_news()
+    fetched.clear()
+
+    _write_catalog(path, [_source("Alpha"), _source("Gamma")])
+    registry.reload()
+
+    assert fetched == ["Gamma"]
+    assert set(service.cache.get_all_sources()) == {"Alpha", "Gamma"}
+    # Fetch state lives on cache copies, never on the registry's snapshot models
+    assert registry.get("Gamma").headlines == []
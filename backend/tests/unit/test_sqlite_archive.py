@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.archive import SQLiteHeadlineArchive
+from src.models.news_headline import NewsHeadline
+
+
+def _headline(title, source="CNBC", hours_ago=0, link=None):
+    return NewsHeadline(
+        title=title,
+        link=link or f"https://example.com/{abs(hash(title))}",
+        published_at=datetime.now(timezone.utc) - timedelta(hours=hours_ago),
+        source=source,
+    )
+
+
+@pytest.fixture
+def archive(tmp_path):
+    store = SQLiteHeadlineArchive(tmp_path / "archive.sqlite3")
+    yield store
+    store.close()
+
+
+def test_append_ignores_already_archived_headlines(archive):
+    batch = [_headline("Stocks rally on rate cut hopes"), _headline("Oil slides as supply rises")]
+
+    assert archive.append(batch) == 2
+    assert archive.append(batch + [_headline("Bond yields hit new high")]) == 1
+    assert archive.count() == 3
+
+
+def test_append_counts_only_its_own_inserts_with_another_writer(archive, tmp_path):
+    other = SQLiteHeadlineArchive(tmp_path / "archive.sqlite3")
+    try:
+        assert archive.append([_headline("Stocks rally on rate cut hopes")]) == 1
+        other.append([_headline(f"Another process archived story {index}") for index in range(5)])
+        assert archive.append([_headline("Oil slides as supply rises")]) == 1
+    finally:
+        other.close()
+    assert archive.count() == 7
+
+
+def test_query_filters_by_source_and_time_range(archive):
+    archive.append([
+        _headline("Stocks rally on rate cut hopes", hours_ago=1),
+        _headline("Oil slides as supply rises", hours_ago=30),
+        _headline("Yen weakens against the dollar", source="Bloomberg", hours_ago=2),
+    ])
+
+    since = datetime.now(timezone.utc) - timedelta(hours=12)
+    results = archive.query(source="CNBC", since=since)
+
+    assert [row["title"] for row in results] == ["Stocks rally on rate cut hopes"]
+    assert results[0]["published_at"].endswith("Z")
+
+
+def test_search_matches_title_keywords_newest_first(archive):
+    archive.append([
+        _headline("Fed holds rates steady again", hours_ago=5),
+        _headline("Fed signals cut in December", hours_ago=1),
+        _headline("Oil slides as supply rises", hours_ago=2),
+    ])
+
+    results = archive.search("fed")
+
+    assert [row["title"] for row in results] == [
+        "Fed signals cut in December",
+        "Fed holds rates steady again",
+    ]
+    assert archive.search('"unbalanced quote') == []
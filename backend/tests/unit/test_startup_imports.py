@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from src.core.startup_profile import parse_importtime
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+DEFERRED = ("feedparser", "bs4", "requests", "urllib3", "redis", "lxml")
+
+
+def test_importing_app_defers_fetch_and_redis_dependencies():
+    code = (
+        "import json, sys\n"
+        "import src.main\n"
+        f"print(json.dumps([name for name in {DEFERRED!r} if name in sys.modules]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+def test_parse_importtime_reads_self_and_cumulative_microseconds():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   yaml.error\n"
+        "import time:      2500 |       4000 | src.main\n"
+        "INFO:src.main:unrelated log line\n"
+    )
+    assert parse_importtime(stderr) == [
+        {"module": "yaml.error", "self_seconds": 0.00012, "cumulative_seconds": 0.00012},
+        {"module": "src.main", "self_seconds": 0.0025, "cumulative_seconds": 0.004},
+    ]
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+from src.services.stats_service import StatsService
+
+HOUR = 3600
+# Start of an hour, so bucket boundaries are easy to reason about
+NOW = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _source(name, published_hours_ago, fetched=NOW, fetch_number=0):
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/rss",
+        fallback_url="https://example.com",
+        last_updated=fetched + timedelta(seconds=fetch_number),
+        headlines=[
+            NewsHeadline(
+                title=f"{name} headline {hours} hours ago",
+                link=f"https://example.com/{name}/{hours}",
+                published_at=NOW - timedelta(hours=hours),
+                fetched_at=fetched,
+                source=name,
+            )
+            for hours in published_hours_ago
+        ],
+    )
+
+
+def test_new_headlines_are_counted_once_in_their_publication_hour():
+    stats = StatsService(bucket_seconds=300, retention_seconds=6 * HOUR)
+    stats.record_fetch(_source("CNBC", [0, 1]), succeeded=True, at=NOW.timestamp())
+    # A later fetch repeats two headlines and adds one
+    stats.record_fetch(_source("CNBC", [0, 1, 2], fetch_number=1), succeeded=True, at=NOW.timestamp())
+    stats.record_fetch(_source("CNBC", []), succeeded=False, at=NOW.timestamp())
+
+    result = stats.query(HOUR, 4 * HOUR, now=NOW.timestamp() + 60)
+    cnbc = result["sources"]["CNBC"]
+
+    assert result["buckets"][-1] == NOW.isoformat().replace("+00:00", "Z")
+    assert cnbc["headlines"] == [0, 1, 1, 1]
+    assert cnbc["fetches"] == [0, 0, 0, 3]
+    assert cnbc["success_rate"] == [None, None, None, round(2 / 3, 3)]
+    # Latency is counted when fetched: 0h, 1h and 2h old headlines
+    assert cnbc["latency_avg_seconds"][-1] == HOUR
+    assert cnbc["latency_max_seconds"][-1] == 2 * HOUR
+
+
+def test_ring_forgets_buckets_older_than_its_retention():
+    stats = StatsService(bucket_seconds=HOUR, retention_seconds=3 * HOUR)
+    start = NOW.timestamp()
+    for hour in range(5):
+        stats.record_cycle(2.0, at=start + hour * HOUR)
+
+    result = stats.query(HOUR, 3 * HOUR, now=start + 4 * HOUR)
+
+    assert result["cycles"]["count"] == [1, 1, 1]
+    assert result["cycles"]["avg_seconds"] == [2.0, 2.0, 2.0]
+    # Slots reused by later hours do not report the earlier ones
+    assert stats.query(HOUR, 3 * HOUR, now=start + 6 * HOUR)["cycles"]["count"] == [1, 0, 0]
+
+
+@pytest.mark.parametrize("bucket, range_seconds", [(450, HOUR), (HOUR, 90 * 60), (HOUR, 7 * HOUR)])
+def test_queries_must_fit_the_base_buckets_and_retention(bucket, range_seconds):
+    stats = StatsService(bucket_seconds=300, retention_seconds=6 * HOUR)
+    with pytest.raises(ValueError):
+        stats.query(bucket, range_seconds)
+
+
+def test_future_dated_headlines_count_when_fetched_and_keep_current_buckets():
+    stats = StatsService(bucket_seconds=HOUR, retention_seconds=3 * HOUR)
+    # Dated a full retention ahead: unclamped it would take the slot current writes need
+    stats.record_fetch(_source("CNBC", [-3]), succeeded=True, at=NOW.timestamp())
+    stats.record_fetch(_source("CNBC", [0, -3], fetch_number=1), succeeded=True, at=NOW.timestamp())
+
+    cnbc = stats.query(HOUR, 3 * HOUR, now=NOW.timestamp() + 60)["sources"]["CNBC"]
+
+    assert cnbc["headlines"] == [0, 0, 2]
+    assert cnbc["latency_max_seconds"][-1] == 0
+
+
+def test_sync_counts_fetches_made_by_another_process():
+    stats = StatsService(bucket_seconds=300, retention_seconds=6 * HOUR)
+    fetched = _source("CNBC", [0])
+    fetched.last_fetched = NOW
+    failed = _source("Reuters", [])
+    failed.last_fetched, failed.status = NOW, "error"
+
+    stats.sync({"CNBC": fetched, "Reuters": failed})
+    stats.sync({"CNBC": fetched, "Reuters": failed})
+
+    result = stats.query(HOUR, HOUR, now=NOW.timestamp() + 60)["sources"]
+    assert result["CNBC"]["fetches"] == [1] and result["CNBC"]["success_rate"] == [1.0]
+    assert result["Reuters"]["fetches"] == [1] and result["Reuters"]["success_rate"] == [0.0]
+    assert result["CNBC"]["headlines"] == [1]
+
+
+def test_stats_queries_scan_the_cache_only_after_it_changes(monkeypatch):
+    from src.cache import InMemoryNewsCache
+    from src.services.news_service import NewsService
+
+    cache = InMemoryNewsCache()
+    cache.update_source(_source("CNBC", [0]))
+    service = NewsService(cache=cache)
+    scans = []
+    original = StatsService.sync
+    monkeypatch.setattr(StatsService, "sync", lambda self, sources: scans.append(1) or original(self, sources))
+
+    service.stats()
+    service.stats()
+    assert len(scans) == 1
+
+    cache.update_source(_source("CNBC", [0, 1], fetch_number=1))
+    service.stats()
+    assert len(scans) == 2
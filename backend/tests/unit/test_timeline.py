@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.cache import InMemoryNewsCache
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+from src.services.timeline import TimelineCursor, merge_page
+
+BASE = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=1)
+
+
+def _source(name, minutes):
+    """A source whose headlines were published ``minutes`` after BASE, newest first"""
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/rss",
+        fallback_url="https://example.com",
+        status="active",
+        headlines=[
+            NewsHeadline(
+                title=f"{name} minute {minute}",
+                link=f"https://example.com/{name}/{minute}",
+                published_at=BASE + timedelta(minutes=minute),
+                source=name,
+            )
+            for minute in sorted(minutes, reverse=True)
+        ],
+    )
+
+
+def _pages(cache, limit, **kwargs):
+    titles, cursor = [], None
+    while True:
+        snapshot = (cache.snapshot_at(cursor.generation) if cursor else None) or cache.snapshot()
+        page = merge_page(snapshot, limit, cursor, **kwargs)
+        titles.append([h.title for h in page.headlines])
+        if page.next_cursor is None:
+            return titles
+        cursor = TimelineCursor.decode(page.next_cursor)
+
+
+def test_merge_orders_across_sources_with_ties_by_name():
+    cache = InMemoryNewsCache()
+    cache.update_source(_source("Beta", [5, 3, 1]))
+    cache.update_source(_source("Alpha", [4, 3, 0]))
+
+    pages = _pages(cache, 2)
+
+    assert pages == [
+        ["Beta minute 5", "Alpha minute 4"],
+        ["Alpha minute 3", "Beta minute 3"],
+        ["Beta minute 1", "Alpha minute 0"],
+    ]
+    since = BASE + timedelta(minutes=3)
+    assert _pages(cache, 10, sources=["Beta"], since=since) == [["Beta minute 5", "Beta minute 3"]]
+
+
+def test_cursor_pages_the_generation_it_was_issued_in():
+    cache = InMemoryNewsCache()
+    cache.update_source(_source("Alpha", [10, 8, 6]))
+    cache.update_source(_source("Beta", [9, 7]))
+    first = merge_page(cache.snapshot(), 2)
+
+    # A refresh publishes a newer headline between pages
+    cache.update_source(_source("Alpha", [11, 10, 8, 6]))
+    cursor = TimelineCursor.decode(first.next_cursor)
+    second = merge_page(cache.snapshot_at(cursor.generation), 2, cursor)
+
+    assert [h.title for h in first.headlines] == ["Alpha minute 10", "Beta minute 9"]
+    assert [h.title for h in second.headlines] == ["Alpha minute 8", "Beta minute 7"]
+    assert second.generation == first.generation
+
+
+def test_evicted_generation_resumes_after_the_last_headline():
+    cache = InMemoryNewsCache(retained_generations=1)
+    cache.update_source(_source("Alpha", [10, 8, 6]))
+    cache.update_source(_source("Beta", [9, 7]))
+    first = merge_page(cache.snapshot(), 2)
+
+    cache.update_source(_source("Alpha", [11, 10, 8, 6]))
+    cursor = TimelineCursor.decode(first.next_cursor)
+    assert cache.snapshot_at(cursor.generation) is None
+    second = merge_page(cache.snapshot(), 10, cursor)
+
+    assert [h.title for h in second.headlines] == ["Alpha minute 8", "Beta minute 7", "Alpha minute 6"]
+    assert second.next_cursor is None
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "e30", TimelineCursor(1, {"Alpha": 2}).encode()[:-4]])
+def test_malformed_cursors_are_rejected(token):
+    with pytest.raises(ValueError):
+        TimelineCursor.decode(token)
@@ -0,0 +1,88 @@
+import pytest
+
+from src.tracing import NOOP_SPAN, Tracer, server_timing_header
+from src.tracing.otlp import encode_spans
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(list(spans))
+
+    def shutdown(self):
+        pass
+
+
+def test_unsampled_trace_and_its_children_are_noops():
+    tracer = Tracer(sample_rate=0.0, exporter=RecordingExporter())
+
+    with tracer.start_trace("request") as root:
+        assert root is NOOP_SPAN
+        assert tracer.span("phase") is NOOP_SPAN
+
+    assert tracer.span("outside any trace") is NOOP_SPAN
+    assert tracer.exporter.traces == []
+
+
+def test_forced_trace_records_phases_without_exporting():
+    tracer = Tracer(sample_rate=0.0, exporter=RecordingExporter())
+
+    with tracer.start_trace("request", force=True) as root:
+        for _ in range(2):
+            with tracer.span("cache.read"):
+                pass
+        with tracer.span("serialize"):
+            pass
+
+    header = server_timing_header(root)
+    names = [metric.split(";")[0] for metric in header.split(", ")]
+    assert names == ["cache.read", "serialize", "total"]
+    assert tracer.exporter.traces == []
+
+
+def test_sampled_trace_is_exported_once_with_parent_links():
+    tracer = Tracer(sample_rate=1.0, exporter=RecordingExporter())
+
+    with tracer.start_trace("refresh.source", source="CNBC") as root:
+        with tracer.span("parse") as parse:
+            with tracer.span("validate"):
+                pass
+
+    [spans] = tracer.exporter.traces
+    by_name = {span.name: span for span in spans}
+    assert set(by_name) == {"refresh.source", "parse", "validate"}
+    assert by_name["parse"].parent_id == root.span_id
+    assert by_name["validate"].parent_id == parse.span_id
+    assert {span.trace.trace_id for span in spans} == {root.trace.trace_id}
+
+
+def test_span_records_exception_and_restores_parent():
+    tracer = Tracer(sample_rate=1.0, exporter=RecordingExporter())
+
+    with tracer.start_trace("refresh.source") as root:
+        with pytest.raises(ValueError):
+            with tracer.span("http.connect"):
+                raise ValueError("refused")
+        assert tracer.current_span() is root
+
+    failed = next(span for span in tracer.exporter.traces[0] if span.name == "http.connect")
+    assert failed.error == "ValueError: refused"
+
+
+def test_otlp_encoding_uses_hex_ids_and_typed_attributes():
+    tracer = Tracer(sample_rate=1.0, exporter=RecordingExporter())
+    with tracer.start_trace("GET /api/news", **{"http.method": "GET", "http.status_code": 200}) as root:
+        with tracer.span("serialize"):
+            pass
+
+    body = encode_spans(tracer.exporter.traces[0], "news-aggregator")
+
+    spans = body["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child, parent = spans
+    assert parent["traceId"] == f"{root.trace.trace_id:032x}" and len(parent["traceId"]) == 32
+    assert child["parentSpanId"] == parent["spanId"]
+    assert "parentSpanId" not in parent
+    assert {"key": "http.status_code", "value": {"intValue": "200"}} in parent["attributes"]
+    assert int(parent["endTimeUnixNano"]) >= int(parent["startTimeUnixNano"])
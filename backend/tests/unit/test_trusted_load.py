@@ -0,0 +1,59 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from src.cache.redis_cache import dump_sources, load_sources
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+
+
+def _source(name="Example", published_at=None):
+    published_at = published_at or datetime.now(timezone.utc)
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/feed.xml",
+        fallback_url="https://example.com",
+        last_updated=published_at,
+        headlines=[
+            NewsHeadline(
+                title="Markets rally on rate cut hopes",
+                link="https://example.com/a",
+                published_at=published_at,
+                source=name,
+                cluster_id="00000000000000ff",
+            )
+        ],
+    )
+
+
+def test_round_trip_matches_validated_models():
+    sources = {"Example": _source()}
+    loaded = load_sources(dump_sources(sources))
+
+    assert loaded == sources
+    headline = loaded["Example"].headlines[0]
+    assert isinstance(headline, NewsHeadline)
+    assert headline.published_at.tzinfo is not None
+    assert loaded["Example"].model_dump(mode="json") == sources["Example"].model_dump(mode="json")
+
+
+def test_cached_headlines_past_ingest_window_still_load():
+    source = _source()
+    payload = json.loads(dump_sources({"Example": source}))
+    payload["Example"]["headlines"][0]["published_at"] = (
+        datetime.now(timezone.utc) - timedelta(days=45)
+    ).isoformat()
+
+    loaded = load_sources(json.dumps(payload))
+
+    assert len(loaded["Example"].headlines) == 1
+
+
+def test_payload_missing_newer_fields_gets_defaults():
+    payload = json.loads(dump_sources({"Example": _source()}))
+    del payload["Example"]["priority"]
+    del payload["Example"]["headlines"][0]["cluster_id"]
+
+    loaded = load_sources(json.dumps(payload))["Example"]
+
+    assert loaded.priority == 0
+    assert loaded.headlines[0].cluster_id is None
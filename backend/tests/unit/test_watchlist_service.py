@@ -0,0 +1,152 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.news_headline import NewsHeadline
+from src.models.news_source import NewsSource
+from src.models.watchlist import Watchlist
+from src.services import watchlist_service
+from src.services.watchlist_service import WatchlistService
+
+NOW = datetime.now(timezone.utc)
+
+
+def _source(name, titles, fetched=0):
+    """``titles`` newest first; each call is a later fetch of the source"""
+    return NewsSource(
+        name=name,
+        rss_url="https://example.com/rss",
+        fallback_url="https://example.com",
+        last_updated=NOW + timedelta(minutes=fetched),
+        headlines=[
+            NewsHeadline(
+                title=title,
+                link=f"https://example.com/{name}/{title.replace(' ', '-')}",
+                published_at=NOW + timedelta(minutes=fetched - position),
+                source=name,
+                tickers=["NVDA"] if "Nvidia" in title else [],
+            )
+            for position, title in enumerate(titles)
+        ],
+    )
+
+
+def _titles(service, watchlist_id):
+    return [headline.title for headline in service.results(watchlist_id)[1]]
+
+
+def test_watchlists_match_keywords_tickers_and_sources():
+    service = WatchlistService()
+    service.save(Watchlist(id="rates", name="Rates", keywords=["rate cut", "Treasury"]), {})
+    service.save(Watchlist(id="chips", name="Chips", tickers=["NVDA", "AMD"], sources=["CNBC"]), {})
+    service.save(Watchlist(id="ft", name="FT", sources=["FT"]), {})
+
+    service.ingest_source(_source("CNBC", ["Fed signals a Rate Cut in June", "Nvidia shares jump after earnings", "AMD unveils a new accelerator"]))
+    service.ingest_source(_source("FT", ["Treasury yields fall on weak jobs data", "Nvidia supplier warns on demand"]))
+
+    assert _titles(service, "rates") == ["Fed signals a Rate Cut in June", "Treasury yields fall on weak jobs data"]
+    # Tagged ticker or bare symbol, but only from CNBC
+    assert _titles(service, "chips") == ["Nvidia shares jump after earnings", "AMD unveils a new accelerator"]
+    assert len(_titles(service, "ft")) == 2
+
+
+def test_only_new_headlines_are_matched(monkeypatch):
+    service = WatchlistService()
+    service.save(Watchlist(id="fed", name="Fed", keywords=["Fed"], max_results=2), {})
+    service.ingest_source(_source("CNBC", ["Fed holds rates steady again", "Stocks drift ahead of Fed"]))
+
+    calls = []
+    original = watchlist_service._Matcher.match
+    monkeypatch.setattr(watchlist_service._Matcher, "match", lambda self, *args: calls.append(args) or original(self, *args))
+    later = _source("CNBC", ["Fed minutes show split views", "Fed holds rates steady again", "Stocks drift ahead of Fed"], fetched=1)
+    service.ingest_source(later)
+
+    assert len(calls) == 1
+    assert _titles(service, "fed") == ["Fed minutes show split views", "Fed holds rates steady again"]
+
+
+def test_saved_watchlists_are_backfilled_and_persisted(tmp_path):
+    path = tmp_path / "watchlists.json"
+    cached = {"CNBC": _source("CNBC", ["Oil climbs as OPEC trims output", "Stocks drift ahead of the Fed"])}
+    service = WatchlistService(path)
+    service.save(Watchlist(id="oil", name="Oil", keywords=["opec"]), cached)
+
+    assert _titles(service, "oil") == ["Oil climbs as OPEC trims output"]
+    reloaded = WatchlistService(path)
+    assert reloaded.get("oil").keywords == ["opec"]
+    reloaded.sync(cached)
+    assert _titles(reloaded, "oil") == ["Oil climbs as OPEC trims output"]
+
+    assert service.delete("oil", cached) and not service.delete("oil", cached)
+    with pytest.raises(ValueError):
+        service.results("oil")
+
+
+def test_watchlist_needs_a_filter():
+    with pytest.raises(ValidationError):
+        Watchlist(name="Empty")
+
+
+def test_watchlists_saved_by_another_process_are_picked_up(tmp_path):
+    path = tmp_path / "watchlists.json"
+    cached = {"CNBC": _source("CNBC", ["Oil climbs as OPEC trims output"])}
+    first, second = WatchlistService(path), WatchlistService(path)
+
+    first.save(Watchlist(id="oil", name="Oil", keywords=["oil"]), cached)
+    second.sync(cached)
+
+    assert _titles(second, "oil") == ["Oil climbs as OPEC trims output"]
+    second.save(Watchlist(id="opec", name="OPEC", keywords=["OPEC"]), cached)
+    assert {watchlist.id for watchlist in WatchlistService(path).all()} == {"oil", "opec"}
+
+
+def test_delete_keeps_results_of_watchlists_saved_by_another_process(tmp_path):
+    path = tmp_path / "watchlists.json"
+    cached = {"CNBC": _source("CNBC", ["Oil climbs as OPEC trims output"])}
+    first, second = WatchlistService(path), WatchlistService(path)
+    first.save(Watchlist(id="oil", name="Oil", keywords=["oil"]), cached)
+    second.save(Watchlist(id="opec", name="OPEC", keywords=["OPEC"]), cached)
+
+    assert first.delete("oil", cached)
+
+    assert _titles(first, "opec") == ["Oil climbs as OPEC trims output"]
+    assert [watchlist.id for watchlist in WatchlistService(path).all()] == ["opec"]
+
+
+def test_creating_past_the_limit_is_rejected(tmp_path):
+    service = WatchlistService(tmp_path / "watchlists.json", max_watchlists=1)
+    service.save(Watchlist(id="oil", name="Oil", keywords=["oil"]), {})
+
+    with pytest.raises(ValueError):
+        service.save(Watchlist(id="opec", name="OPEC", keywords=["OPEC"]), {})
+    # Replacing an existing watchlist is still allowed
+    service.save(Watchlist(id="oil", name="Oil", keywords=["crude"]), {})
+    assert [watchlist.keywords for watchlist in service.all()] == [["crude"]]
+
+
+def test_polling_scans_cached_sources_only_after_the_cache_changes(tmp_path, monkeypatch):
+    from src.cache import InMemoryNewsCache
+    from src.services.news_service import NewsService
+
+    path = tmp_path / "watchlists.json"
+    cache = InMemoryNewsCache()
+    cache.update_source(_source("CNBC", ["Oil climbs as OPEC trims output"]))
+    service = NewsService(cache=cache, watchlist_service=WatchlistService(path))
+    service.save_watchlist(Watchlist(id="oil", name="Oil", keywords=["oil"]))
+    scans = []
+    original = WatchlistService.sync
+    monkeypatch.setattr(WatchlistService, "sync", lambda self, sources: scans.append(1) or original(self, sources))
+
+    service.watchlist_results("oil")
+    service.watchlist_results("oil")
+    assert len(scans) == 1
+
+    # Definitions saved by another process still show up between cache writes
+    WatchlistService(path).save(Watchlist(id="opec", name="OPEC", keywords=["OPEC"]), {})
+    assert service.watchlist_results("opec")["count"] == 1
+    assert len(scans) == 1
+
+    cache.update_source(_source("CNBC", ["Oil slides as stockpiles build"], fetched=1))
+    assert service.watchlist_results("oil")["count"] == 2
+    assert len(scans) == 2